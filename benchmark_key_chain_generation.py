@@ -1,10 +1,16 @@
 from typing import Tuple, Union
-from hashlib import sha256, sha512, sha3_256, sha3_512, shake_128, shake_256
+from hashlib import sha256, sha512, sha3_256, sha3_512, shake_128, shake_256, blake2s, blake2b
+import os
 import time
-from ascon._ascon import ascon_hash as ascon_xof
+from timeit import timeit
+from cryptographicprimitives.ascon_operations import ascon_xof
 from keychains.prg_keychain import PrgKeyChain
-from keychains.xdrbg_keychain import ShakeXdrbgKeychain, AsconXdrbgKeychain
+from keychains.xdrbg_keychain import ShakeXdrbgKeychain, TurboShakeXdrbgKeychain, AsconXdrbgKeychain
 from keychains.hkdf_keychain import HkdfKeyChain
+from cryptographicprimitives.hkdf_operations import Hkdf, HKDF_BACKENDS, select_fastest_hkdf_backend
+from cryptographicprimitives.xdrbg_operations import ShakeBasedXdrbg
+from cryptographicprimitives.utils import encode_function
+from cryptographicprimitives.prg_operations import PRG_AES_BACKENDS, SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20, select_fastest_prg_aes_backend
 from keychains.utils import generate_random_input_parameter_for_prg, generate_random_input_parameter_for_hkdf, generate_random_input_parameter_for_xdrbg, \
     get_standard_deviation_of_execution_times, get_confidence_intervals_of_execution_times, total_time_taken_for_generating_random_input_parameter_for_hkdf, \
     total_time_taken_for_generating_random_input_parameter_for_prg, total_time_taken_for_generating_random_input_parameter_for_xdrbg
@@ -12,9 +18,11 @@ from keychains.utils import generate_random_input_parameter_for_prg, generate_ra
 NUMBER_OF_KEY_CHAINS: int = 100
 NUMBER_OF_KEYS_IN_A_KEY_CHAIN: int = 100
 CONFIDENCE_LEVEL: float = 0.95
+NUMBER_OF_HKDF_DERIVATIONS: int = 100000
+NUMBER_OF_XOF_INVOCATIONS: int = 100000
 
 
-def calculate_execution_times_of_generating_key_chains(key_chain_obj: Union[PrgKeyChain, ShakeXdrbgKeychain, AsconXdrbgKeychain, HkdfKeyChain],
+def calculate_execution_times_of_generating_key_chains(key_chain_obj: Union[PrgKeyChain, ShakeXdrbgKeychain, TurboShakeXdrbgKeychain, AsconXdrbgKeychain, HkdfKeyChain],
                                                        initial_state_to_start_the_key_chain: bytes, *args) -> list[float]:
 
     individual_execution_time_of_generating_each_key_chain: list[float] = []
@@ -30,7 +38,7 @@ def calculate_execution_times_of_generating_key_chains(key_chain_obj: Union[PrgK
                     security_parameter_lambda)
                 current_state_of_the_key_chain, random_output = key_chain_obj.key_chain_update(
                     arbitrary_input_parameter, current_state_of_the_key_chain)
-            elif isinstance(key_chain_obj, ShakeXdrbgKeychain) or isinstance(key_chain_obj, AsconXdrbgKeychain):
+            elif isinstance(key_chain_obj, (ShakeXdrbgKeychain, TurboShakeXdrbgKeychain, AsconXdrbgKeychain)):
                 xof_name: str = args[0]
                 arbitrary_input_parameter = generate_random_input_parameter_for_xdrbg(
                     xof_name)
@@ -75,9 +83,15 @@ def get_average_execution_time_and_standard_deviation_and_confidence_intervals(i
     return (average_execution_time_rounded_off, standard_deviation_of_execution_times_rounded_off, confidence_intervals_rounded_off)
 
 
-def benchmark_for_prg_keychain(store_persistently: bool, security_parameter_lambda: int) -> None:
+def benchmark_for_prg_keychain(store_persistently: bool, security_parameter_lambda: int, prg_aes_backend: Union[str, None] = None,
+                               prg_stream_cipher: str = "aes") -> None:
 
-    prg_key_chain = PrgKeyChain(security_parameter_lambda, store_persistently)
+    prg_key_chain = PrgKeyChain(
+        security_parameter_lambda, store_persistently, prg_aes_backend, prg_stream_cipher)
+    if prg_key_chain.prg_stream_cipher == "chacha20":
+        name_of_the_prg_variant = "ChaCha20"
+    else:
+        name_of_the_prg_variant = f"the {prg_key_chain.prg_aes_backend} backend"
     initial_seed_for_prg_refreshing: bytes = generate_random_input_parameter_for_prg(
         security_parameter_lambda)
     initial_state_of_key_chain_using_prg: bytes = prg_key_chain.key_chain_instantiate(
@@ -101,7 +115,7 @@ def benchmark_for_prg_keychain(store_persistently: bool, security_parameter_lamb
         (average_time_for_prg_keychain - average_time_taken_for_generation_of_input_parameters), 4)
 
     print(f"\t\t\033[1;32m Average execution time for security parameter λ = {
-          security_parameter_lambda}: {average_time_for_prg_keychain} seconds\033[0m")
+          security_parameter_lambda} on {name_of_the_prg_variant}: {average_time_for_prg_keychain} seconds\033[0m")
     print(f"\t\t\033[1;33m Standard deviation for security parameter λ = {
           security_parameter_lambda}: {standard_deviation_for_prg_keychain}\033[0m")
     print(f"\t\t\033[1;34m Confidence intervals for security parameter λ = {
@@ -112,9 +126,11 @@ def benchmark_for_prg_keychain(store_persistently: bool, security_parameter_lamb
           difference_of_the_average_timings} seconds\033[0m \n")
 
 
-def benchmark_for_shake_xdrbg_keychain(xof, store_persistently: bool, xof_name: str) -> None:
+def benchmark_for_shake_xdrbg_keychain(xof, store_persistently: bool, xof_name: str, buffer_keys_from_xdrbg_generate: bool = False,
+                                       absorb_input_as_alpha: bool = False) -> None:
 
-    shake_xdrbg_key_chain = ShakeXdrbgKeychain(xof, store_persistently)
+    shake_xdrbg_key_chain = ShakeXdrbgKeychain(
+        xof, store_persistently, buffer_keys_from_xdrbg_generate, absorb_input_as_alpha=absorb_input_as_alpha)
     seed_for_xdrbg_instantiate: bytes = generate_random_input_parameter_for_xdrbg(
         xof.name)
     initial_state_of_key_chain_using_shake_based_xdrbg: bytes = shake_xdrbg_key_chain.key_chain_instantiate(
@@ -149,9 +165,89 @@ def benchmark_for_shake_xdrbg_keychain(xof, store_persistently: bool, xof_name:
           difference_of_the_average_timings} seconds\033[0m \n")
 
 
-def benchmark_for_hkdf_keychain(hash_func, store_persistently: bool, hash_function_digest_size: int, hash_function_name: str) -> None:
+def benchmark_for_turbo_shake_xdrbg_keychain(turbo_shake_name: str, store_persistently: bool, xof_name: str,
+                                             buffer_keys_from_xdrbg_generate: bool = False) -> None:
+
+    turbo_shake_xdrbg_key_chain = TurboShakeXdrbgKeychain(
+        turbo_shake_name, store_persistently, buffer_keys_from_xdrbg_generate)
+    seed_for_xdrbg_instantiate: bytes = generate_random_input_parameter_for_xdrbg(
+        turbo_shake_name)
+    initial_state_of_key_chain_using_turbo_shake_based_xdrbg: bytes = turbo_shake_xdrbg_key_chain.key_chain_instantiate(
+        seed_for_xdrbg_instantiate)
+
+    individual_execution_time_of_generating_each_turbo_shake_xdrbg_key_chain = calculate_execution_times_of_generating_key_chains(
+        turbo_shake_xdrbg_key_chain, initial_state_of_key_chain_using_turbo_shake_based_xdrbg, turbo_shake_name)
+
+    total_output_data = get_average_execution_time_and_standard_deviation_and_confidence_intervals(
+        individual_execution_time_of_generating_each_turbo_shake_xdrbg_key_chain)
+
+    average_time_for_turbo_shake_xdrbg_keychain = total_output_data[0]
+    standard_deviation_for_turbo_shake_xdrbg_keychain = total_output_data[1]
+    confidence_intervals_of_execution_times_for_turbo_shake_xdrbg_key_chain = total_output_data[2]
+
+    average_time_taken_for_generation_of_input_parameters: float = round(
+        (sum(total_time_taken_for_generating_random_input_parameter_for_xdrbg[1:])/NUMBER_OF_KEY_CHAINS), 4)
+    total_time_taken_for_generating_random_input_parameter_for_xdrbg.clear()
+
+    difference_of_the_average_timings = round(
+        (average_time_for_turbo_shake_xdrbg_keychain - average_time_taken_for_generation_of_input_parameters), 4)
+
+    print(f"\t\t\033[1;32m Average execution time when using {xof_name}: {
+          average_time_for_turbo_shake_xdrbg_keychain} seconds\033[0m")
+    print(f"\t\t\033[1;33m Standard deviation when using {xof_name}: {
+          standard_deviation_for_turbo_shake_xdrbg_keychain}\033[0m")
+    print(f"\t\t\033[1;34m Confidence intervals when using {xof_name}: {
+          confidence_intervals_of_execution_times_for_turbo_shake_xdrbg_key_chain}\033[0m")
+    print(f"\t\t\033[1;35m Average time taken to generate the arbitrary input parameters when using {
+          xof_name}: {average_time_taken_for_generation_of_input_parameters} seconds\033[0m")
+    print(f"\t\t\033[1;36m Average execution time for only the cryptographic operations: {
+          difference_of_the_average_timings} seconds\033[0m \n")
+
+
+def benchmark_for_ascon_xdrbg_keychain(xof, store_persistently: bool, ascon_xof_name: str, buffer_keys_from_xdrbg_generate: bool = False) -> None:
+
+    ascon_xdrbg_key_chain = AsconXdrbgKeychain(
+        xof, store_persistently, ascon_xof_name, buffer_keys_from_xdrbg_generate)
+    seed_for_xdrbg_instantiate = generate_random_input_parameter_for_xdrbg(
+        ascon_xof_name)
+    initial_state_of_key_chain_using_ascon_based_xdrbg = ascon_xdrbg_key_chain.key_chain_instantiate(
+        seed_for_xdrbg_instantiate)
 
-    hkdf_key_chain = HkdfKeyChain(hash_func, store_persistently)
+    individual_execution_time_of_generating_each_ascon_xdrbg_key_chain = calculate_execution_times_of_generating_key_chains(
+        ascon_xdrbg_key_chain, initial_state_of_key_chain_using_ascon_based_xdrbg, ascon_xof_name)
+
+    total_output_data = get_average_execution_time_and_standard_deviation_and_confidence_intervals(
+        individual_execution_time_of_generating_each_ascon_xdrbg_key_chain)
+
+    average_time_for_ascon_xdrbg_keychain = total_output_data[0]
+    standard_deviation_for_ascon_xdrbg_keychain = total_output_data[1]
+    confidence_intervals_of_execution_times_for_ascon_xdrbg_key_chain = total_output_data[2]
+
+    average_time_taken_for_generation_of_input_parameters: float = round(
+        (sum(total_time_taken_for_generating_random_input_parameter_for_xdrbg[1:])/NUMBER_OF_KEY_CHAINS), 4)
+    total_time_taken_for_generating_random_input_parameter_for_xdrbg.clear()
+
+    difference_of_the_average_timings = round(
+        (average_time_for_ascon_xdrbg_keychain - average_time_taken_for_generation_of_input_parameters), 4)
+
+    print(f"\t\t\033[1;32m Average execution time when using {ascon_xof_name}: {
+          average_time_for_ascon_xdrbg_keychain} seconds\033[0m")
+    print(f"\t\t\033[1;33m Standard deviation when using {ascon_xof_name}: {
+          standard_deviation_for_ascon_xdrbg_keychain}\033[0m")
+    print(f"\t\t\033[1;34m Confidence intervals when using {ascon_xof_name}: {
+          confidence_intervals_of_execution_times_for_ascon_xdrbg_key_chain}\033[0m")
+    print(f"\t\t\033[1;35m Average time taken to generate the arbitrary input parameters when using {ascon_xof_name}: {
+          average_time_taken_for_generation_of_input_parameters} seconds\033[0m")
+    print(f"\t\t\033[1;36m Average execution time for only the cryptographic operations: {
+          difference_of_the_average_timings} seconds\033[0m \n")
+
+
+def benchmark_for_hkdf_keychain(hash_func, store_persistently: bool, hash_function_digest_size: int, hash_function_name: str,
+                                hkdf_backend: Union[str, None] = None) -> None:
+
+    hkdf_key_chain = HkdfKeyChain(hash_func, store_persistently, hkdf_backend)
+    hash_function_name = f"{hash_function_name} on the {
+        hkdf_key_chain.hkdf_backend} backend"
     initial_source_key_material: bytes = generate_random_input_parameter_for_hkdf(
         hash_func.__name__)
     initial_state_of_key_chain_using_hkdf: bytes = hkdf_key_chain.key_chain_instantiate(
@@ -186,6 +282,96 @@ def benchmark_for_hkdf_keychain(hash_func, store_persistently: bool, hash_functi
           difference_of_the_average_timings} seconds\033[0m \n")
 
 
+def benchmark_for_hkdf_derive_fast_path(hash_func, hash_function_name: str) -> None:
+
+    hkdf_obj = Hkdf(hash_func, "hmac")
+    digest_size: int = hkdf_obj.hash_algorithm_digest_size_in_bytes
+
+    # The same shape of input and output as in a key chain update, i.e., the arbitrary input
+    # parameter concatenated with the current state as input and two output blocks as output.
+    source_key_material: bytes = os.urandom(2 * digest_size)
+
+    def wrapped_extract_then_expand_call():
+        return hkdf_obj.hkdf_expand(hkdf_obj.hkdf_extract(None, source_key_material), None, 2 * digest_size)
+
+    def wrapped_derive_call():
+        return hkdf_obj.derive_two_output_blocks(source_key_material)
+
+    average_time_for_extract_then_expand: float = timeit(
+        wrapped_extract_then_expand_call, number=NUMBER_OF_HKDF_DERIVATIONS)/NUMBER_OF_HKDF_DERIVATIONS
+    average_time_for_derive: float = timeit(
+        wrapped_derive_call, number=NUMBER_OF_HKDF_DERIVATIONS)/NUMBER_OF_HKDF_DERIVATIONS
+
+    print(f"\t\t\033[1;32m Average time for hkdf_extract + hkdf_expand when using {
+          hash_function_name}: {average_time_for_extract_then_expand * 1e6:.3f} microseconds\033[0m")
+    print(f"\t\t\033[1;33m Average time for the fused derive when using {
+          hash_function_name}: {average_time_for_derive * 1e6:.3f} microseconds\033[0m")
+    print(f"\t\t\033[1;36m Speedup of the fused derive when using {hash_function_name}: {
+          average_time_for_extract_then_expand / average_time_for_derive:.2f}x\033[0m")
+
+    cryptography_hkdf_obj = Hkdf(hash_func, "cryptography")
+    average_time_for_cryptography_derive: float = timeit(
+        lambda: cryptography_hkdf_obj.derive_two_output_blocks(source_key_material), number=NUMBER_OF_HKDF_DERIVATIONS)/NUMBER_OF_HKDF_DERIVATIONS
+
+    print(f"\t\t\033[1;34m Average time for the derive on the cryptography backend when using {
+          hash_function_name}: {average_time_for_cryptography_derive * 1e6:.3f} microseconds\033[0m")
+    print(f"\t\t\033[1;35m Backend selected automatically when using {
+          hash_function_name}: {select_fastest_hkdf_backend(hash_func)}\033[0m \n")
+
+
+def conduct_hkdf_derive_benchmarks() -> None:
+
+    print(
+        f"\033[1;31m Conducting benchmarks for {NUMBER_OF_HKDF_DERIVATIONS} HKDF derivations of two output blocks:\033[0m")
+    benchmark_for_hkdf_derive_fast_path(sha256, "SHA256")
+    benchmark_for_hkdf_derive_fast_path(sha3_256, "SHA3-256")
+    benchmark_for_hkdf_derive_fast_path(sha512, "SHA512")
+    benchmark_for_hkdf_derive_fast_path(sha3_512, "SHA3-512")
+    benchmark_for_hkdf_derive_fast_path(blake2s, "BLAKE2s")
+    benchmark_for_hkdf_derive_fast_path(blake2b, "BLAKE2b")
+
+
+def benchmark_for_stateless_shake_invocation(xof, xof_name: str) -> None:
+
+    shake_xdrbg_obj = ShakeBasedXdrbg(xof)
+    state_size: int = shake_xdrbg_obj.XDRBG_STATE_SIZE
+
+    # The same shape of input and output as in the reseed call of a key chain update.
+    encoded_bytes: bytes = encode_function(
+        os.urandom(state_size + state_size), b"", 1)
+
+    # The previous invocation where the data of every call is absorbed
+    # on top of the data of all the previous calls into one Xof.
+    long_lived_xof = xof.copy()
+
+    def wrapped_long_lived_xof_call():
+        long_lived_xof.update(encoded_bytes)
+        return long_lived_xof.digest(state_size)
+
+    def wrapped_stateless_xof_call():
+        return shake_xdrbg_obj.generate_final_output(encoded_bytes, state_size)
+
+    average_time_for_long_lived_xof: float = timeit(
+        wrapped_long_lived_xof_call, number=NUMBER_OF_XOF_INVOCATIONS)/NUMBER_OF_XOF_INVOCATIONS
+    average_time_for_stateless_xof: float = timeit(
+        wrapped_stateless_xof_call, number=NUMBER_OF_XOF_INVOCATIONS)/NUMBER_OF_XOF_INVOCATIONS
+
+    print(f"\t\t\033[1;32m Average time for the long-lived Xof when using {
+          xof_name}: {average_time_for_long_lived_xof * 1e6:.3f} microseconds\033[0m")
+    print(f"\t\t\033[1;33m Average time for the stateless Xof when using {
+          xof_name}: {average_time_for_stateless_xof * 1e6:.3f} microseconds\033[0m")
+    print(f"\t\t\033[1;36m Cost of the stateless Xof when using {xof_name}: {
+          average_time_for_stateless_xof / average_time_for_long_lived_xof:.2f}x\033[0m \n")
+
+
+def conduct_stateless_shake_invocation_benchmarks() -> None:
+
+    print(
+        f"\033[1;31m Conducting benchmarks for {NUMBER_OF_XOF_INVOCATIONS} invocations of the Xof in the Shake XDRBG:\033[0m")
+    benchmark_for_stateless_shake_invocation(shake_128(), "SHAKE128")
+    benchmark_for_stateless_shake_invocation(shake_256(), "SHAKE256")
+
+
 def conduct_all_benchmarks(store_persistently: bool):
 
     if store_persistently:
@@ -196,15 +382,26 @@ def conduct_all_benchmarks(store_persistently: bool):
             f"\033[1;31m Conducting benchmarks for generating {NUMBER_OF_KEY_CHAINS} key chains without persistently storing in the database:\033[0m")
 
     # Benchmark For HKDF Keychain
+    # Each hash function is benchmarked on all the HKDF backends side by side
     print("\t Benchmark For HKDF KeyChain:")
-    benchmark_for_hkdf_keychain(
-        sha256, store_persistently, sha256().digest_size, "SHA256")
-    benchmark_for_hkdf_keychain(
-        sha3_256, store_persistently, sha3_256().digest_size, "SHA3-256")
-    benchmark_for_hkdf_keychain(
-        sha512, store_persistently, sha512().digest_size, "SHA512")
-    benchmark_for_hkdf_keychain(
-        sha3_512, store_persistently, sha3_512().digest_size, "SHA3-512")
+    for hkdf_backend in HKDF_BACKENDS:
+        benchmark_for_hkdf_keychain(
+            sha256, store_persistently, sha256().digest_size, "SHA256", hkdf_backend)
+    for hkdf_backend in HKDF_BACKENDS:
+        benchmark_for_hkdf_keychain(
+            sha3_256, store_persistently, sha3_256().digest_size, "SHA3-256", hkdf_backend)
+    for hkdf_backend in HKDF_BACKENDS:
+        benchmark_for_hkdf_keychain(
+            sha512, store_persistently, sha512().digest_size, "SHA512", hkdf_backend)
+    for hkdf_backend in HKDF_BACKENDS:
+        benchmark_for_hkdf_keychain(
+            sha3_512, store_persistently, sha3_512().digest_size, "SHA3-512", hkdf_backend)
+    for hkdf_backend in HKDF_BACKENDS:
+        benchmark_for_hkdf_keychain(
+            blake2s, store_persistently, blake2s().digest_size, "BLAKE2s", hkdf_backend)
+    for hkdf_backend in HKDF_BACKENDS:
+        benchmark_for_hkdf_keychain(
+            blake2b, store_persistently, blake2b().digest_size, "BLAKE2b", hkdf_backend)
 
     # Benchmark For Shake XDRBG Keychain
     print("\t Benchmark For Shake XDRBG KeyChain:")
@@ -213,52 +410,49 @@ def conduct_all_benchmarks(store_persistently: bool):
     benchmark_for_shake_xdrbg_keychain(
         shake_256(), store_persistently, "SHAKE256")
 
-    # Benchmark For Ascon XDRBG Keychain
-    ascon_xdrbg_key_chain = AsconXdrbgKeychain(ascon_xof, store_persistently)
-    seed_for_xdrbg_instantiate = generate_random_input_parameter_for_xdrbg(
-        "Ascon-Xof")
-    initial_state_of_key_chain_using_ascon_based_xdrbg = ascon_xdrbg_key_chain.key_chain_instantiate(
-        seed_for_xdrbg_instantiate)
-
-    print("\t Benchmark For ASCON XDRBG KeyChain:")
-
-    individual_execution_time_of_generating_each_ascon_xdrbg_key_chain = calculate_execution_times_of_generating_key_chains(
-        ascon_xdrbg_key_chain, initial_state_of_key_chain_using_ascon_based_xdrbg, "Ascon-Xof")
-
-    total_output_data = get_average_execution_time_and_standard_deviation_and_confidence_intervals(
-        individual_execution_time_of_generating_each_ascon_xdrbg_key_chain)
-
-    average_time_for_ascon_xdrbg_keychain = total_output_data[0]
-    standard_deviation_for_ascon_xdrbg_keychain = total_output_data[1]
-    confidence_intervals_of_execution_times_for_ascon_xdrbg_key_chain = total_output_data[2]
+    # All the keys from the maximum output of one XDRBG generate call are handed out from a buffer
+    benchmark_for_shake_xdrbg_keychain(
+        shake_128(), store_persistently, "SHAKE128 with buffered keys", buffer_keys_from_xdrbg_generate=True)
+    benchmark_for_shake_xdrbg_keychain(
+        shake_256(), store_persistently, "SHAKE256 with buffered keys", buffer_keys_from_xdrbg_generate=True)
 
-    average_time_taken_for_generation_of_input_parameters: float = round(
-        (sum(total_time_taken_for_generating_random_input_parameter_for_xdrbg[1:])/NUMBER_OF_KEY_CHAINS), 4)
-    total_time_taken_for_generating_random_input_parameter_for_xdrbg.clear()
+    # The arbitrary input parameter is absorbed as α by a single XDRBG generate call instead of reseed and generate
+    benchmark_for_shake_xdrbg_keychain(
+        shake_128(), store_persistently, "SHAKE128 with the input as alpha", absorb_input_as_alpha=True)
+    benchmark_for_shake_xdrbg_keychain(
+        shake_256(), store_persistently, "SHAKE256 with the input as alpha", absorb_input_as_alpha=True)
 
-    difference_of_the_average_timings = round(
-        (average_time_for_ascon_xdrbg_keychain - average_time_taken_for_generation_of_input_parameters), 4)
+    # Benchmark For TurboShake XDRBG Keychain
+    print("\t Benchmark For TurboShake XDRBG KeyChain:")
+    benchmark_for_turbo_shake_xdrbg_keychain(
+        "turboshake_128", store_persistently, "TurboSHAKE128")
+    benchmark_for_turbo_shake_xdrbg_keychain(
+        "turboshake_256", store_persistently, "TurboSHAKE256")
 
-    print(f"\t\t\033[1;32m Average execution time: {
-          average_time_for_ascon_xdrbg_keychain} seconds\033[0m")
-    print(f"\t\t\033[1;33m Standard deviation: {
-          standard_deviation_for_ascon_xdrbg_keychain}\033[0m")
-    print(f"\t\t\033[1;34m Confidence intervals: {
-          confidence_intervals_of_execution_times_for_ascon_xdrbg_key_chain}\033[0m")
-    print(f"\t\t\033[1;35m Average time taken to generate the arbitrary input parameters: {
-          average_time_taken_for_generation_of_input_parameters} seconds\033[0m")
-    print(f"\t\t\033[1;36m Average execution time for only the cryptographic operations: {
-          difference_of_the_average_timings} seconds\033[0m \n")
+    # Benchmark For Ascon XDRBG Keychain
+    print("\t Benchmark For ASCON XDRBG KeyChain:")
+    benchmark_for_ascon_xdrbg_keychain(
+        ascon_xof, store_persistently, "Ascon-Xof")
+    benchmark_for_ascon_xdrbg_keychain(
+        ascon_xof, store_persistently, "Ascon-Xofa")
 
     # Benchmark For PRG Keychain
+    # Each security parameter λ is benchmarked on all the AES backends side by side
     print("\t Benchmark For PRG KeyChain:")
-    benchmark_for_prg_keychain(store_persistently, 16)
-    benchmark_for_prg_keychain(store_persistently, 24)
-    benchmark_for_prg_keychain(store_persistently, 32)
+    for security_parameter_lambda in [16, 24, 32]:
+        for prg_aes_backend in PRG_AES_BACKENDS:
+            benchmark_for_prg_keychain(
+                store_persistently, security_parameter_lambda, prg_aes_backend)
+        print(f"\t\t\033[1;35m Backend selected automatically for security parameter λ = {
+              security_parameter_lambda}: {select_fastest_prg_aes_backend(security_parameter_lambda)}\033[0m \n")
+    benchmark_for_prg_keychain(
+        store_persistently, SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20, prg_stream_cipher="chacha20")
 
 
 def main() -> None:
 
+    conduct_hkdf_derive_benchmarks()
+    conduct_stateless_shake_invocation_benchmarks()
     conduct_all_benchmarks(store_persistently=False)
     conduct_all_benchmarks(store_persistently=True)
 
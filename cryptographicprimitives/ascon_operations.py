@@ -0,0 +1,293 @@
+"""
+Ascon-Xof is an Extendable Output Function (XOF) based on the Ascon permutation which works on a state of
+five 64-bit lanes and absorbs and squeezes 8 bytes (64 bits) at a time. Ascon-Xofa is its variant with
+8 instead of 12 rounds of the permutation in between the blocks. This is an in-tree implementation which
+is bit-compatible with the reference implementation of [2], i.e., with ascon_hash(message, "Ascon-Xof", n)
+and ascon_hash(message, "Ascon-Xofa", n), but which avoids the repeated work of the reference
+implementation on every call.
+
+This is based on the academic work:
+
+[1] Dobraunig, Christoph, Maria Eichlseder, Florian Mendel, and Martin Schläffer. "Ascon v1.2: Lightweight Authenticated
+Encryption and Hashing." Journal of Cryptology 34.3 (2021): 33.
+https://ascon.iaik.tugraz.at/
+
+[2] https://github.com/meichlseder/pyascon
+"""
+
+from struct import pack_into, unpack
+from typing import Tuple
+import numpy
+
+ASCON_XOF_RATE_IN_BYTES: int = 8
+ASCON_LANE_MASK: int = 0xFFFFFFFFFFFFFFFF
+
+# The amounts of the rotations to the right in the linear diffusion layer for each of the five lanes [1].
+ASCON_ROTATION_AMOUNTS: Tuple[Tuple[int, int], ...] = ((19, 28), (61, 39), (1, 6), (10, 17), (7, 41))
+
+# The round constants of the 12 rounds of the Ascon permutation [1]. A permutation with
+# fewer rounds uses only the last round constants.
+ASCON_ROUND_CONSTANTS: Tuple[int, ...] = tuple(
+    0xf0 - round_number * 0x10 + round_number * 0x1 for round_number in range(12))
+
+# This dictionary maps the Ascon Xofs to their respective number of rounds of the
+# permutation (a, b) for the initialization/finalization and for the absorbing/squeezing [1].
+
+# The {key : value} pair is respectively {ascon_xof_name : (rounds_a, rounds_b)}.
+ASCON_XOF_NUMBER_OF_ROUNDS: dict[str, Tuple[int, int]] = {
+    "Ascon-Xof": (12, 12),
+    "Ascon-Xofa": (12, 8),
+}
+
+
+def ascon_permutation(
+    state: Tuple[int, int, int, int, int], number_of_rounds: int
+) -> Tuple[int, int, int, int, int]:
+    """
+    Applies the given number of rounds of the Ascon permutation [1] to a state of
+    five 64-bit lanes. Every round is written out on the lanes as local integers
+    instead of looping over lists, and the round constants are precomputed.
+
+    Parameters
+    ----------
+
+    state : Tuple[int, int, int, int, int]
+            The five 64-bit lanes of the Ascon state.
+
+    number_of_rounds : int
+                       The number of rounds which must be <= 12.
+
+    Returns
+    -------
+    The five 64-bit lanes of the Ascon state after the permutation.
+    """
+    x0, x1, x2, x3, x4 = state
+    for round_constant in ASCON_ROUND_CONSTANTS[12 - number_of_rounds:]:
+        # Addition of the round constant
+        x2 ^= round_constant
+
+        # Substitution layer
+        x0 ^= x4
+        x4 ^= x3
+        x2 ^= x1
+        t0 = (x0 ^ ASCON_LANE_MASK) & x1
+        t1 = (x1 ^ ASCON_LANE_MASK) & x2
+        t2 = (x2 ^ ASCON_LANE_MASK) & x3
+        t3 = (x3 ^ ASCON_LANE_MASK) & x4
+        t4 = (x4 ^ ASCON_LANE_MASK) & x0
+        x0 ^= t1
+        x1 ^= t2
+        x2 ^= t3
+        x3 ^= t4
+        x4 ^= t0
+        x1 ^= x0
+        x0 ^= x4
+        x3 ^= x2
+        x2 ^= ASCON_LANE_MASK
+
+        # Linear diffusion layer, where each rotation to the right by r bits is computed as
+        # (x >> r) ^ (x << (64 - r)) and the bits beyond the 64-bit lane are masked only once.
+        x0 = (x0 ^ (x0 >> 19) ^ (x0 << 45) ^ (x0 >> 28) ^ (x0 << 36)) & ASCON_LANE_MASK
+        x1 = (x1 ^ (x1 >> 61) ^ (x1 << 3) ^ (x1 >> 39) ^ (x1 << 25)) & ASCON_LANE_MASK
+        x2 = (x2 ^ (x2 >> 1) ^ (x2 << 63) ^ (x2 >> 6) ^ (x2 << 58)) & ASCON_LANE_MASK
+        x3 = (x3 ^ (x3 >> 10) ^ (x3 << 54) ^ (x3 >> 17) ^ (x3 << 47)) & ASCON_LANE_MASK
+        x4 = (x4 ^ (x4 >> 7) ^ (x4 << 57) ^ (x4 >> 41) ^ (x4 << 23)) & ASCON_LANE_MASK
+    return (x0, x1, x2, x3, x4)
+
+
+def get_initial_state_of_ascon_xof(ascon_xof_name: str) -> Tuple[int, int, int, int, int]:
+    """
+    Computes the state of the Ascon Xof after the initialization [1], i.e., the
+    permutation with a rounds applied to the initial value, which is the same
+    for every message.
+
+    Parameter
+    ---------
+
+    ascon_xof_name : str
+
+    Returns
+    -------
+    The five 64-bit lanes of the Ascon state after the initialization.
+    """
+    rounds_a, rounds_b = ASCON_XOF_NUMBER_OF_ROUNDS[ascon_xof_name]
+    initial_value: bytes = bytes(
+        [0, ASCON_XOF_RATE_IN_BYTES * 8, rounds_a, rounds_a - rounds_b]) + bytes(4)
+    return ascon_permutation((int.from_bytes(initial_value, "big"), 0, 0, 0, 0), rounds_a)
+
+
+# The initialization does not depend on the message, so the state after the initialization
+# is computed only once here instead of applying the permutation to the initial value on
+# every call.
+
+# The {key : value} pair is respectively {ascon_xof_name : initial_state_of_ascon_xof}.
+INITIAL_STATES_OF_ASCON_XOF: dict[str, Tuple[int, int, int, int, int]] = {
+    ascon_xof_name: get_initial_state_of_ascon_xof(ascon_xof_name) for ascon_xof_name in ASCON_XOF_NUMBER_OF_ROUNDS
+}
+
+
+def ascon_xof(message: bytes, ascon_xof_name: str = "Ascon-Xof", length_of_output: int = 32) -> bytes:
+    """
+    Computes the output of the Ascon Xof [1] of the desired length. This is a drop-in
+    replacement of ascon_hash(message, ascon_xof_name, length_of_output) from [2].
+
+    Parameters
+    ----------
+
+    message : bytes
+
+    ascon_xof_name : str
+                     This must be either a string "Ascon-Xof" or "Ascon-Xofa".
+
+    length_of_output : int
+                       The desired length of the output in bytes.
+
+    Returns
+    -------
+    The output of the Ascon Xof in bytes of the desired length.
+    """
+    rounds_a, rounds_b = ASCON_XOF_NUMBER_OF_ROUNDS[ascon_xof_name]
+    x0, x1, x2, x3, x4 = INITIAL_STATES_OF_ASCON_XOF[ascon_xof_name]
+
+    # Absorbing of the message padded with a single "1" bit and as many "0" bits as
+    # needed to reach a multiple of the rate, where all the blocks of the message are
+    # converted to 64-bit lanes at once.
+    padded_message: bytes = message + b"\x80" + bytes(
+        ASCON_XOF_RATE_IN_BYTES - 1 - len(message) % ASCON_XOF_RATE_IN_BYTES)
+    blocks_of_the_padded_message: Tuple[int, ...] = unpack(
+        f">{len(padded_message) // ASCON_XOF_RATE_IN_BYTES}Q", padded_message)
+    for block in blocks_of_the_padded_message[:-1]:
+        x0, x1, x2, x3, x4 = ascon_permutation(
+            (x0 ^ block, x1, x2, x3, x4), rounds_b)
+    x0 ^= blocks_of_the_padded_message[-1]
+
+    # Squeezing directly into a buffer which is preallocated to a multiple of the rate
+    number_of_blocks_of_the_output: int = -(-length_of_output // ASCON_XOF_RATE_IN_BYTES)
+    output_buffer = bytearray(number_of_blocks_of_the_output * ASCON_XOF_RATE_IN_BYTES)
+    x0, x1, x2, x3, x4 = ascon_permutation((x0, x1, x2, x3, x4), rounds_a)
+    for offset in range(0, len(output_buffer), ASCON_XOF_RATE_IN_BYTES):
+        pack_into(">Q", output_buffer, offset, x0)
+        if offset + ASCON_XOF_RATE_IN_BYTES < len(output_buffer):
+            x0, x1, x2, x3, x4 = ascon_permutation(
+                (x0, x1, x2, x3, x4), rounds_b)
+    del output_buffer[length_of_output:]
+    return bytes(output_buffer)
+
+
+def ascon_permutation_many(lanes: list[numpy.ndarray], number_of_rounds: int) -> None:
+    """
+    Applies the given number of rounds of the Ascon permutation [1] to N independent
+    states at once, where each of the five lanes holds the respective lane of all the
+    N states as an array of dtype uint64. The lanes are updated in place.
+
+    Parameters
+    ----------
+
+    lanes : list[numpy.ndarray]
+            The five lanes of the N Ascon states, each of dtype uint64 and of shape (N,).
+
+    number_of_rounds : int
+                       The number of rounds which must be <= 12.
+
+    Returns
+    -------
+    None
+    """
+    x0, x1, x2, x3, x4 = lanes
+    for round_constant in ASCON_ROUND_CONSTANTS[12 - number_of_rounds:]:
+        # Addition of the round constant
+        x2 ^= numpy.uint64(round_constant)
+
+        # Substitution layer
+        x0 ^= x4
+        x4 ^= x3
+        x2 ^= x1
+        t0 = ~x0 & x1
+        t1 = ~x1 & x2
+        t2 = ~x2 & x3
+        t3 = ~x3 & x4
+        t4 = ~x4 & x0
+        x0 ^= t1
+        x1 ^= t2
+        x2 ^= t3
+        x3 ^= t4
+        x4 ^= t0
+        x1 ^= x0
+        x0 ^= x4
+        x3 ^= x2
+        numpy.invert(x2, out=x2)
+
+        # Linear diffusion layer, where the left shifts of the uint64 lanes already
+        # discard the bits beyond the 64-bit lane.
+        for lane, (rotation_1, rotation_2) in zip(lanes, ASCON_ROTATION_AMOUNTS):
+            lane ^= ((lane >> numpy.uint64(rotation_1)) ^ (lane << numpy.uint64(64 - rotation_1))
+                     ^ (lane >> numpy.uint64(rotation_2)) ^ (lane << numpy.uint64(64 - rotation_2)))
+
+
+def ascon_xof_many(list_of_messages: list[bytes], ascon_xof_name: str = "Ascon-Xof", length_of_output: int = 32) -> list[bytes]:
+    """
+    Computes the output of the Ascon Xof [1] of the desired length for many independent
+    messages at once, which is the same as [ascon_xof(message, ascon_xof_name, length_of_output)
+    for message in list_of_messages]. The messages of the same length are absorbed and
+    squeezed together with ascon_permutation_many(), so the overhead of the interpreter is
+    shared among all of them.
+
+    Parameters
+    ----------
+
+    list_of_messages : list[bytes]
+
+    ascon_xof_name : str
+                     This must be either a string "Ascon-Xof" or "Ascon-Xofa".
+
+    length_of_output : int
+                       The desired length of each output in bytes.
+
+    Returns
+    -------
+    A list of the outputs of the Ascon Xof in bytes of the desired length in the same
+    order as the messages.
+    """
+    rounds_a, rounds_b = ASCON_XOF_NUMBER_OF_ROUNDS[ascon_xof_name]
+    number_of_blocks_of_the_output: int = -(-length_of_output // ASCON_XOF_RATE_IN_BYTES)
+    list_of_outputs: list[bytes] = [b""] * len(list_of_messages)
+
+    # The {key : value} pair is respectively {length_of_message : indices_of_the_messages}.
+    indices_of_the_messages_for_each_length: dict[int, list[int]] = {}
+    for index, message in enumerate(list_of_messages):
+        indices_of_the_messages_for_each_length.setdefault(
+            len(message), []).append(index)
+
+    for length_of_message, indices_of_the_messages in indices_of_the_messages_for_each_length.items():
+        number_of_messages: int = len(indices_of_the_messages)
+        padding: bytes = b"\x80" + bytes(
+            ASCON_XOF_RATE_IN_BYTES - 1 - length_of_message % ASCON_XOF_RATE_IN_BYTES)
+        blocks_of_the_padded_messages: numpy.ndarray = numpy.frombuffer(
+            b"".join(list_of_messages[index] + padding for index in indices_of_the_messages),
+            dtype=">u8").reshape(number_of_messages, -1).astype(numpy.uint64)
+
+        lanes: list[numpy.ndarray] = [numpy.full(number_of_messages, lane, dtype=numpy.uint64)
+                                      for lane in INITIAL_STATES_OF_ASCON_XOF[ascon_xof_name]]
+
+        # Absorbing
+        for block in range(blocks_of_the_padded_messages.shape[1] - 1):
+            lanes[0] ^= blocks_of_the_padded_messages[:, block]
+            ascon_permutation_many(lanes, rounds_b)
+        lanes[0] ^= blocks_of_the_padded_messages[:, -1]
+
+        # Squeezing into one array for the outputs of all the messages
+        output_blocks = numpy.empty(
+            (number_of_messages, number_of_blocks_of_the_output), dtype=">u8")
+        ascon_permutation_many(lanes, rounds_a)
+        for block in range(number_of_blocks_of_the_output):
+            output_blocks[:, block] = lanes[0]
+            if block + 1 < number_of_blocks_of_the_output:
+                ascon_permutation_many(lanes, rounds_b)
+
+        outputs: bytes = output_blocks.tobytes()
+        length_of_each_output_block: int = number_of_blocks_of_the_output * ASCON_XOF_RATE_IN_BYTES
+        for position, index in enumerate(indices_of_the_messages):
+            start: int = position * length_of_each_output_block
+            list_of_outputs[index] = outputs[start: start + length_of_output]
+
+    return list_of_outputs
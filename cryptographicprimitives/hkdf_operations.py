@@ -7,26 +7,98 @@ generate further outputs (cryptographic keys) by expanding this pseudorandom key
 
 [1] Krawczyk, Hugo. "Cryptographic extraction and key derivation: The HKDF scheme." Annual Cryptology Conference. Berlin, Heidelberg: Springer Berlin Heidelberg, 2010.
 [2] https://github.com/casebeer/python-hkdf
+[3] https://cryptography.io/en/latest/hazmat/primitives/key-derivation-functions/#hkdf
 """
-from math import ceil
-from typing import Union
+from timeit import timeit
+from typing import Callable, Iterable, Iterator, Tuple, Union
 import hmac
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hmac as cryptography_hmac
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF, HKDFExpand
 
 IS_PERFORMANCE_BENCHMARKING_DONE: bool = True
 
+# The registry of the backends on which the Hkdf can run. The backend "hmac" is the implementation
+# in this module on top of the hmac module of Python and the backend "cryptography" runs on the
+# HKDF and HKDFExpand of the cryptography package, which are backed by OpenSSL [3].
+HKDF_BACKENDS: tuple[str, ...] = ("hmac", "cryptography")
+
+# This dictionary maps the hash functions which are supported by the backend "cryptography"
+# to their respective hash algorithms in the cryptography package.
+
+# The {key : value} pair is respectively {hash_function_name : cryptography_hash_algorithm}.
+CRYPTOGRAPHY_HASH_ALGORITHMS: dict[str, Callable[[], hashes.HashAlgorithm]] = {
+    "openssl_sha256": hashes.SHA256,
+    "openssl_sha3_256": hashes.SHA3_256,
+    "openssl_sha512": hashes.SHA512,
+    "openssl_sha3_512": hashes.SHA3_512,
+    "blake2s": lambda: hashes.BLAKE2s(32),
+    "blake2b": lambda: hashes.BLAKE2b(64),
+}
+
+NUMBER_OF_DERIVATIONS_FOR_SELECTING_THE_HKDF_BACKEND: int = 500
+
+# The {key : value} pair is respectively {hash_function_name : fastest_hkdf_backend}.
+fastest_hkdf_backend_for_hash_function: dict[str, str] = {}
+
+
+def select_fastest_hkdf_backend(hash_algorithm) -> str:
+    """
+    Selects the faster of the backends from HKDF_BACKENDS for the given hash
+    function by timing the derivation of two output blocks, which is the same
+    derivation as in a key chain update. The selection is done only once for
+    each hash function and is reused afterwards.
+
+    Parameter
+    ---------
+    hash_algorithm
+
+    Returns
+    -------
+    The name of the fastest backend.
+    """
+
+    hash_function_name: str = hash_algorithm.__name__
+    if hash_function_name in fastest_hkdf_backend_for_hash_function:
+        return fastest_hkdf_backend_for_hash_function[hash_function_name]
+
+    if hash_function_name not in CRYPTOGRAPHY_HASH_ALGORITHMS:
+        fastest_hkdf_backend_for_hash_function[hash_function_name] = "hmac"
+        return "hmac"
+
+    execution_time_for_each_hkdf_backend: dict[str, float] = {}
+    for hkdf_backend in HKDF_BACKENDS:
+        hkdf_obj = Hkdf(hash_algorithm, hkdf_backend)
+        source_key_material: bytes = bytes(
+            2 * hkdf_obj.hash_algorithm_digest_size_in_bytes)
+        execution_time_for_each_hkdf_backend[hkdf_backend] = timeit(
+            lambda: hkdf_obj.derive_two_output_blocks(source_key_material),
+            number=NUMBER_OF_DERIVATIONS_FOR_SELECTING_THE_HKDF_BACKEND)
+
+    fastest_hkdf_backend: str = min(
+        execution_time_for_each_hkdf_backend, key=execution_time_for_each_hkdf_backend.__getitem__)
+    fastest_hkdf_backend_for_hash_function[hash_function_name] = fastest_hkdf_backend
+    return fastest_hkdf_backend
+
 
 class Hkdf:
 
-    def __init__(self, hash_algorithm) -> None:
+    def __init__(self, hash_algorithm, hkdf_backend: Union[str, None] = None) -> None:
         """
         Creates an instance of Hkdf with a hash function
-        like sha256, sha512 or any hash function from the
-        SHA-3 family.
+        like sha256, sha512, blake2s, blake2b or any hash
+        function from the SHA-3 family.
 
-        Parameter
-        ---------
+        Parameters
+        ----------
         hash_algorithm
 
+        hkdf_backend : str or None
+                       The backend from HKDF_BACKENDS on which all the extract, expand and
+                       derive steps run, except for iter_expand() which always runs on the
+                       backend "hmac". If it is None, then the faster backend for the
+                       hash function is selected by select_fastest_hkdf_backend().
+
         Returns
         -------
         None
@@ -34,6 +106,33 @@ class Hkdf:
         self.__hash_algorithm = hash_algorithm
         self.hash_algorithm_digest_size_in_bytes: int = self.__hash_algorithm().digest_size
 
+        if hkdf_backend is None:
+            hkdf_backend = select_fastest_hkdf_backend(self.__hash_algorithm)
+        try:
+            if hkdf_backend not in HKDF_BACKENDS:
+                raise ValueError(f"Invalid backend {hkdf_backend} for the Hkdf. Choose a backend from {
+                                 HKDF_BACKENDS}.")
+            if hkdf_backend == "cryptography" and self.__hash_algorithm.__name__ not in CRYPTOGRAPHY_HASH_ALGORITHMS:
+                raise ValueError(f"The hash function {
+                                 self.__hash_algorithm.__name__} is not supported by the backend {hkdf_backend}.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        self.hkdf_backend: str = hkdf_backend
+        if self.hkdf_backend == "cryptography":
+            self.__cryptography_hash_algorithm = CRYPTOGRAPHY_HASH_ALGORITHMS[
+                self.__hash_algorithm.__name__]()
+
+        # The keychains always invoke the extract step with the default salt of 0's, so the
+        # HMAC object keyed with it is created only once here. Every later call to the extract
+        # step with the default salt just copies this object, which skips recomputing the
+        # ipad/opad key schedule of the HMAC for each call.
+        self.__default_salt: bytes = bytes(
+            self.hash_algorithm_digest_size_in_bytes)
+        self.__hmac_keyed_with_default_salt = hmac.new(
+            self.__default_salt, None, self.__hash_algorithm
+        )
+
     def hkdf_extract(
         self, extractor_salt: Union[bytes, None], source_key_material: bytes
     ) -> bytes:
@@ -63,9 +162,35 @@ class Hkdf:
         # digest size of the chosen hash function, else check the salt length
         # accordingly.
 
+        if extractor_salt is None and self.hkdf_backend == "hmac":
+            hmac_keyed_with_extractor_salt = self.__hmac_keyed_with_default_salt.copy()
+            hmac_keyed_with_extractor_salt.update(memoryview(source_key_material))
+            return hmac_keyed_with_extractor_salt.digest()
+
+        extractor_salt = self.__resolve_extractor_salt(extractor_salt)
+
+        # This is the computation of the parameter PRK = HMAC(XTS, SKM) according to Page
+        # 13 of the downloaded pdf (which is Page 11) of [1].
+
+        if self.hkdf_backend == "cryptography":
+            hmac_keyed_with_extractor_salt = cryptography_hmac.HMAC(
+                extractor_salt, self.__cryptography_hash_algorithm)
+            hmac_keyed_with_extractor_salt.update(bytes(source_key_material))
+            return hmac_keyed_with_extractor_salt.finalize()
+
+        pseudo_random_key: bytes = hmac.new(
+            extractor_salt, memoryview(
+                source_key_material), self.__hash_algorithm
+        ).digest()
+        return pseudo_random_key
+
+    def __resolve_extractor_salt(self, extractor_salt: Union[bytes, None]) -> bytes:
+
+        # This is the only place where the salt of the extract step is defaulted and checked for all
+        # the entry points, i.e., a missing salt is set to the default salt of 0's and the length of
+        # a provided salt is at most the digest size of the chosen hash function [1].
         if extractor_salt is None:
-            extractor_salt = bytes(
-                [0] * self.hash_algorithm_digest_size_in_bytes)
+            return self.__default_salt
 
         if not IS_PERFORMANCE_BENCHMARKING_DONE:
             try:
@@ -78,14 +203,21 @@ class Hkdf:
                 print(f"ValueError: {e}")
                 raise
 
-        # This is the computation of the parameter PRK = HMAC(XTS, SKM) according to Page
-        # 13 of the downloaded pdf (which is Page 11) of [1].
+        return extractor_salt
 
-        pseudo_random_key: bytes = hmac.new(
-            extractor_salt, memoryview(
-                source_key_material), self.__hash_algorithm
-        ).digest()
-        return pseudo_random_key
+    def __validate_total_desired_output_length(self, total_desired_output_length_in_bytes: int) -> None:
+
+        # The limit of 255 * digest_size of the hash function is always checked, since the HKDFExpand
+        # of the backend "cryptography" always enforces it, so that both backends reject the same lengths.
+        try:
+            if total_desired_output_length_in_bytes > (255 * self.hash_algorithm_digest_size_in_bytes):
+                raise ValueError(
+                    f"Cannot expand more than the limit i.e. {
+                        255*self.hash_algorithm_digest_size_in_bytes} bytes for the chosen hash function."
+                )
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
 
     def hkdf_expand(
         self,
@@ -120,50 +252,485 @@ class Hkdf:
         The output of the total desired length in bytes.
         """
 
-        # Check whether total length of the output is within the acceptable bounds or not.
-        if not IS_PERFORMANCE_BENCHMARKING_DONE:
-            try:
-                if total_desired_output_length_in_bytes > (255 * self.hash_algorithm_digest_size_in_bytes):
-                    raise ValueError(
-                        f"Cannot expand more than the limit i.e. {
-                            255*self.hash_algorithm_digest_size_in_bytes} bytes for the chosen hash function."
-                    )
-            except ValueError as e:
-                print(f"ValueError: {e}")
-                raise
+        self.__validate_total_desired_output_length(total_desired_output_length_in_bytes)
 
-        # Compute the parameter t = ceil(L/k) according to Page 13 of the downloaded
-        # pdf (which is Page 11) of [1].
+        if self.hkdf_backend == "cryptography":
+            return HKDFExpand(self.__cryptography_hash_algorithm, total_desired_output_length_in_bytes, info_parameter).derive(
+                bytes(pseudo_random_key))
 
-        number_of_blocks_needed: int = ceil(
-            total_desired_output_length_in_bytes/self.hash_algorithm_digest_size_in_bytes)
+        # The output is written block by block into one preallocated buffer instead of
+        # concatenating the output blocks one after the other.
+        generated_output = bytearray(total_desired_output_length_in_bytes)
+        self.hkdf_expand_into(
+            pseudo_random_key, info_parameter, memoryview(generated_output))
 
-        generated_output: bytes = b""
-        each_output_block: bytes = b""
+        return bytes(generated_output)
+
+    def hkdf_expand_into(
+        self,
+        pseudo_random_key: Union[bytes, bytearray, memoryview],
+        info_parameter: Union[bytes, None],
+        output_buffer: memoryview
+    ) -> None:
+        """
+        This is the Hkdf expand step which writes its output directly into a buffer
+        provided by the caller instead of returning a new bytes object. The total
+        desired length of the output is the length of the provided buffer.
+
+        Parameters
+        ----------
+
+        pseudo_random_key : bytes or bytearray or memoryview
+
+        info_parameter : bytes or None
+
+        output_buffer : memoryview
+                        A writable buffer whose length is the total desired length of the
+                        output in bytes. It has the same limit of 255 * digest_size of the
+                        hash function as in hkdf_expand().
+
+        Returns
+        -------
+        This method does not return any value.
+        """
+
+        # Check whether total length of the output is within the acceptable bounds or not.
+        self.__validate_total_desired_output_length(len(output_buffer))
+
+        if self.hkdf_backend == "cryptography":
+            output_buffer[:] = HKDFExpand(self.__cryptography_hash_algorithm, len(output_buffer), info_parameter).derive(
+                bytes(pseudo_random_key))
+            return
 
         if info_parameter is None:
             info_parameter = b""
 
+        # The HMAC object is keyed with the PRK only once for the whole expand step and
+        # then copied for each output block instead of being keyed again for every block.
+        # The key of an HMAC object must be bytes and not a memoryview.
+        hmac_keyed_with_pseudo_random_key = hmac.new(
+            bytes(pseudo_random_key), None, self.__hash_algorithm)
+
+        self.__expand_into_with_keyed_hmac(
+            hmac_keyed_with_pseudo_random_key, info_parameter, output_buffer)
+
+    def hkdf_expand_for_multiple_info_parameters(
+        self,
+        pseudo_random_key: Union[bytes, bytearray, memoryview],
+        list_of_info_parameters: list[bytes],
+        desired_output_length_for_each_info_parameter_in_bytes: int
+    ) -> bytes:
+        """
+        This is the Hkdf expand step for deriving multiple context-separated outputs
+        (for e.g. one for each service or tenant) from the same pseudo_random_key (PRK)
+        in a single call. The HMAC object keyed with the PRK is shared by all the info
+        parameters and all the outputs are written into one contiguous buffer.
+
+        Parameters
+        ----------
+
+        pseudo_random_key : bytes or bytearray or memoryview
+
+        list_of_info_parameters : list[bytes]
+                                  Each info parameter is the label of one context.
+
+        desired_output_length_for_each_info_parameter_in_bytes : int
+                                                                 It has the same bounds as the total desired
+                                                                 length of the output in hkdf_expand().
+
+        Returns
+        -------
+        One contiguous buffer of all the outputs in bytes, where the i-th output of length
+        desired_output_length_for_each_info_parameter_in_bytes is the same as the output
+        of hkdf_expand() with the i-th info parameter.
+        """
+
+        self.__validate_total_desired_output_length(desired_output_length_for_each_info_parameter_in_bytes)
+
+        if self.hkdf_backend == "cryptography":
+            return b"".join(HKDFExpand(self.__cryptography_hash_algorithm, desired_output_length_for_each_info_parameter_in_bytes,
+                                       info_parameter).derive(bytes(pseudo_random_key)) for info_parameter in list_of_info_parameters)
+
+        hmac_keyed_with_pseudo_random_key = hmac.new(
+            bytes(pseudo_random_key), None, self.__hash_algorithm)
+
+        all_outputs_from_hkdf = bytearray(
+            len(list_of_info_parameters) * desired_output_length_for_each_info_parameter_in_bytes)
+        view_of_all_outputs_from_hkdf = memoryview(all_outputs_from_hkdf)
+        for i, info_parameter in enumerate(list_of_info_parameters):
+            start_of_each_output: int = i * desired_output_length_for_each_info_parameter_in_bytes
+            self.__expand_into_with_keyed_hmac(hmac_keyed_with_pseudo_random_key, info_parameter, view_of_all_outputs_from_hkdf[
+                start_of_each_output:start_of_each_output + desired_output_length_for_each_info_parameter_in_bytes])
+
+        return bytes(all_outputs_from_hkdf)
+
+    def __expand_into_with_keyed_hmac(
+        self,
+        hmac_keyed_with_pseudo_random_key,
+        info_parameter: bytes,
+        output_buffer: memoryview
+    ) -> None:
+
+        total_desired_output_length_in_bytes: int = len(output_buffer)
+
         # This is the computation of the parameter K(1) = HMAC(PRK, k(0) || CTXinfo ∥ 0)
         # ...K(i+1) = HMAC(PRK, K(i) ∥ CTXinfo ∥ i) ... and onwards, where ∥ denotes
         # concatenation according to Page 13 of the downloaded pdf (which is Page 11)
-        # of [1]. For the first iteration where i = 1, K(0) is a null string, i.e., for
-        # i = 1, in the buffer, the parameter each_output_block will be b"".
-
-        for i in range(1, number_of_blocks_needed+1):
-            each_output_block = hmac.new(
-                pseudo_random_key,
-                memoryview(
-                    each_output_block
-                    + info_parameter
-                    + bytearray((i,))
-                ),
-                self.__hash_algorithm,
-            ).digest()
-            generated_output += each_output_block
-
-        truncated_output_of_desired_length_from_hkdf_after_expansion: bytes = (
-            generated_output[0:total_desired_output_length_in_bytes]
-        )
+        # of [1]. For the first iteration where i = 1, K(0) is a null string. Instead of
+        # concatenating K(i), CTXinfo and i, each of them is fed to the HMAC one after the
+        # other, where K(i) is read back from the output buffer in which it was written.
+
+        digest_size: int = self.hash_algorithm_digest_size_in_bytes
+        start_of_previous_output_block: int = 0
+        for start_of_each_output_block in range(0, total_desired_output_length_in_bytes, digest_size):
+            hmac_for_each_output_block = hmac_keyed_with_pseudo_random_key.copy()
+            hmac_for_each_output_block.update(
+                output_buffer[start_of_previous_output_block:start_of_each_output_block])
+            hmac_for_each_output_block.update(info_parameter)
+            hmac_for_each_output_block.update(
+                bytes((start_of_each_output_block // digest_size + 1,)))
+            each_output_block: bytes = hmac_for_each_output_block.digest()
+
+            # The last output block is truncated if the desired length is not a
+            # multiple of the digest size.
+            end_of_each_output_block: int = min(
+                start_of_each_output_block + digest_size, total_desired_output_length_in_bytes)
+            output_buffer[start_of_each_output_block:end_of_each_output_block] = memoryview(
+                each_output_block)[0:end_of_each_output_block - start_of_each_output_block]
+            start_of_previous_output_block = start_of_each_output_block
+
+    def iter_expand(
+        self,
+        pseudo_random_key: Union[bytes, bytearray, memoryview],
+        info_parameter: Union[bytes, None],
+        length_of_each_output_in_bytes: Union[int, None] = None
+    ) -> Iterator[bytes]:
+        """
+        This is the lazy version of the Hkdf expand step which computes the output
+        blocks only when they are requested instead of computing the total output
+        upfront. The concatenation of all the yielded outputs is the prefix of the
+        output from hkdf_expand() with the same pseudo_random_key and info_parameter.
+        It always runs on the backend "hmac", since the HKDFExpand of the backend
+        "cryptography" can only compute the total output at once.
+
+        Parameters
+        ----------
+
+        pseudo_random_key : bytes or bytearray or memoryview
+
+        info_parameter : bytes or None
+
+        length_of_each_output_in_bytes : int or None
+                                         If it is None, then each output block of length
+                                         hash_algorithm_digest_size_in_bytes is yielded as
+                                         it is. Otherwise, the output blocks are split into
+                                         (cryptographic) keys of this length.
+
+        Returns
+        -------
+        A generator which yields the outputs in bytes until the limit of 255 *
+        digest_size of the hash function is reached. A trailing part which is shorter
+        than length_of_each_output_in_bytes is never yielded.
+        """
+
+        # The arguments are checked at the call site and not only on the first call to next(),
+        # so this method is not a generator itself but returns the generator of the outputs.
+        try:
+            if length_of_each_output_in_bytes is not None and length_of_each_output_in_bytes <= 0:
+                raise ValueError(
+                    f"The length of each output must be a positive integer, whereas {length_of_each_output_in_bytes} is provided.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+
+        if info_parameter is None:
+            info_parameter = b""
+
+        hmac_keyed_with_pseudo_random_key = hmac.new(
+            bytes(pseudo_random_key), None, self.__hash_algorithm)
+
+        return self.__iter_expand_with_keyed_hmac(
+            hmac_keyed_with_pseudo_random_key, info_parameter, length_of_each_output_in_bytes)
+
+    def __iter_expand_with_keyed_hmac(
+        self,
+        hmac_keyed_with_pseudo_random_key,
+        info_parameter: bytes,
+        length_of_each_output_in_bytes: Union[int, None]
+    ) -> Iterator[bytes]:
+
+        # The output blocks which have not yet been yielded as complete keys.
+        pending_output = bytearray()
+        each_output_block: bytes = b""
+
+        for i in range(1, 256):
+            hmac_for_each_output_block = hmac_keyed_with_pseudo_random_key.copy()
+            hmac_for_each_output_block.update(each_output_block)
+            hmac_for_each_output_block.update(info_parameter)
+            hmac_for_each_output_block.update(bytes((i,)))
+            each_output_block = hmac_for_each_output_block.digest()
+
+            if length_of_each_output_in_bytes is None:
+                yield each_output_block
+                continue
+
+            pending_output += each_output_block
+            while len(pending_output) >= length_of_each_output_in_bytes:
+                yield bytes(pending_output[0:length_of_each_output_in_bytes])
+                del pending_output[0:length_of_each_output_in_bytes]
+
+    def derive(
+        self,
+        source_key_material: bytes,
+        extractor_salt: Union[bytes, None],
+        info_parameter: Union[bytes, None],
+        total_desired_output_length_in_bytes: int
+    ) -> bytes:
+        """
+        This runs the Hkdf extract and the Hkdf expand steps together and is
+        equivalent to hkdf_expand(hkdf_extract(extractor_salt, source_key_material),
+        info_parameter, total_desired_output_length_in_bytes).
+
+        Parameters
+        ----------
+
+        source_key_material : bytes
+
+        extractor_salt : bytes or None
+                         It has the same bounds as in hkdf_extract().
+
+        info_parameter : bytes or None
+
+        total_desired_output_length_in_bytes : int
+                                               It has the same bounds as in hkdf_expand().
+
+        Returns
+        -------
+        The output of the total desired length in bytes.
+        """
+
+        # When the output fits into one output block, only the PRK and K(1) are computed.
+        if 0 < total_desired_output_length_in_bytes <= self.hash_algorithm_digest_size_in_bytes:
+            extractor_salt = self.__resolve_extractor_salt(extractor_salt)
+
+            if info_parameter is None:
+                info_parameter = b""
+
+            if self.hkdf_backend == "cryptography":
+                return HKDF(self.__cryptography_hash_algorithm, total_desired_output_length_in_bytes,
+                            extractor_salt, info_parameter).derive(bytes(source_key_material))
+
+            # PRK = HMAC(XTS, SKM) and K(1) = HMAC(PRK, CTXinfo ∥ 1) according to Page 13 of
+            # the downloaded pdf (which is Page 11) of [1].
+            pseudo_random_key: bytes = hmac.digest(
+                extractor_salt, source_key_material, self.__hash_algorithm)
+            return hmac.digest(
+                pseudo_random_key, info_parameter + b"\x01", self.__hash_algorithm)[0:total_desired_output_length_in_bytes]
+
+        # When the output fits into two output blocks, which is always the case for the
+        # key chain, the fast path without any HMAC objects is taken.
+        if total_desired_output_length_in_bytes <= 2 * self.hash_algorithm_digest_size_in_bytes:
+            first_output_block, second_output_block = self.derive_two_output_blocks(
+                source_key_material, extractor_salt, info_parameter)
+            return (first_output_block + second_output_block)[0:total_desired_output_length_in_bytes]
+
+        return self.hkdf_expand(self.hkdf_extract(extractor_salt, source_key_material), info_parameter, total_desired_output_length_in_bytes)
+
+    def derive_two_output_blocks(
+        self,
+        source_key_material: bytes,
+        extractor_salt: Union[bytes, None] = None,
+        info_parameter: Union[bytes, None] = None
+    ) -> Tuple[bytes, bytes]:
+        """
+        This is the specialized version of derive() for an output of exactly two
+        output blocks K(1) and K(2) of the expand step, each of which is of length
+        hash_algorithm_digest_size_in_bytes. Each HMAC is computed with the one-shot
+        hmac.digest() which runs entirely within OpenSSL for the OpenSSL backed hash
+        functions, without creating any HMAC object in Python.
+
+        Parameters
+        ----------
+
+        source_key_material : bytes
+
+        extractor_salt : bytes or None
+                         It has the same bounds as in hkdf_extract().
+
+        info_parameter : bytes or None
+
+        Returns
+        -------
+        A tuple of (first_output_block, second_output_block) both in bytes.
+        """
+
+        extractor_salt = self.__resolve_extractor_salt(extractor_salt)
+
+        if info_parameter is None:
+            info_parameter = b""
+
+        if self.hkdf_backend == "cryptography":
+            total_output_from_hkdf: bytes = HKDF(self.__cryptography_hash_algorithm, 2 * self.hash_algorithm_digest_size_in_bytes,
+                                                 extractor_salt, info_parameter).derive(bytes(source_key_material))
+            return (total_output_from_hkdf[0:self.hash_algorithm_digest_size_in_bytes],
+                    total_output_from_hkdf[self.hash_algorithm_digest_size_in_bytes:])
+
+        # PRK = HMAC(XTS, SKM), K(1) = HMAC(PRK, CTXinfo ∥ 1) and K(2) = HMAC(PRK, K(1) ∥ CTXinfo ∥ 2)
+        # according to Page 13 of the downloaded pdf (which is Page 11) of [1].
+        pseudo_random_key: bytes = hmac.digest(
+            extractor_salt, source_key_material, self.__hash_algorithm)
+        first_output_block: bytes = hmac.digest(
+            pseudo_random_key, info_parameter + b"\x01", self.__hash_algorithm)
+        second_output_block: bytes = hmac.digest(
+            pseudo_random_key, first_output_block + info_parameter + b"\x02", self.__hash_algorithm)
+
+        return (first_output_block, second_output_block)
+
+    def hkdf_extract_many(
+        self,
+        extractor_salt: Union[bytes, None],
+        source_key_materials: Union[list[bytes], bytes, bytearray, memoryview],
+        length_of_each_source_key_material: Union[int, None] = None
+    ) -> bytes:
+        """
+        This is the batched version of the Hkdf extract step which generates
+        one pseudorandom key for each of the provided source keying materials
+        with the same salt parameter.
+
+        Parameters
+        ----------
+
+        extractor_salt : bytes or None
+                         The same salt is used for all the source keying materials
+                         and it has the same bounds as in hkdf_extract().
+
+        source_key_materials : list[bytes] or bytes or bytearray or memoryview
+                               Either a list of source keying materials or one contiguous
+                               buffer of fixed-width records, each of which is one source
+                               keying material.
+
+        length_of_each_source_key_material : int or None
+                                             The width of each record in bytes. This is only
+                                             required when source_key_materials is a contiguous
+                                             buffer.
+
+        Returns
+        -------
+        One contiguous buffer of all the Pseudo Random Keys (PRKs) in bytes, where the
+        i-th PRK of length hash_algorithm_digest_size_in_bytes is generated from the
+        i-th source keying material.
+        """
+
+        if self.hkdf_backend == "cryptography":
+            extractor_salt = self.__resolve_extractor_salt(extractor_salt)
+            list_of_pseudo_random_keys_from_cryptography: list[bytes] = []
+            for source_key_material in get_fixed_width_records(source_key_materials, length_of_each_source_key_material):
+                hmac_for_each_source_key_material = cryptography_hmac.HMAC(
+                    extractor_salt, self.__cryptography_hash_algorithm)
+                hmac_for_each_source_key_material.update(bytes(source_key_material))
+                list_of_pseudo_random_keys_from_cryptography.append(
+                    hmac_for_each_source_key_material.finalize())
+            return b"".join(list_of_pseudo_random_keys_from_cryptography)
+
+        if extractor_salt is None:
+            hmac_keyed_with_extractor_salt = self.__hmac_keyed_with_default_salt
+        else:
+            hmac_keyed_with_extractor_salt = hmac.new(
+                self.__resolve_extractor_salt(extractor_salt), None, self.__hash_algorithm)
+
+        # The HMAC object keyed with the salt is shared by all the source keying materials
+        # and it is only copied for each one of them.
+        list_of_pseudo_random_keys: list[bytes] = []
+        for source_key_material in get_fixed_width_records(source_key_materials, length_of_each_source_key_material):
+            hmac_for_each_source_key_material = hmac_keyed_with_extractor_salt.copy()
+            hmac_for_each_source_key_material.update(source_key_material)
+            list_of_pseudo_random_keys.append(
+                hmac_for_each_source_key_material.digest())
+
+        return b"".join(list_of_pseudo_random_keys)
+
+    def hkdf_expand_many(
+        self,
+        pseudo_random_keys: Union[list[bytes], bytes, bytearray, memoryview],
+        info_parameter: Union[bytes, None],
+        total_desired_output_length_in_bytes: int
+    ) -> bytes:
+        """
+        This is the batched version of the Hkdf expand step which generates an
+        output of the same desired length for each of the provided pseudo random
+        keys with the same info parameter.
+
+        Parameters
+        ----------
+
+        pseudo_random_keys : list[bytes] or bytes or bytearray or memoryview
+                             Either a list of pseudo random keys or one contiguous buffer of
+                             them as it is returned by hkdf_extract_many(), where each record
+                             is of length hash_algorithm_digest_size_in_bytes.
+
+        info_parameter : bytes or None
+
+        total_desired_output_length_in_bytes : int
+                                               The total desired length of the output in bytes for
+                                               each pseudo random key. It has the same bounds as in
+                                               hkdf_expand().
+
+        Returns
+        -------
+        One contiguous buffer of all the outputs in bytes, where the i-th output of length
+        total_desired_output_length_in_bytes is generated from the i-th pseudo random key.
+        """
+
+        self.__validate_total_desired_output_length(total_desired_output_length_in_bytes)
+
+        # All the outputs are written into one preallocated buffer, where the i-th
+        # output occupies the i-th record of length total_desired_output_length_in_bytes,
+        # by hkdf_expand_into() on the chosen backend.
+        list_of_pseudo_random_keys = list(get_fixed_width_records(
+            pseudo_random_keys, self.hash_algorithm_digest_size_in_bytes))
+        all_outputs_from_hkdf = bytearray(
+            len(list_of_pseudo_random_keys) * total_desired_output_length_in_bytes)
+        view_of_all_outputs_from_hkdf = memoryview(all_outputs_from_hkdf)
+        for i, pseudo_random_key in enumerate(list_of_pseudo_random_keys):
+            start_of_each_output: int = i * total_desired_output_length_in_bytes
+            self.hkdf_expand_into(pseudo_random_key, info_parameter, view_of_all_outputs_from_hkdf[
+                                  start_of_each_output:start_of_each_output + total_desired_output_length_in_bytes])
+
+        return bytes(all_outputs_from_hkdf)
+
+
+def get_fixed_width_records(
+    records: Union[list[bytes], bytes, bytearray, memoryview],
+    length_of_each_record: Union[int, None]
+) -> Iterable[Union[bytes, memoryview]]:
+    """
+    Returns the individual records of either a list of records or one
+    contiguous buffer of fixed-width records without copying them.
+
+    Parameters
+    ----------
+
+    records : list[bytes] or bytes or bytearray or memoryview
+
+    length_of_each_record : int or None
+                            The width of each record in bytes which is only
+                            required when records is a contiguous buffer.
+
+    Returns
+    -------
+    An iterable over the individual records.
+    """
+
+    if isinstance(records, list):
+        return records
+
+    if length_of_each_record is None or length_of_each_record <= 0:
+        raise ValueError(
+            "The length of each record must be provided as a positive integer for a contiguous buffer of records.")
+
+    buffer_of_records = memoryview(records)
+    if len(buffer_of_records) % length_of_each_record != 0:
+        raise ValueError(f"The length of the buffer of records is {len(buffer_of_records)} bytes, which is not a multiple of {
+                         length_of_each_record} bytes.")
 
-        return truncated_output_of_desired_length_from_hkdf_after_expansion
+    return (buffer_of_records[i:i+length_of_each_record] for i in range(0, len(buffer_of_records), length_of_each_record))
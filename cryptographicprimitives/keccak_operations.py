@@ -0,0 +1,181 @@
+"""
+SHAKE128 and SHAKE256 are the Extendable Output Functions (XOFs) of the SHA-3 family which are based on the sponge
+construction with the Keccak-f[1600] permutation on a state of 25 64-bit lanes [1]. This is an in-tree implementation
+which computes SHAKE128 or SHAKE256 for many independent messages at once, where the N Keccak states are kept as an
+array of dtype uint64 (with the 25 lanes of all the N states as its rows), so that every step of the permutation runs
+on all the N states at once.
+It is bit-compatible with shake_128(message).digest(n) and shake_256(message).digest(n) of hashlib.
+
+This is based on the academic work:
+
+[1] Dworkin, Morris J. "SHA-3 Standard: Permutation-Based Hash and Extendable-Output Functions." Federal Information
+Processing Standards (NIST FIPS) 202 (2015).
+https://doi.org/10.6028/NIST.FIPS.202
+"""
+
+from typing import Tuple
+import numpy
+
+KECCAK_NUMBER_OF_LANES: int = 25
+KECCAK_LANE_SIZE_IN_BYTES: int = 8
+
+# The round constants of the 24 rounds of the Keccak-f[1600] permutation for the step ι [1].
+KECCAK_ROUND_CONSTANTS: Tuple[numpy.uint64, ...] = tuple(numpy.uint64(round_constant) for round_constant in (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+))
+
+# The rotation offsets of the step ρ for the lane (x, y) at the index x + 5y [1].
+KECCAK_ROTATION_OFFSETS: Tuple[int, ...] = (
+    0, 1, 62, 28, 27,
+    36, 44, 6, 55, 20,
+    3, 10, 43, 25, 39,
+    41, 45, 15, 21, 8,
+    18, 2, 61, 56, 14,
+)
+
+# The lane (x, y) is moved to the lane (y, 2x + 3y) by the step π [1], i.e., the index x + 5y is
+# moved to the index y + 5 * ((2x + 3y) % 5).
+KECCAK_INDICES_AFTER_PI: Tuple[int, ...] = tuple(
+    y + 5 * ((2 * x + 3 * y) % 5) for y in range(5) for x in range(5))
+
+# The rotation of the step ρ to the left by r bits is computed as (lane << r) | (lane >> (64 - r)),
+# where the left shifts of the uint64 lanes already discard the bits beyond the 64-bit lane.
+KECCAK_SHIFTS_FOR_RHO: Tuple[Tuple[numpy.uint64, numpy.uint64], ...] = tuple(
+    (numpy.uint64(rotation_offset), numpy.uint64(64 - rotation_offset)) for rotation_offset in KECCAK_ROTATION_OFFSETS)
+
+# This dictionary maps the Shake based Xofs to their respective rates in bytes [1].
+
+# The {key : value} pair is respectively {xof_name : rate_in_bytes}.
+SHAKE_RATES_IN_BYTES: dict[str, int] = {
+    "shake_128": 168,
+    "shake_256": 136,
+}
+
+# The domain separation bits "1111" of SHAKE together with the first bit of the padding pad10*1 [1].
+SHAKE_DOMAIN_SEPARATION_AND_PADDING_BYTE: int = 0x1F
+
+
+def keccak_f1600_many(lanes: numpy.ndarray) -> None:
+    """
+    Applies the 24 rounds of the Keccak-f[1600] permutation [1] to N independent
+    states at once. The lanes are updated in place.
+
+    Parameter
+    ---------
+
+    lanes : numpy.ndarray
+            The 25 lanes of the N Keccak states as an array of dtype uint64 and of
+            shape (25, N), i.e., the transpose of the N states, where the lane (x, y)
+            of all the states is the row x + 5y. This keeps each lane of all the
+            states contiguous in memory for the vectorized steps.
+
+    Returns
+    -------
+    None
+    """
+    one = numpy.uint64(1)
+    sixty_three = numpy.uint64(63)
+    lanes_after_pi = numpy.empty_like(lanes)
+    lanes_by_row = lanes.reshape(5, 5, -1)
+    lanes_after_pi_by_row = lanes_after_pi.reshape(5, 5, -1)
+    for round_constant in KECCAK_ROUND_CONSTANTS:
+        # Step θ
+        column_parities = lanes[0:5] ^ lanes[5:10] ^ lanes[10:15] ^ lanes[15:20] ^ lanes[20:25]
+        for x in range(5):
+            column_parity = column_parities[(x + 1) % 5]
+            lanes_by_row[:, x] ^= column_parities[(x - 1) % 5] ^ (
+                (column_parity << one) | (column_parity >> sixty_three))
+
+        # Steps ρ and π
+        for index, (left_shift, right_shift) in enumerate(KECCAK_SHIFTS_FOR_RHO):
+            if left_shift:
+                lanes_after_pi[KECCAK_INDICES_AFTER_PI[index]] = (
+                    lanes[index] << left_shift) | (lanes[index] >> right_shift)
+            else:
+                lanes_after_pi[KECCAK_INDICES_AFTER_PI[index]] = lanes[index]
+
+        # Step χ
+        for x in range(5):
+            numpy.bitwise_xor(lanes_after_pi_by_row[:, x], ~lanes_after_pi_by_row[:, (x + 1) % 5]
+                              & lanes_after_pi_by_row[:, (x + 2) % 5], out=lanes_by_row[:, x])
+
+        # Step ι
+        lanes[0] ^= round_constant
+
+
+def shake_many(list_of_messages: list[bytes], xof_name: str, length_of_output: int) -> list[bytes]:
+    """
+    Computes the output of SHAKE128 or SHAKE256 [1] of the desired length for many
+    independent messages at once, which is the same as [shake_128(message).digest(
+    length_of_output) for message in list_of_messages] or its SHAKE256 counterpart.
+    The messages of the same length are absorbed and squeezed together with
+    keccak_f1600_many(), so the overhead of the interpreter is shared among all of them.
+
+    Parameters
+    ----------
+
+    list_of_messages : list[bytes]
+
+    xof_name : str
+               This must be either a string "shake_128" or "shake_256".
+
+    length_of_output : int
+                       The desired length of each output in bytes.
+
+    Returns
+    -------
+    A list of the outputs of the Xof in bytes of the desired length in the same
+    order as the messages.
+    """
+    rate_in_bytes: int = SHAKE_RATES_IN_BYTES[xof_name]
+    number_of_lanes_in_the_rate: int = rate_in_bytes // KECCAK_LANE_SIZE_IN_BYTES
+    number_of_blocks_of_the_output: int = -(-length_of_output // rate_in_bytes)
+    list_of_outputs: list[bytes] = [b""] * len(list_of_messages)
+
+    # The {key : value} pair is respectively {length_of_message : indices_of_the_messages}.
+    indices_of_the_messages_for_each_length: dict[int, list[int]] = {}
+    for index, message in enumerate(list_of_messages):
+        indices_of_the_messages_for_each_length.setdefault(
+            len(message), []).append(index)
+
+    for length_of_message, indices_of_the_messages in indices_of_the_messages_for_each_length.items():
+        number_of_messages: int = len(indices_of_the_messages)
+
+        # The padding of SHAKE up to a multiple of the rate, where the last bit of the
+        # padding pad10*1 lands in the same byte as the domain separation bits when
+        # only one byte of padding is needed.
+        padding = bytearray(rate_in_bytes - length_of_message % rate_in_bytes)
+        padding[0] = SHAKE_DOMAIN_SEPARATION_AND_PADDING_BYTE
+        padding[-1] |= 0x80
+        blocks_of_the_padded_messages: numpy.ndarray = numpy.frombuffer(
+            b"".join(list_of_messages[index] + padding for index in indices_of_the_messages),
+            dtype="<u8").reshape(number_of_messages, -1, number_of_lanes_in_the_rate).astype(numpy.uint64)
+
+        lanes = numpy.zeros(
+            (KECCAK_NUMBER_OF_LANES, number_of_messages), dtype=numpy.uint64)
+
+        # Absorbing
+        for block in range(blocks_of_the_padded_messages.shape[1]):
+            lanes[:number_of_lanes_in_the_rate] ^= blocks_of_the_padded_messages[:, block].T
+            keccak_f1600_many(lanes)
+
+        # Squeezing into one array for the outputs of all the messages
+        output_blocks = numpy.empty(
+            (number_of_messages, number_of_blocks_of_the_output, number_of_lanes_in_the_rate), dtype="<u8")
+        for block in range(number_of_blocks_of_the_output):
+            output_blocks[:, block] = lanes[:number_of_lanes_in_the_rate].T
+            if block + 1 < number_of_blocks_of_the_output:
+                keccak_f1600_many(lanes)
+
+        outputs: bytes = output_blocks.tobytes()
+        length_of_each_output_block: int = number_of_blocks_of_the_output * rate_in_bytes
+        for position, index in enumerate(indices_of_the_messages):
+            start: int = position * length_of_each_output_block
+            list_of_outputs[index] = outputs[start: start + length_of_output]
+
+    return list_of_outputs
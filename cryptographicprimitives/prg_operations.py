@@ -7,20 +7,296 @@ This is based on the academic work:
 [1] Barak, Boaz, and Shai Halevi. "A model and architecture for pseudo-random generation with applications to/dev/random."
 Proceedings of the 12th ACM conference on Computer and communications security. 2005.
 https://eprint.iacr.org/2005/029.pdf
+
+[2] https://cryptography.io/en/latest/hazmat/primitives/symmetric-encryption/
+
+[3] Nir, Yoav, and Adam Langley. "ChaCha20 and Poly1305 for IETF Protocols." RFC 8439 (2018).
+https://www.rfc-editor.org/rfc/rfc8439
 """
 
-from Crypto.Cipher import AES
-from Crypto.Cipher.AES import MODE_CTR
-from Crypto.Util import Counter
-from typing import Tuple
-from .utils import xor_bytes
+from Crypto.Cipher import AES, ChaCha20
+from Crypto.Cipher.AES import MODE_ECB
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from timeit import timeit
+from typing import Tuple, Union
+import numpy
+from .utils import xor_bytes, xor_bytes_many
 
 NONCE_FOR_PRG_NEXT: bytes = b'\x96' + b'\n' * 11
 NONCE_FOR_PRG_REFRESH: bytes = b'\x96' + b'\r' * 11
+AES_BLOCK_SIZE: int = 16
+
+# The registry of the stream ciphers which the Prg can use as the length-doubling generator. The
+# stream cipher "aes" is AES in CTR mode as mentioned in Page 12 of [1] and the stream cipher
+# "chacha20" is the ChaCha20 of [3], which is faster than AES on hosts without AES acceleration.
+PRG_STREAM_CIPHERS: tuple[str, ...] = ("aes", "chacha20")
+
+# ChaCha20 only accepts keys of 32 bytes [3], so the Prg state must be of the same length.
+SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20: int = 32
+
+# The registry of the AES backends on which the Prg can run. The backend "pycryptodome" runs on the
+# AES of the pycryptodome package and the backend "cryptography" runs on the AES of the cryptography
+# package, which is backed by OpenSSL [2].
+PRG_AES_BACKENDS: tuple[str, ...] = ("pycryptodome", "cryptography")
+
+NUMBER_OF_UPDATES_FOR_SELECTING_THE_PRG_AES_BACKEND: int = 500
+
+# The {key : value} pair is respectively {security_parameter_lambda : fastest_prg_aes_backend}.
+fastest_prg_aes_backend_for_security_parameter_lambda: dict[int, str] = {}
+
+# The {key : value} pair is respectively {(nonce, number_of_counter_blocks) : counter_blocks}.
+precomputed_counter_blocks: dict[Tuple[bytes, int], bytes] = {}
+
+
+def get_precomputed_counter_blocks(nonce: bytes, length_of_the_keystream_in_bytes: int) -> bytes:
+    """
+    Returns the concatenation of the counter blocks (nonce ∥ counter) with a counter of
+    4 bytes (32 bits) starting from 0, which are needed to generate a keystream of the
+    given length with AES in CTR mode. These counter blocks only depend on the nonce and
+    the length, so they are computed only once and are reused afterwards.
+
+    Parameters
+    ----------
+
+    nonce : bytes
+            The nonce of length 12 bytes.
+
+    length_of_the_keystream_in_bytes : int
+
+    Returns
+    -------
+    The concatenated counter blocks in bytes.
+    """
+
+    number_of_counter_blocks: int = (
+        length_of_the_keystream_in_bytes + AES_BLOCK_SIZE - 1) // AES_BLOCK_SIZE
+    if (nonce, number_of_counter_blocks) not in precomputed_counter_blocks:
+        precomputed_counter_blocks[(nonce, number_of_counter_blocks)] = b"".join(
+            nonce + counter.to_bytes(4, "big") for counter in range(number_of_counter_blocks))
+    return precomputed_counter_blocks[(nonce, number_of_counter_blocks)]
+
+
+class PrecomputedCounterAesEngine:
+    def __init__(self, security_parameter_lambda: int) -> None:
+        """
+        Creates an engine which generates the same keystream as AES in CTR mode with the
+        nonces NONCE_FOR_PRG_REFRESH and NONCE_FOR_PRG_NEXT and a counter starting from 0,
+        but without setting up a counter and a CTR mode context for every call. Since the
+        plaintext is all "0s", the keystream is AES-ECB of the constant counter blocks,
+        which are precomputed once for the security parameter λ.
+
+        Parameter
+        ---------
+        security_parameter_lambda : int
+                                    The security parameter lambda in bytes.
+
+        Returns
+        -------
+        None
+        """
+        self.__security_parameter_lambda = security_parameter_lambda
+
+        # Only the first λ bytes of the keystream are kept during refreshing, so only the
+        # counter blocks for these λ bytes are encrypted instead of those for 2λ bytes.
+        self.__counter_blocks_for_prg_refresh: bytes = get_precomputed_counter_blocks(
+            NONCE_FOR_PRG_REFRESH, self.__security_parameter_lambda)
+        self.__counter_blocks_for_prg_next: bytes = get_precomputed_counter_blocks(
+            NONCE_FOR_PRG_NEXT, 2 * self.__security_parameter_lambda)
+
+    def keystream_for_prg_refresh(self, input_key: bytes) -> bytes:
+        """
+        Returns the first λ bytes of the keystream of AES in CTR mode with the
+        nonce NONCE_FOR_PRG_REFRESH under the input_key.
+        """
+        return AES.new(input_key, MODE_ECB).encrypt(self.__counter_blocks_for_prg_refresh)[0: self.__security_parameter_lambda]
+
+    def keystream_for_prg_refresh_and_next(self, input_key_for_prg_refresh: bytes) -> bytearray:
+        """
+        Returns the first 2λ bytes of the keystream of AES in CTR mode with the nonce
+        NONCE_FOR_PRG_NEXT under the key which is itself the first λ bytes of the
+        keystream of AES in CTR mode with the nonce NONCE_FOR_PRG_REFRESH under the
+        input_key_for_prg_refresh. The output is written directly into a new buffer.
+        """
+        refreshed_prg_state: bytes = AES.new(input_key_for_prg_refresh, MODE_ECB).encrypt(
+            self.__counter_blocks_for_prg_refresh)[0: self.__security_parameter_lambda]
+        pseudorandom_output = bytearray(len(self.__counter_blocks_for_prg_next))
+        AES.new(refreshed_prg_state, MODE_ECB).encrypt(
+            self.__counter_blocks_for_prg_next, output=pseudorandom_output)
+        return pseudorandom_output
+
+    def keystream_for_prg_next(self, input_key: bytes) -> bytes:
+        """
+        Returns the first 2λ bytes of the keystream of AES in CTR mode with the
+        nonce NONCE_FOR_PRG_NEXT under the input_key.
+        """
+        return AES.new(input_key, MODE_ECB).encrypt(self.__counter_blocks_for_prg_next)[0: 2 * self.__security_parameter_lambda]
+
+
+class CryptographyAesEngine:
+    def __init__(self, security_parameter_lambda: int) -> None:
+        """
+        Creates an engine which generates the same keystream as PrecomputedCounterAesEngine,
+        but on the AES of the cryptography package [2]. The keystream is written with
+        update_into() into a buffer which is preallocated once and reused for every call.
+
+        Parameter
+        ---------
+        security_parameter_lambda : int
+                                    The security parameter lambda in bytes.
+
+        Returns
+        -------
+        None
+        """
+        self.__security_parameter_lambda = security_parameter_lambda
+        self.__counter_blocks_for_prg_refresh: bytes = get_precomputed_counter_blocks(
+            NONCE_FOR_PRG_REFRESH, self.__security_parameter_lambda)
+        self.__counter_blocks_for_prg_next: bytes = get_precomputed_counter_blocks(
+            NONCE_FOR_PRG_NEXT, 2 * self.__security_parameter_lambda)
+
+        # The method update_into() requires the output buffer to be at least
+        # (AES_BLOCK_SIZE - 1) bytes longer than the input [2].
+        self.__keystream_buffer = bytearray(
+            len(self.__counter_blocks_for_prg_next) + AES_BLOCK_SIZE - 1)
+
+    def __encrypt_counter_blocks_into(self, input_key: bytes, counter_blocks: bytes, output_buffer: bytearray) -> None:
+        Cipher(algorithms.AES(input_key), modes.ECB()).encryptor().update_into(
+            counter_blocks, output_buffer)
+
+    def keystream_for_prg_refresh(self, input_key: bytes) -> bytes:
+        """
+        Returns the first λ bytes of the keystream of AES in CTR mode with the
+        nonce NONCE_FOR_PRG_REFRESH under the input_key.
+        """
+        self.__encrypt_counter_blocks_into(
+            input_key, self.__counter_blocks_for_prg_refresh, self.__keystream_buffer)
+        return bytes(self.__keystream_buffer[0: self.__security_parameter_lambda])
+
+    def keystream_for_prg_refresh_and_next(self, input_key_for_prg_refresh: bytes) -> bytearray:
+        """
+        Returns the first 2λ bytes of the keystream of AES in CTR mode with the nonce
+        NONCE_FOR_PRG_NEXT under the key which is itself the first λ bytes of the
+        keystream of AES in CTR mode with the nonce NONCE_FOR_PRG_REFRESH under the
+        input_key_for_prg_refresh. The output is written directly into a new buffer.
+        """
+        self.__encrypt_counter_blocks_into(
+            input_key_for_prg_refresh, self.__counter_blocks_for_prg_refresh, self.__keystream_buffer)
+
+        # The output is handed out to the caller, so it is written into a new buffer
+        # instead of the reusable one.
+        pseudorandom_output = bytearray(len(self.__keystream_buffer))
+        self.__encrypt_counter_blocks_into(
+            memoryview(self.__keystream_buffer)[0: self.__security_parameter_lambda],
+            self.__counter_blocks_for_prg_next, pseudorandom_output)
+        return pseudorandom_output
+
+    def keystream_for_prg_next(self, input_key: bytes) -> bytes:
+        """
+        Returns the first 2λ bytes of the keystream of AES in CTR mode with the
+        nonce NONCE_FOR_PRG_NEXT under the input_key.
+        """
+        self.__encrypt_counter_blocks_into(
+            input_key, self.__counter_blocks_for_prg_next, self.__keystream_buffer)
+        return bytes(self.__keystream_buffer[0: 2 * self.__security_parameter_lambda])
+
+
+class ChaCha20Engine:
+    def __init__(self, security_parameter_lambda: int) -> None:
+        """
+        Creates an engine which generates the keystream of ChaCha20 [3] with the nonces
+        NONCE_FOR_PRG_REFRESH and NONCE_FOR_PRG_NEXT and a block counter starting from 0,
+        i.e., the same refresh and next structure as with AES in CTR mode.
+
+        Parameter
+        ---------
+        security_parameter_lambda : int
+                                    The security parameter lambda in bytes.
+
+        Returns
+        -------
+        None
+        """
+        self.__security_parameter_lambda = security_parameter_lambda
+        self.__zeroes_for_prg_refresh: bytes = bytes(
+            self.__security_parameter_lambda)
+        self.__zeroes_for_prg_next: bytes = bytes(
+            2 * self.__security_parameter_lambda)
+
+    def keystream_for_prg_refresh(self, input_key: bytes) -> bytes:
+        """
+        Returns the first λ bytes of the keystream of ChaCha20 with the
+        nonce NONCE_FOR_PRG_REFRESH under the input_key.
+        """
+        return ChaCha20.new(key=input_key, nonce=NONCE_FOR_PRG_REFRESH).encrypt(self.__zeroes_for_prg_refresh)
+
+    def keystream_for_prg_refresh_and_next(self, input_key_for_prg_refresh: bytes) -> bytearray:
+        """
+        Returns the first 2λ bytes of the keystream of ChaCha20 with the nonce
+        NONCE_FOR_PRG_NEXT under the key which is itself the first λ bytes of the
+        keystream of ChaCha20 with the nonce NONCE_FOR_PRG_REFRESH under the
+        input_key_for_prg_refresh. The output is written directly into a new buffer.
+        """
+        refreshed_prg_state: bytes = self.keystream_for_prg_refresh(
+            input_key_for_prg_refresh)
+        pseudorandom_output = bytearray(len(self.__zeroes_for_prg_next))
+        ChaCha20.new(key=refreshed_prg_state, nonce=NONCE_FOR_PRG_NEXT).encrypt(
+            self.__zeroes_for_prg_next, output=pseudorandom_output)
+        return pseudorandom_output
+
+    def keystream_for_prg_next(self, input_key: bytes) -> bytes:
+        """
+        Returns the first 2λ bytes of the keystream of ChaCha20 with the
+        nonce NONCE_FOR_PRG_NEXT under the input_key.
+        """
+        return ChaCha20.new(key=input_key, nonce=NONCE_FOR_PRG_NEXT).encrypt(self.__zeroes_for_prg_next)
+
+
+# The {key : value} pair is respectively {prg_aes_backend : aes_engine}.
+AES_ENGINES_FOR_PRG_AES_BACKENDS: dict[str, type] = {
+    "pycryptodome": PrecomputedCounterAesEngine,
+    "cryptography": CryptographyAesEngine,
+}
+
+
+def select_fastest_prg_aes_backend(security_parameter_lambda: int) -> str:
+    """
+    Selects the faster of the backends from PRG_AES_BACKENDS for the given security
+    parameter λ by timing the fused refresh and next of the Prg, which is the same
+    as in a key chain update. The selection is done only once for each security
+    parameter λ and is reused afterwards.
+
+    Parameter
+    ---------
+    security_parameter_lambda : int
+                                The security parameter lambda in bytes.
+
+    Returns
+    -------
+    The name of the fastest backend.
+    """
+    if security_parameter_lambda in fastest_prg_aes_backend_for_security_parameter_lambda:
+        return fastest_prg_aes_backend_for_security_parameter_lambda[security_parameter_lambda]
+
+    prg_state_of_all_zeroes: bytes = bytes(security_parameter_lambda)
+    execution_time_for_each_prg_aes_backend: dict[str, float] = {}
+    for prg_aes_backend in PRG_AES_BACKENDS:
+        prg_obj = Prg(security_parameter_lambda,
+                      prg_state_of_all_zeroes, prg_aes_backend)
+        execution_time_for_each_prg_aes_backend[prg_aes_backend] = timeit(
+            lambda: prg_obj.prg_refresh_and_next(
+                prg_state_of_all_zeroes, prg_state_of_all_zeroes),
+            number=NUMBER_OF_UPDATES_FOR_SELECTING_THE_PRG_AES_BACKEND)
+
+    fastest_prg_aes_backend: str = min(
+        execution_time_for_each_prg_aes_backend, key=execution_time_for_each_prg_aes_backend.__getitem__)
+    fastest_prg_aes_backend_for_security_parameter_lambda[
+        security_parameter_lambda] = fastest_prg_aes_backend
+    return fastest_prg_aes_backend
 
 
 class Prg:
-    def __init__(self, security_parameter_lambda: int, initial_prg_state: bytes) -> None:
+    def __init__(self, security_parameter_lambda: int, initial_prg_state: bytes, prg_aes_backend: Union[str, None] = None,
+                 prg_stream_cipher: str = "aes") -> None:
         """
         Creates an instance of the Prg with the initial Prg state
         of size equal to equal to the security parameter λ.
@@ -35,6 +311,17 @@ class Prg:
                             to λ bytes or λ*8 bits and will comprise of
                             all "0s" [1].
 
+        prg_aes_backend : str or None
+                          The backend from PRG_AES_BACKENDS on which the AES runs.
+                          If it is None, then the faster backend for the security
+                          parameter λ is selected by select_fastest_prg_aes_backend().
+                          It is ignored when the prg_stream_cipher is "chacha20".
+
+        prg_stream_cipher : str
+                            The stream cipher from PRG_STREAM_CIPHERS which is used as the
+                            length-doubling generator. The stream cipher "chacha20" requires
+                            the security parameter λ to be 32 bytes.
+
         Returns
         -------
         None
@@ -42,6 +329,38 @@ class Prg:
         self.__security_parameter_lambda = security_parameter_lambda
         self.__initial_prg_state = initial_prg_state
 
+        try:
+            if prg_stream_cipher not in PRG_STREAM_CIPHERS:
+                raise ValueError(f"Invalid stream cipher {prg_stream_cipher} for the Prg. Choose a stream cipher from {
+                                 PRG_STREAM_CIPHERS}.")
+            if prg_stream_cipher == "chacha20" and self.__security_parameter_lambda != SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20:
+                raise ValueError(f"The security parameter lambda must be {SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20} bytes for the stream cipher {
+                                 prg_stream_cipher}, whereas {self.__security_parameter_lambda} bytes are provided.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        self.prg_stream_cipher: str = prg_stream_cipher
+
+        if self.prg_stream_cipher == "chacha20":
+            self.prg_aes_backend: Union[str, None] = None
+            self.__keystream_engine = ChaCha20Engine(
+                self.__security_parameter_lambda)
+            return
+
+        if prg_aes_backend is None:
+            prg_aes_backend = select_fastest_prg_aes_backend(
+                self.__security_parameter_lambda)
+        try:
+            if prg_aes_backend not in PRG_AES_BACKENDS:
+                raise ValueError(f"Invalid backend {prg_aes_backend} for the Prg. Choose a backend from {
+                                 PRG_AES_BACKENDS}.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        self.prg_aes_backend = prg_aes_backend
+        self.__keystream_engine = AES_ENGINES_FOR_PRG_AES_BACKENDS[self.prg_aes_backend](
+            self.__security_parameter_lambda)
+
     def prg_refresh(
         self, current_prg_state: bytes, extracted_parameter: bytes
     ) -> bytes:
@@ -73,6 +392,66 @@ class Prg:
         )
         return prg_state_after_refreshing
 
+    def prg_refresh_many(
+        self, current_prg_states: Union[bytes, list[bytes], numpy.ndarray], extracted_parameters: Union[list[bytes], numpy.ndarray]
+    ) -> list[bytes]:
+        """
+        Creates a new Prg state for each of the extracted parameters, where the Xor (⊕)
+        of all the current Prg states and the extracted parameters is computed in one
+        vectorized step.
+
+        Parameters
+        ----------
+
+        current_prg_states : bytes, list[bytes] or numpy.ndarray
+                             Either a single Prg state of length equal to the
+                             security_parameter_lambda which is used for all the
+                             extracted parameters, or one Prg state for each of them.
+
+        extracted_parameters : list[bytes] or numpy.ndarray
+                               The extracted parameters each of length equal to the
+                               security_parameter_lambda [1], or an array of dtype
+                               uint8 and of shape (N, security_parameter_lambda).
+
+        Returns
+        -------
+        A list of the Prg states after refreshing in bytes.
+        """
+
+        current_prg_states_xored_with_extracted_parameters: numpy.ndarray = xor_bytes_many(
+            self.__as_array_of_parameters(current_prg_states),
+            self.__as_array_of_parameters(extracted_parameters)
+        )
+
+        return [self.__keystream_engine.keystream_for_prg_refresh(input_key_for_prg_refresh.tobytes())
+                for input_key_for_prg_refresh in current_prg_states_xored_with_extracted_parameters]
+
+    def __as_array_of_parameters(self, parameters: Union[bytes, list[bytes], numpy.ndarray]) -> numpy.ndarray:
+
+        # Every record must be of length λ on its own, since the joined records would otherwise
+        # be silently re-cut across the boundaries of the records.
+        try:
+            if isinstance(parameters, numpy.ndarray):
+                if parameters.ndim not in (1, 2) or parameters.shape[-1] != self.__security_parameter_lambda:
+                    raise ValueError(f"The array of parameters must be of shape (N, {self.__security_parameter_lambda}) or ({
+                                     self.__security_parameter_lambda},), whereas its shape is {parameters.shape}.")
+                return parameters
+            if isinstance(parameters, (bytes, bytearray, memoryview)):
+                list_of_lengths_of_parameters: list[int] = [len(parameters)]
+            else:
+                list_of_lengths_of_parameters = [len(parameter) for parameter in parameters]
+            for length_of_parameter in list_of_lengths_of_parameters:
+                if length_of_parameter != self.__security_parameter_lambda:
+                    raise ValueError(f"Each parameter must be of length {self.__security_parameter_lambda} bytes, whereas {
+                                     length_of_parameter} bytes are provided.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        if isinstance(parameters, (bytes, bytearray, memoryview)):
+            return numpy.frombuffer(parameters, dtype=numpy.uint8)
+        return numpy.frombuffer(b"".join(parameters), dtype=numpy.uint8).reshape(
+            -1, self.__security_parameter_lambda)
+
     def prg_next(self, current_prg_state: bytes) -> Tuple[bytes, bytes]:
         """
         Creates a new Prg state and generates the (random) output.
@@ -91,6 +470,42 @@ class Prg:
 
         return (random_output, new_prg_state)
 
+    def prg_refresh_and_next(
+        self, current_prg_state: bytes, extracted_parameter: bytes
+    ) -> Tuple[memoryview, memoryview]:
+        """
+        Creates a refreshed Prg state and immediately uses it to create a new Prg
+        state and to generate the (random) output. This is equivalent to calling
+        prg_next(prg_refresh(current_prg_state, extracted_parameter)), but without
+        the two method dispatches and without the intermediate refreshed Prg state
+        being returned.
+
+        Parameters
+        ----------
+
+        current_prg_state : bytes
+
+        extracted_parameter : bytes
+                              This parameter is (expected to be) generated from a
+                              randomness extractor which should be of length equal
+                              to the security_parameter_lambda [1].
+
+        Returns
+        -------
+        A tuple of (random_output, new_prg_state) both as memoryviews of the same buffer.
+        """
+
+        # Compute the Xor (⊕) between current_prg_state and extracted_parameter
+        current_prg_state_xored_with_extracted_parameter: bytes = xor_bytes(
+            current_prg_state, extracted_parameter
+        )
+
+        pseudorandom_output = memoryview(self.__keystream_engine.keystream_for_prg_refresh_and_next(
+            current_prg_state_xored_with_extracted_parameter))
+
+        return (pseudorandom_output[0: self.__security_parameter_lambda],
+                pseudorandom_output[self.__security_parameter_lambda: 2 * self.__security_parameter_lambda])
+
     # The method for using the AES in Counter mode as the PRG as mentioned in Page 12 of [1]
     def aes_counter_mode_as_prg_invoked_from_prg_refresh(
         self, input_key: bytes
@@ -116,25 +531,12 @@ class Prg:
         # As for uniqueness, in AES CTR mode, it is a combination of a nonce and a counter value which is of 16-bytes
         # (128 bits) altogether. Thus, we keep the nonce of length 12 bytes and a counter value of length 4 bytes (32 bits).
 
-        nonce: bytes = NONCE_FOR_PRG_REFRESH
-
-        # Generates a counter block function suitable for AES-CTR encryption modes.
-
-        counter_block: dict[str, int | bytes | bool] = Counter.new(
-            32, prefix=nonce, initial_value=0)
-
-        # The plaintext (which is to be encrypted) is just a string of 0's of length equal to twice the
-        # security parameter "λ" because the security of AES in Counter mode relies (with a vast majority)
-        # on the uniqueness of the counter block.
+        # The plaintext (which is to be encrypted) is just a string of 0's because the security of AES in Counter
+        # mode relies (with a vast majority) on the uniqueness of the counter block. So, the pseudorandom output
+        # is just the encryption of the counter blocks, of which only the first λ bytes are kept.
+        # When the prg_stream_cipher is "chacha20", the keystream of ChaCha20 [3] is used instead.
 
-        plaintext: bytes = b"\x00" * \
-            (2 * self.__security_parameter_lambda)
-
-        cipher_context = AES.new(input_key, MODE_CTR, counter=counter_block)
-
-        pseudorandom_output: bytes = cipher_context.encrypt(plaintext)
-
-        return pseudorandom_output[0: self.__security_parameter_lambda]
+        return self.__keystream_engine.keystream_for_prg_refresh(input_key)
 
     # The method for using the AES in Counter mode as the PRG as mentioned in Page 12 of [1]
     def aes_counter_mode_as_prg_invoked_from_prg_next(
@@ -160,23 +562,13 @@ class Prg:
         # As for uniqueness, in AES CTR mode, it is a combination of a nonce and a counter value which is of 16-bytes
         # (128 bits) altogether. Thus, we keep the nonce of length 12 bytes and a counter value of length 4 bytes (32 bits).
 
-        nonce: bytes = NONCE_FOR_PRG_NEXT
-
-        # Generates a counter block function suitable for AES-CTR encryption modes.
-
-        counter_block: dict[str, int | bytes | bool] = Counter.new(
-            32, prefix=nonce, initial_value=0)
-
         # The plaintext (which is to be encrypted) is just a string of 0's of length equal to twice the
         # security parameter "λ" because the security of AES in Counter mode relies (with a vast majority)
-        # on the uniqueness of the counter block.
-
-        plaintext: bytes = b"\x00" * \
-            (2 * self.__security_parameter_lambda)
-
-        cipher_context = AES.new(input_key, MODE_CTR, counter=counter_block)
+        # on the uniqueness of the counter block. So, the pseudorandom output is just the encryption of
+        # the counter blocks. When the prg_stream_cipher is "chacha20", the keystream of ChaCha20 [3] is used instead.
 
-        pseudorandom_output: bytes = cipher_context.encrypt(plaintext)
+        pseudorandom_output: bytes = self.__keystream_engine.keystream_for_prg_next(
+            input_key)
 
         random_output, new_prg_state = pseudorandom_output[
             0: self.__security_parameter_lambda], pseudorandom_output[self.__security_parameter_lambda:]
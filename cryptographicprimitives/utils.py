@@ -6,162 +6,131 @@ IACR Transactions on Symmetric Cryptology 2024.1 (2024): 5-34.
 Proceedings of the 12th ACM conference on Computer and communications security. 2005.
 """
 
-import inspect
-
-
-def check_fulfillment_criteria_of_parameters(
-    xof_name: str = "",
-    seed: bytes = b"",
-    length_of_the_random_output: int = 0,
-    state_size: int = 0,
-    alpha: bytes = b""
-) -> None:
+from typing import Tuple, Union
+import numpy
+
+
+# This dictionary maps the minimum seed length required for
+# instantiation of the Xdrbg based on the respective Xof.
+
+# The {key : value} pair is respectively {xof_name : minimum_seed_length_required_in_bytes}.
+REQUIRED_SEED_LENGTH_FOR_XDRBG_INSTANTIATE: dict[str, int] = {
+    "shake_128": 24,
+    "Ascon-Xof": 24,
+    "Ascon-Xofa": 24,
+    "turboshake_128": 24,
+    "shake_256": 48,
+    "turboshake_256": 48,
+}
+
+# This dictionary maps the minimum seed length required for
+# reseeding the Xdrbg based on the respective Xof.
+
+# The {key : value} pair is respectively {xof_name : minimum_seed_length_required_in_bytes}.
+REQUIRED_SEED_LENGTH_FOR_XDRBG_RESEED: dict[str, int] = {
+    "shake_128": 16,
+    "Ascon-Xof": 16,
+    "Ascon-Xofa": 16,
+    "turboshake_128": 16,
+    "shake_256": 32,
+    "turboshake_256": 32,
+}
+
+# This dictionary maps the maximum (total) output length in bytes i.e. sum
+# of length_of_the_random_output + xdrbg_state_size (in bytes) from a single
+# xdrbg_generate-call based on the respective Xof.
+
+# The {key : value} pair is respectively {xof_name : max_output_bytes_allowed_during_xdrbg_generate_in_bytes}.
+MAX_OUTPUT_BYTES_ALLOWED_DURING_XDRBG_GENERATE: dict[str, int] = {
+    "shake_128": 304,
+    "Ascon-Xof": 256,
+    "Ascon-Xofa": 256,
+    "turboshake_128": 304,
+    "shake_256": 344,
+    "turboshake_256": 344,
+}
+
+# The (optional) alpha parameter can be of at most 84 bytes [1].
+MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES: int = 84
+
+
+def compute_encode_trailer_for_xdrbg(value_N: int, length_of_alpha_in_bytes: int) -> bytes:
     """
-    This method checks whether the parameters to be used when accessing the Xdrbg
-    fulfils certain criteria or not. The parameters with which this method will be
-    invoked will depend on where it is invoked from i.e. xdrbg_instantiate or
-    xdrbg_reseed or xdrbg_generate.
+    Computes the trailer (n*85+|α|/8)_8 of ENCODE(S,α,n) [1].
 
     Parameters
     ----------
+    value_N : int
+
+    length_of_alpha_in_bytes : int
+
+    Returns
+    -------
+    The trailer in bytes.
+    """
+
+    computed_param: int = value_N * 85 + (length_of_alpha_in_bytes * 8) // 8
+
+    # The (computed_param.bit_length() + 7) // 8 is needed to
+    # correctly determine the length required to represent the
+    # parameter (computed_param) in bytes.
+    return computed_param.to_bytes((computed_param.bit_length() + 7) // 8, "big")
+
+
+# This dictionary maps every n of ENCODE(S,α,n) i.e. 0 (instantiate), 1 (reseed) and 2 (generate),
+# and every valid length of α to the trailer (n*85+|α|/8)_8 [1], so that it is not computed on every call.
+
+# The {key : value} pair is respectively {(value_N, length_of_alpha_in_bytes) : trailer}.
+ENCODE_TRAILERS_FOR_XDRBG: dict[Tuple[int, int], bytes] = {
+    (value_N, length_of_alpha_in_bytes): compute_encode_trailer_for_xdrbg(value_N, length_of_alpha_in_bytes)
+    for value_N in range(3) for length_of_alpha_in_bytes in range(MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES + 1)
+}
+
+
+def get_validation_limits_for_xdrbg(xof_name: str) -> Tuple[int, int, int]:
+    """
+    This method resolves the limits which the parameters to be used when accessing
+    the Xdrbg must fulfil. It is meant to be invoked only once when the Xdrbg instance
+    is created, so that xdrbg_instantiate, xdrbg_reseed and xdrbg_generate only need
+    plain integer comparisons to validate their parameters.
+
+    Parameter
+    ---------
 
     xof_name : str
                This name of the Xof with which the Xdrbg was instantiated.
 
-    seed : bytes
-           The seed which is used for either xdrbg_instantiate or
-           xdrbg_reseed.
+    Returns
+    -------
+    A tuple of (minimum_seed_length_for_xdrbg_instantiate, minimum_seed_length_for_xdrbg_reseed,
+    max_output_bytes_allowed_during_xdrbg_generate) all in bytes.
+    """
+    if xof_name not in MAX_OUTPUT_BYTES_ALLOWED_DURING_XDRBG_GENERATE:
+        raise NameError(f"Invalid XOF (name): {xof_name}.")
 
-    length_of_the_random_output : int
-                                  The length (in bytes) of the desired random output.
+    return (REQUIRED_SEED_LENGTH_FOR_XDRBG_INSTANTIATE[xof_name],
+            REQUIRED_SEED_LENGTH_FOR_XDRBG_RESEED[xof_name],
+            MAX_OUTPUT_BYTES_ALLOWED_DURING_XDRBG_GENERATE[xof_name])
 
-    state_size : int
-                 The length (in bytes) of the state size of Xdrbg which
-                 was set when the Xdrbg instance was created.
 
-    alpha : bytes
-            This parameter will depend whether on whether it was provided
-            during invocation of xdrbg_instantiate or xdrbg_reseed or
-            xdrbg_generate or not.
+def validate_alpha_length_for_xdrbg(length_of_provided_alpha_in_bytes: int) -> None:
+    """
+    This method is required to check whether the length of the (optional)
+    alpha parameter is below a certain threshold or not.
+
+    Parameter
+    ---------
+
+    length_of_provided_alpha_in_bytes : int
+                                        The length of the provided alpha in bytes.
 
     Returns
     -------
     This method does not return any value.
     """
-
-    method_invoker_name: str = inspect.stack()[1].function
-    try:
-        match method_invoker_name:
-            case "xdrbg_instantiate_main":
-                length_of_provided_seed_for_xdrbg_instantiate_in_bytes: int = len(
-                    seed)
-
-                # This dictionary maps the minimum seed length required for
-                # instantiation of the Xdrbg based on the respective Xof.
-
-                # The {key : value} pair is respectively {xof_name : minimum_seed_length_required_in_bytes}.
-
-                REQUIRED_SEED_LENGTH_FOR_XDRBG_INSTANTIATE: dict[str, int] = {
-                    "shake_128": 24,
-                    "Ascon-Xof": 24,
-                    "shake_256": 48,
-                }
-
-                # Validate the seed length for instantiation if the xof_name is valid.
-                try:
-                    if xof_name in REQUIRED_SEED_LENGTH_FOR_XDRBG_INSTANTIATE:
-                        try:
-                            validate_seed_length_for_xdrbg(
-                                length_of_provided_seed_for_xdrbg_instantiate_in_bytes,
-                                REQUIRED_SEED_LENGTH_FOR_XDRBG_INSTANTIATE[xof_name],
-                                "instantiation",
-                                xof_name
-                            )
-                        except ValueError as e:
-                            print(f"VlaueError: {e}")
-                            raise
-                    else:
-                        raise NameError(f"Invalid XOF (name): {xof_name}.")
-                except NameError as e:
-                    print(f"NameError: {e}")
-
-            case "xdrbg_reseed_main":
-
-                length_of_provided_seed_for_xdrbg_reseed_in_bytes: int = len(
-                    seed)
-
-                # This dictionary maps the minimum seed length required for
-                # reseeding the Xdrbg based on the respective Xof.
-
-                # The {key : value} pair is respectively {xof_name : minimum_seed_length_required_in_bytes}.
-
-                REQUIRED_SEED_LENGTH_FOR_XDRBG_RESEED: dict[str, int] = {
-                    "shake_128": 16,
-                    "Ascon-Xof": 16,
-                    "shake_256": 32,
-                }
-
-                # Validate the seed length for reseeding if the xof_name is valid.
-                try:
-                    if xof_name in REQUIRED_SEED_LENGTH_FOR_XDRBG_RESEED:
-                        try:
-                            validate_seed_length_for_xdrbg(
-                                length_of_provided_seed_for_xdrbg_reseed_in_bytes,
-                                REQUIRED_SEED_LENGTH_FOR_XDRBG_RESEED[xof_name],
-                                "reseeding",
-                                xof_name
-                            )
-                        except ValueError as e:
-                            print(f"ValueError: {e}")
-                            raise
-                    else:
-                        raise NameError(f"Invalid XOF (name): {xof_name}.")
-                except NameError as e:
-                    print(f"NameError: {e}")
-
-            case "xdrbg_generate_main":
-
-                # This dictionary maps the maximum (total) output length in bytes i.e. sum
-                # of length_of_the_random_output + xdrbg_state_size (in bytes) from a single
-                # xdrbg_generate-call based on the respective Xof.
-
-                # The {key : value} pair is respectively {xof_name : max_output_bytes_allowed_during_xdrbg_generate_in_bytes}.
-
-                MAX_OUTPUT_BYTES_ALLOWED_DURING_XDRBG_GENERATE: dict[str, int] = {
-                    "shake_128": 304,
-                    "Ascon-Xof": 256,
-                    "shake_256": 344,
-                }
-
-                # Validate the maximum output length for generate-calls if the xof_name is valid.
-                try:
-                    if xof_name in MAX_OUTPUT_BYTES_ALLOWED_DURING_XDRBG_GENERATE:
-                        try:
-                            validate_desired_output_length_for_xdrbg(
-                                (length_of_the_random_output + state_size),
-                                MAX_OUTPUT_BYTES_ALLOWED_DURING_XDRBG_GENERATE[xof_name],
-                                xof_name
-                            )
-                        except ValueError as e:
-                            print(f"ValueError: {e}")
-                            raise
-                    else:
-                        raise NameError(f"Invalid XOF (name): {xof_name}.")
-                except NameError as e:
-                    print(f"NameError: {e}")
-            case _:
-                raise NameError(f"Invalid invocation from {
-                                method_invoker_name}.")
-    except NameError as e:
-        print(f"NameError: {e}")
-
-    try:
-        if (alpha != b"") and (len(alpha) > 84):
-            raise ValueError(f"The length of the (optional) alpha parameter is {len(
-                alpha)} bytes which is more than the limit of 84 bytes. Choose an alpha which is of length between 0 and 84 bytes (both inclusive).")
-    except ValueError as e:
-        print(f"ValueError: {e}")
-        raise
+    if length_of_provided_alpha_in_bytes > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+        raise ValueError(f"The length of the (optional) alpha parameter is {length_of_provided_alpha_in_bytes} bytes which is more than the limit of {
+                         MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES} bytes. Choose an alpha which is of length between 0 and {MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES} bytes (both inclusive).")
 
 
 def validate_seed_length_for_xdrbg(
@@ -238,7 +207,7 @@ def validate_desired_output_length_for_xdrbg(
 
 
 # The method ENCODE(S,α,N) according to Page 29 of the downloaded pdf (which is the Page 33) of [1]
-def encode_function(seed: bytes, alpha: bytes, value_N: int) -> bytes:
+def encode_function(seed: bytes, alpha: bytes, value_N: int, second_part_of_seed: bytes = b"") -> bytes:
     """
     Computes ENCODE(S,α,n) = ( S ∥ α ∥ (n*85+|α|/8)_8 )
     recommended in [1] while ensuring that it does not
@@ -252,32 +221,38 @@ def encode_function(seed: bytes, alpha: bytes, value_N: int) -> bytes:
            this ENCODE(S,α,n) method has been invoked.
     alpha : bytes
 
+    value_N : int
+
+    second_part_of_seed : bytes
+                          This is appended to the seed, i.e., S = seed ∥
+                          second_part_of_seed, so that xdrbg_reseed does not
+                          need to concatenate the Xdrbg state and the seed
+                          into a separate bytes object first.
+
     Returns
     -------
     The encoded value in bytes.
     """
 
-    # Computation of just (n*85+|α|/8)_8 from [1]
-    computed_param: int = value_N * 85 + (len(alpha) * 8) // 8
+    # Lookup of just (n*85+|α|/8)_8 from [1], which is only computed
+    # when it is not in the precomputed table.
+    trailer: Union[bytes, None] = ENCODE_TRAILERS_FOR_XDRBG.get(
+        (value_N, len(alpha)))
+    if trailer is None:
+        trailer = compute_encode_trailer_for_xdrbg(value_N, len(alpha))
 
     # Computation of the part ( S ∥ α ∥ (n*85+|α|/8)_8 ) where
-    # ∥ denotes concatenation.
-    # The (computed_param.bit_length() + 7) // 8 is needed to
-    # correctly determine the length required to represent the
-    # parameter (computed_param) in bytes.
-
-    encoded_value: bytes = (
-        seed
-        + alpha
-        + (computed_param.to_bytes((computed_param.bit_length() + 7) // 8, "big"))
-    )
-    return encoded_value
+    # ∥ denotes concatenation. All the parts are joined at once,
+    # so that only the encoded value itself is allocated.
+    return b"".join((seed, second_part_of_seed, alpha, trailer))
 
 
 # Computes the Xor (⊕) between current_prg_state and extracted_parameter according to Page 9 of the downloaded pdf of [2]
 def xor_bytes(parameter_1: bytes, parameter_2: bytes) -> bytes:
     """
-    This method performs the XOR operation between two bytes object.
+    This method performs the XOR operation between two bytes object of equal length.
+    Both of the parameters are interpreted as (big-endian) integers so that the XOR
+    is computed in one operation instead of byte by byte.
 
     Parameters
     ----------
@@ -290,9 +265,44 @@ def xor_bytes(parameter_1: bytes, parameter_2: bytes) -> bytes:
     -------
     The XORed output of the two parameters in bytes.
     """
-    return bytes(
-        [
-            bit_in_parameter_1 ^ bit_in_parameter_2
-            for bit_in_parameter_1, bit_in_parameter_2 in zip(parameter_1, parameter_2)
-        ]
-    )
+    try:
+        if len(parameter_1) != len(parameter_2):
+            raise ValueError(f"The XOR requires two parameters of equal length, whereas {
+                             len(parameter_1)} and {len(parameter_2)} bytes are provided.")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+        raise
+    return (int.from_bytes(parameter_1, "big") ^ int.from_bytes(parameter_2, "big")).to_bytes(len(parameter_1), "big")
+
+
+def xor_bytes_many(parameters_1: numpy.ndarray, parameters_2: numpy.ndarray) -> numpy.ndarray:
+    """
+    This method performs the XOR operation between the rows of two arrays in one
+    vectorized step. It is the batched counterpart of xor_bytes(), e.g., for
+    refreshing the Prg states of many key chains at once.
+
+    Parameters
+    ----------
+
+    parameters_1 : numpy.ndarray
+                   An array of dtype uint8 and of shape (N, λ) or (λ,), where λ is
+                   the length of each parameter in bytes.
+
+    parameters_2 : numpy.ndarray
+                   An array of dtype uint8 and of shape (N, λ) or (λ,). An array of
+                   shape (λ,) is XORed with every row of the other parameter.
+
+    Returns
+    -------
+    The XORed output of the two parameters as an array of dtype uint8 and of shape (N, λ).
+    """
+    try:
+        if (parameters_1.ndim not in (1, 2) or parameters_2.ndim not in (1, 2)
+                or parameters_1.shape[-1] != parameters_2.shape[-1]
+                or (parameters_1.ndim == 2 and parameters_2.ndim == 2 and parameters_1.shape[0] != parameters_2.shape[0])):
+            raise ValueError(f"The XOR requires two arrays of shape (N, λ) or (λ,) with the same λ and N, whereas the shapes {
+                             parameters_1.shape} and {parameters_2.shape} are provided.")
+    except ValueError as e:
+        print(f"ValueError: {e}")
+        raise
+    return numpy.bitwise_xor(parameters_1, parameters_2, dtype=numpy.uint8)
@@ -1,8 +1,26 @@
-def encode_function(seed: bytes, alpha: bytes, value_N: int) -> bytes: ...
+from typing import Tuple
+import numpy
 
 
-def check_fulfillment_criteria_of_parameters(
-    xof_name: str = "", seed: bytes = b"", length_of_the_random_output: int = 0, state_size: int = 0, alpha: bytes = b"") -> None: ...
+def compute_encode_trailer_for_xdrbg(value_N: int, length_of_alpha_in_bytes: int) -> bytes: ...
+def encode_function(seed: bytes, alpha: bytes, value_N: int, second_part_of_seed: bytes = b"") -> bytes: ...
+
+
+def get_validation_limits_for_xdrbg(xof_name: str) -> Tuple[int, int, int]: ...
+
+
+def validate_seed_length_for_xdrbg(
+    length_of_provided_seed_in_bytes: int, minimum_seed_length_required_in_bytes: int, operation_name: str, xof_name: str) -> None: ...
+
+
+def validate_desired_output_length_for_xdrbg(
+    requested_output_length_in_bytes: int, max_output_bytes_allowed_during_xdrbg_generate_in_bytes: int, xof_name: str) -> None: ...
+
+
+def validate_alpha_length_for_xdrbg(length_of_provided_alpha_in_bytes: int) -> None: ...
 
 
 def xor_bytes(a: bytes, b: bytes) -> bytes: ...
+
+
+def xor_bytes_many(parameters_1: numpy.ndarray, parameters_2: numpy.ndarray) -> numpy.ndarray: ...
@@ -11,27 +11,78 @@ https://tosc.iacr.org/index.php/ToSC/article/view/11399
 """
 
 from typing import Tuple, Union
-from .utils import encode_function, check_fulfillment_criteria_of_parameters
-
-IS_PERFORMANCE_BENCHMARKING_DONE: bool = True
+import numpy
+from hashlib import shake_128, shake_256
+from Crypto.Hash import TurboSHAKE128, TurboSHAKE256
+from .ascon_operations import ascon_xof_many
+from .keccak_operations import shake_many
+from .utils import encode_function, get_validation_limits_for_xdrbg, validate_seed_length_for_xdrbg, \
+    validate_desired_output_length_for_xdrbg, validate_alpha_length_for_xdrbg, MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES
+
+# This dictionary maps the names of the Shake based Xofs to their respective constructors in hashlib,
+# so that every invocation of the Xof can start from a fresh state.
+
+# The {key : value} pair is respectively {xof_name : xof_constructor}.
+SHAKE_XOF_CONSTRUCTORS: dict = {
+    "shake_128": shake_128,
+    "shake_256": shake_256,
+}
+
+# This dictionary maps the names of the TurboShake based Xofs to their respective constructors in
+# pycryptodome. TurboShake is the Keccak-p[1600, 12] sponge, i.e., it runs 12 instead of the 24 rounds
+# of SHAKE with the same rates and capacities, so the limits of the Xdrbg are those of SHAKE.
+
+# The {key : value} pair is respectively {xof_name : xof_constructor}.
+TURBO_SHAKE_XOF_CONSTRUCTORS: dict = {
+    "turboshake_128": TurboSHAKE128.new,
+    "turboshake_256": TurboSHAKE256.new,
+}
+
+# The domain separation byte of TurboShake must lie in between 0x01 and 0x7F, where 0x1F is its default.
+MIN_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE: int = 0x01
+MAX_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE: int = 0x7F
+DEFAULT_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE: int = 0x1F
+
+# The engines on which the Shake based Xdrbg runs the Xof for many encoded inputs at once, where
+# "hashlib" invokes a fresh instance of the Xof from hashlib for each of the encoded inputs and
+# "numpy" runs the in-tree Keccak-f[1600] permutation on all the encoded inputs at once.
+SHAKE_BATCH_ENGINES: tuple[str, ...] = ("hashlib", "numpy")
+
+# The names of the Ascon based Xofs with which the Xdrbg can be instantiated.
+ASCON_XOF_NAMES: tuple[str, ...] = ("Ascon-Xof", "Ascon-Xofa")
 
 # Parent Class of Xdrbg
 
 class Xdrbg:
     def __init__(
-        self, xof, xdrbg_state_size: int
+        self, xof, xdrbg_state_size: int, xof_name: str
     ) -> None:
         self.xof = xof
         self.xdrbg_state_size = xdrbg_state_size
+        self.xof_name = xof_name
+
+        # The limits for validating the parameters are resolved only once here, so that
+        # every call only needs plain integer comparisons to validate its parameters.
+        try:
+            (self.minimum_seed_length_for_xdrbg_instantiate, self.minimum_seed_length_for_xdrbg_reseed,
+             self.max_output_bytes_allowed_during_xdrbg_generate) = get_validation_limits_for_xdrbg(xof_name)
+        except NameError as e:
+            print(f"NameError: {e}")
+            raise
 
     def xdrbg_instantiate_main(
         self, xof_name: str, seed_instantiate: bytes, alpha_instantiate: Union[bytes, None] = b""
     ) -> bytes:
 
-        if not IS_PERFORMANCE_BENCHMARKING_DONE:
-            check_fulfillment_criteria_of_parameters(
-                xof_name=xof_name, seed=seed_instantiate, alpha=alpha_instantiate
-            )
+        try:
+            if len(seed_instantiate) < self.minimum_seed_length_for_xdrbg_instantiate:
+                validate_seed_length_for_xdrbg(
+                    len(seed_instantiate), self.minimum_seed_length_for_xdrbg_instantiate, "instantiation", xof_name)
+            if len(alpha_instantiate) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_instantiate))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
         encoded_bytes: bytes = encode_function(
             seed_instantiate, alpha_instantiate, 0)
         return self.generate_final_output(encoded_bytes, self.xdrbg_state_size)
@@ -44,12 +95,17 @@ class Xdrbg:
         alpha_reseeding: Union[bytes, None] = b""
     ) -> bytes:
 
-        if not IS_PERFORMANCE_BENCHMARKING_DONE:
-            check_fulfillment_criteria_of_parameters(
-                xof_name=xof_name, seed=seed_reseeding, alpha=alpha_reseeding
-            )
+        try:
+            if len(seed_reseeding) < self.minimum_seed_length_for_xdrbg_reseed:
+                validate_seed_length_for_xdrbg(
+                    len(seed_reseeding), self.minimum_seed_length_for_xdrbg_reseed, "reseeding", xof_name)
+            if len(alpha_reseeding) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_reseeding))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
         encoded_bytes: bytes = encode_function(
-            current_xdrbg_state + seed_reseeding, alpha_reseeding, 1
+            current_xdrbg_state, alpha_reseeding, 1, seed_reseeding
         )
         return self.generate_final_output(encoded_bytes, self.xdrbg_state_size)
 
@@ -61,13 +117,15 @@ class Xdrbg:
         alpha_generate: Union[bytes, None] = b""
     ) -> Tuple[bytes, bytes]:
 
-        if not IS_PERFORMANCE_BENCHMARKING_DONE:
-            check_fulfillment_criteria_of_parameters(
-                xof_name=xof_name,
-                length_of_the_random_output=desired_output_length,
-                state_size=self.xdrbg_state_size,
-                alpha=alpha_generate
-            )
+        try:
+            if desired_output_length + self.xdrbg_state_size > self.max_output_bytes_allowed_during_xdrbg_generate:
+                validate_desired_output_length_for_xdrbg(
+                    desired_output_length + self.xdrbg_state_size, self.max_output_bytes_allowed_during_xdrbg_generate, xof_name)
+            if len(alpha_generate) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_generate))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
         encoded_bytes: bytes = encode_function(
             current_xdrbg_state, alpha_generate, 2)
         generated_output = self.generate_final_output(
@@ -78,6 +136,191 @@ class Xdrbg:
 
         return (new_xdrbg_state, random_output)
 
+    def xdrbg_instantiate_many(
+        self, seeds_instantiate: Union[list[bytes], numpy.ndarray], alpha_instantiate: bytes = b""
+    ) -> Union[list[bytes], numpy.ndarray]:
+        """
+        Creates an Xdrbg state for the first time from each of the seeds, which is
+        the same as [self.xdrbg_instantiate(seed, alpha_instantiate) for seed in
+        seeds_instantiate], but where the Xof runs on all the encoded seeds at once
+        with generate_final_outputs_many().
+
+        Parameters
+        ----------
+
+        seeds_instantiate : list[bytes] or numpy.ndarray
+                            The initial seed materials either as a list or as
+                            fixed-width records in an array of dtype uint8 and of
+                            shape (N, length_of_each_seed). Each of them should be
+                            at least as long as for xdrbg_instantiate() [1].
+
+        alpha_instantiate : bytes
+                            This is an optional parameter but it
+                            can be of at most 84 bytes [1].
+
+        Returns
+        -------
+        The Xdrbg states upon instantiation in the same order as the seeds, i.e., a list
+        of bytes, or an array of dtype uint8 and of shape (N, self.xdrbg_state_size) when
+        the seeds are given as an array.
+        """
+        list_of_seeds_instantiate: list[bytes] = self.__as_list_of_records(seeds_instantiate)
+        if not list_of_seeds_instantiate:
+            return self.__as_records_like(seeds_instantiate, [], self.xdrbg_state_size)
+        try:
+            length_of_the_shortest_seed: int = min(map(len, list_of_seeds_instantiate))
+            if length_of_the_shortest_seed < self.minimum_seed_length_for_xdrbg_instantiate:
+                validate_seed_length_for_xdrbg(
+                    length_of_the_shortest_seed, self.minimum_seed_length_for_xdrbg_instantiate, "instantiation", self.xof_name)
+            if len(alpha_instantiate) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_instantiate))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        list_of_encoded_bytes: list[bytes] = [encode_function(
+            seed_instantiate, alpha_instantiate, 0) for seed_instantiate in list_of_seeds_instantiate]
+        return self.__as_records_like(seeds_instantiate, self.generate_final_outputs_many(
+            list_of_encoded_bytes, self.xdrbg_state_size), self.xdrbg_state_size)
+
+    def xdrbg_reseed_many(
+        self,
+        current_xdrbg_states: Union[bytes, bytearray, memoryview, list[bytes], numpy.ndarray],
+        seeds_reseeding: Union[list[bytes], numpy.ndarray],
+        alpha_reseeding: bytes = b""
+    ) -> Union[list[bytes], numpy.ndarray]:
+        """
+        Creates a new Xdrbg state from each of the seeds, which is the same as
+        [self.xdrbg_reseed(current_xdrbg_state, seed, alpha_reseeding) for ...],
+        but where the Xof runs on all the encoded inputs at once with
+        generate_final_outputs_many().
+
+        Parameters
+        ----------
+
+        current_xdrbg_states : bytes, bytearray, memoryview, list[bytes] or numpy.ndarray
+                               Either a single Xdrbg state which is reseeded with
+                               each of the seeds, or one Xdrbg state for each seed
+                               as a list or as an array of dtype uint8 and of shape
+                               (N, self.xdrbg_state_size).
+
+        seeds_reseeding : list[bytes] or numpy.ndarray
+                          The reseeding seed materials either as a list or as
+                          fixed-width records in an array of dtype uint8 and of
+                          shape (N, length_of_each_seed). Each of them should be
+                          at least as long as for xdrbg_reseed() [1].
+
+        alpha_reseeding : bytes
+                          This is an optional parameter but it
+                          can be of at most 84 bytes [1].
+
+        Returns
+        -------
+        The Xdrbg states after reseeding in the same order as the seeds, i.e., a list of
+        bytes, or an array of dtype uint8 and of shape (N, self.xdrbg_state_size) when the
+        seeds are given as an array.
+        """
+        list_of_seeds_reseeding: list[bytes] = self.__as_list_of_records(seeds_reseeding)
+        list_of_current_xdrbg_states: list[bytes]
+        if isinstance(current_xdrbg_states, (bytes, bytearray, memoryview)):
+            list_of_current_xdrbg_states = [bytes(current_xdrbg_states)] * len(list_of_seeds_reseeding)
+        else:
+            list_of_current_xdrbg_states = self.__as_list_of_records(current_xdrbg_states)
+        try:
+            # zip() would silently drop the states or the seeds without a counterpart
+            if len(list_of_current_xdrbg_states) != len(list_of_seeds_reseeding):
+                raise ValueError(f"The number of Xdrbg states is {len(list_of_current_xdrbg_states)}, whereas the number of seeds for reseeding is {
+                                 len(list_of_seeds_reseeding)}.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        if not list_of_seeds_reseeding:
+            return self.__as_records_like(seeds_reseeding, [], self.xdrbg_state_size)
+        try:
+            length_of_the_shortest_seed: int = min(map(len, list_of_seeds_reseeding))
+            if length_of_the_shortest_seed < self.minimum_seed_length_for_xdrbg_reseed:
+                validate_seed_length_for_xdrbg(
+                    length_of_the_shortest_seed, self.minimum_seed_length_for_xdrbg_reseed, "reseeding", self.xof_name)
+            if len(alpha_reseeding) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_reseeding))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        list_of_encoded_bytes: list[bytes] = [encode_function(
+            current_xdrbg_state, alpha_reseeding, 1, seed_reseeding)
+            for current_xdrbg_state, seed_reseeding in zip(list_of_current_xdrbg_states, list_of_seeds_reseeding)]
+        return self.__as_records_like(seeds_reseeding, self.generate_final_outputs_many(
+            list_of_encoded_bytes, self.xdrbg_state_size), self.xdrbg_state_size)
+
+    def xdrbg_generate_many(
+        self,
+        current_xdrbg_states: Union[list[bytes], numpy.ndarray],
+        desired_output_length: int,
+        alpha_generate: bytes = b""
+    ) -> Union[Tuple[list[bytes], list[bytes]], Tuple[numpy.ndarray, numpy.ndarray]]:
+        """
+        Creates a new Xdrbg state and generates the (random) output from each of the
+        Xdrbg states, which is the same as [self.xdrbg_generate(current_xdrbg_state,
+        desired_output_length, alpha_generate) for ...], but where the Xof runs on all
+        the encoded Xdrbg states at once with generate_final_outputs_many().
+
+        Parameters
+        ----------
+
+        current_xdrbg_states : list[bytes] or numpy.ndarray
+                               The Xdrbg states either as a list or as fixed-width
+                               records in an array of dtype uint8 and of shape
+                               (N, self.xdrbg_state_size).
+
+        desired_output_length : int
+                                The same limits as for xdrbg_generate() apply [1].
+
+        alpha_generate : bytes
+                         This is an optional parameter but it
+                         can be of at most 84 bytes [1].
+
+        Returns
+        -------
+        A tuple of (new_xdrbg_states, random_outputs) in the same order as the Xdrbg states,
+        i.e., two lists of bytes, or two arrays of dtype uint8 and of shapes (N,
+        self.xdrbg_state_size) and (N, desired_output_length) when the Xdrbg states are given
+        as an array, which are both views of the same contiguous output of the Xof.
+        """
+        list_of_current_xdrbg_states: list[bytes] = self.__as_list_of_records(current_xdrbg_states)
+        try:
+            if desired_output_length + self.xdrbg_state_size > self.max_output_bytes_allowed_during_xdrbg_generate:
+                validate_desired_output_length_for_xdrbg(
+                    desired_output_length + self.xdrbg_state_size, self.max_output_bytes_allowed_during_xdrbg_generate, self.xof_name)
+            if len(alpha_generate) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_generate))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        list_of_encoded_bytes: list[bytes] = [encode_function(
+            current_xdrbg_state, alpha_generate, 2) for current_xdrbg_state in list_of_current_xdrbg_states]
+        list_of_generated_outputs: list[bytes] = self.generate_final_outputs_many(
+            list_of_encoded_bytes, desired_output_length + self.xdrbg_state_size)
+        if isinstance(current_xdrbg_states, numpy.ndarray):
+            generated_outputs: numpy.ndarray = self.__as_records_like(
+                current_xdrbg_states, list_of_generated_outputs, desired_output_length + self.xdrbg_state_size)
+            return (generated_outputs[:, :self.xdrbg_state_size], generated_outputs[:, self.xdrbg_state_size:])
+        return ([generated_output[:self.xdrbg_state_size] for generated_output in list_of_generated_outputs],
+                [generated_output[self.xdrbg_state_size:] for generated_output in list_of_generated_outputs])
+
+    def __as_list_of_records(self, records: Union[list[bytes], numpy.ndarray]) -> list[bytes]:
+        if isinstance(records, numpy.ndarray):
+            buffer_of_records: bytes = records.tobytes()
+            length_of_each_record: int = records.shape[1]
+            return [buffer_of_records[start: start + length_of_each_record]
+                    for start in range(0, len(buffer_of_records), length_of_each_record)]
+        return records
+
+    def __as_records_like(
+        self, given_records: Union[list[bytes], numpy.ndarray], list_of_outputs: list[bytes], length_of_each_output: int
+    ) -> Union[list[bytes], numpy.ndarray]:
+        if isinstance(given_records, numpy.ndarray):
+            return numpy.frombuffer(b"".join(list_of_outputs), dtype=numpy.uint8).reshape(-1, length_of_each_output)
+        return list_of_outputs
+
     # This is an abstract method.
     def generate_final_output(
         self, encoded_bytes: bytes, length_of_output: int = 0
@@ -110,30 +353,71 @@ class Xdrbg:
         )
 
 
+    def generate_final_outputs_many(
+        self, list_of_encoded_bytes: list[bytes], length_of_output: int = 0
+    ) -> list[bytes]:
+        """
+        Generates the final output of the Xdrbg of the desired length for each
+        of the encoded bytes, which is the same as [self.generate_final_output(
+        encoded_bytes, length_of_output) for encoded_bytes in list_of_encoded_bytes].
+        This is the engine interface of xdrbg_instantiate_many(), xdrbg_reseed_many()
+        and xdrbg_generate_many(), i.e., a sub class only needs to override this method
+        with a batched engine which runs the Xof on all the encoded bytes at once.
+
+        Parameters
+        ----------
+
+        list_of_encoded_bytes : list[bytes]
+
+        length_of_output : int
+                           The desired length of each output in bytes.
+
+        Returns
+        -------
+        A list of the final outputs of the Xdrbg in bytes of the desired length
+        in the same order as the encoded bytes.
+        """
+        return [self.generate_final_output(encoded_bytes, length_of_output)
+                for encoded_bytes in list_of_encoded_bytes]
+
 # Sub Class of Xdrbg for Shake-Xof based Xdrbg
 class ShakeBasedXdrbg(Xdrbg):
     XDRBG_STATE_SIZE: int
 
-    def __init__(self, xof) -> None:
+    def __init__(self, xof, shake_batch_engine: str = "hashlib") -> None:
         """
         Creates an instance of Xdrbg with a shake-based XOF and
         sets the Xdrbg state size depending on the XOF.
 
-        Parameter
-        ---------
+        Parameters
+        ----------
         xof : _hashlib.HASHXOF
 
+        shake_batch_engine : str
+                             The engine from SHAKE_BATCH_ENGINES on which
+                             xdrbg_instantiate_many(), xdrbg_reseed_many() and
+                             xdrbg_generate_many() run the Xof. This is
+                             "hashlib" by default.
+
         Returns
         -------
         None
         """
+        try:
+            if shake_batch_engine not in SHAKE_BATCH_ENGINES:
+                raise ValueError(f"Invalid batch engine {shake_batch_engine} for the Xdrbg. Choose an engine from {
+                                 SHAKE_BATCH_ENGINES}.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        self.shake_batch_engine = shake_batch_engine
         try:
             if xof.name == "shake_128":
                 self.XDRBG_STATE_SIZE = 32  # 32 bytes = 256 bits
-                super().__init__(xof, self.XDRBG_STATE_SIZE)
+                super().__init__(xof, self.XDRBG_STATE_SIZE, xof.name)
             elif xof.name == "shake_256":
                 self.XDRBG_STATE_SIZE = 64  # 64 bytes = 512 bits
-                super().__init__(xof, self.XDRBG_STATE_SIZE)
+                super().__init__(xof, self.XDRBG_STATE_SIZE, xof.name)
             else:
                 raise NameError(
                     "Invalid XOF: Choose a valid XOF (like SHAKE_128 or SHAKE_256) from hashlib module."
@@ -247,14 +531,188 @@ class ShakeBasedXdrbg(Xdrbg):
         self, encoded_bytes: bytes, length_of_output: int = 0
     ) -> bytes:
 
-        # Feed the data into the Xof
-        self.xof.update(encoded_bytes)
-        
+        # Feed the data into a fresh instance of the Xof, so that the output
+        # only depends on the encoded_bytes of this call and not on the data
+        # fed to the Xof in any of the previous calls.
+
         # Return the (hash) digest of the data that has been
         # fed to the Xof of the desired length (as determined
-        # by the parameter xdrbg_state_size).
-       
-        return self.xof.digest(length_of_output)
+        # by the parameter length_of_output).
+
+        return SHAKE_XOF_CONSTRUCTORS[self.xof.name](encoded_bytes).digest(length_of_output)
+
+    # Implementation of the batched counterpart of the abstract method for Shake based Xofs.
+    def generate_final_outputs_many(
+        self, list_of_encoded_bytes: list[bytes], length_of_output: int = 0
+    ) -> list[bytes]:
+
+        # The engine "numpy" runs the Keccak-f[1600] permutation on all the encoded
+        # inputs of the same length at once, whereas the engine "hashlib" invokes a
+        # fresh instance of the Xof for each of the encoded inputs.
+
+        if self.shake_batch_engine == "numpy":
+            return shake_many(list_of_encoded_bytes, self.xof.name, length_of_output)
+        xof_constructor = SHAKE_XOF_CONSTRUCTORS[self.xof.name]
+        return [xof_constructor(encoded_bytes).digest(length_of_output) for encoded_bytes in list_of_encoded_bytes]
+
+
+# Sub Class of Xdrbg for TurboShake-Xof based Xdrbg
+class TurboShakeBasedXdrbg(Xdrbg):
+    XDRBG_STATE_SIZE: int
+
+    def __init__(
+        self, turbo_shake_name: str, domain_separation_byte: int = DEFAULT_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE
+    ) -> None:
+        """
+        Creates an instance of Xdrbg with a turboshake-based XOF and
+        sets the Xdrbg state size depending on the XOF.
+
+        Parameters
+        ----------
+
+        turbo_shake_name : str
+                           This must be either a string "turboshake_128" or
+                           "turboshake_256". The Xdrbg state size is the same
+                           as of the respective SHAKE variant.
+
+        domain_separation_byte : int
+                                 The domain separation byte of TurboShake in
+                                 between 0x01 and 0x7F. This is 0x1F by default.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            if not MIN_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE <= domain_separation_byte <= MAX_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE:
+                raise ValueError(f"Invalid domain separation byte {domain_separation_byte:#04x} for TurboShake. It must lie in between {
+                                 MIN_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE:#04x} and {MAX_DOMAIN_SEPARATION_BYTE_FOR_TURBO_SHAKE:#04x}.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+        self.turbo_shake_name = turbo_shake_name
+        self.domain_separation_byte = domain_separation_byte
+        try:
+            if turbo_shake_name == "turboshake_128":
+                self.XDRBG_STATE_SIZE = 32  # 32 bytes = 256 bits
+            elif turbo_shake_name == "turboshake_256":
+                self.XDRBG_STATE_SIZE = 64  # 64 bytes = 512 bits
+            else:
+                raise NameError(
+                    "Invalid name of TurboShake XOF: Choose a valid name i.e. turboshake_128 or turboshake_256."
+                )
+        except NameError as e:
+            print(f"NameError: {e}")
+            raise
+        super().__init__(TURBO_SHAKE_XOF_CONSTRUCTORS[turbo_shake_name],
+                         self.XDRBG_STATE_SIZE, turbo_shake_name)
+
+    def xdrbg_instantiate(
+        self, seed_instantiate: bytes, alpha_instantiate: Union[bytes, None] = b""
+    ) -> bytes:
+        """
+        Creates an Xdrbg state for the first time.
+
+        Parameters
+        ----------
+
+        seed_instantiate : bytes
+                           The initial seed material should be
+                           preferably >=  24 bytes (192 bits) when
+                           the Xof is TurboShake128 or >= 48 bytes
+                           (384 bits) when the Xof is TurboShake256 [1].
+
+        alpha_instantiate : bytes or None
+                            This is an optional parameter but it
+                            can be of at most 84 bytes [1].
+
+        Returns
+        -------
+        The Xdrbg state upon instantiation in bytes.
+        """
+        return super().xdrbg_instantiate_main(
+            self.turbo_shake_name, seed_instantiate, alpha_instantiate
+        )
+
+    def xdrbg_reseed(
+        self,
+        current_xdrbg_state: bytes,
+        seed_reseeding: bytes,
+        alpha_reseeding: Union[bytes, None] = b""
+    ) -> bytes:
+        """
+        Creates a new Xdrbg state.
+
+        Parameters
+        ----------
+
+        current_xdrbg_state : bytes
+
+        seed_reseeding : bytes
+                         The reseeding seed material should be
+                         preferably >= 16 bytes (128 bits) when
+                         the Xof is TurboShake128 or >= 32 bytes
+                         (256 bits) when the Xof is TurboShake256 [1].
+
+        alpha_reseeding : bytes or None
+                          This is an optional parameter but it
+                          can be of at most 84 bytes [1].
+
+        Returns
+        -------
+        The Xdrbg state after reseeding in bytes.
+        """
+        return super().xdrbg_reseed_main(
+            self.turbo_shake_name, current_xdrbg_state, seed_reseeding, alpha_reseeding
+        )
+
+    def xdrbg_generate(
+        self,
+        current_xdrbg_state: bytes,
+        desired_output_length: int,
+        alpha_generate: Union[bytes, None] = b""
+    ) -> Tuple[bytes, bytes]:
+        """
+        Creates a new Xdrbg state and generates the (random) output.
+
+        Parameters
+        ----------
+
+        current_xdrbg_state : bytes
+
+        desired_output_length : int
+                                The desired length of the random output bits must
+                                be such that the length of total output of the Xof
+                                i.e. desired_output_length + self.xdrbg_state_size
+                                is <= 304 bytes (2432 bits) when the Xof is
+                                TurboShake128 and is <= 344 bytes (2752 bits) when
+                                the Xof is TurboShake256, as for SHAKE_128 and
+                                SHAKE_256 respectively.
+
+        alpha_generate : bytes or None
+                         This is an optional parameter but it
+                         can be of at most 84 bytes [1].
+
+        Returns
+        -------
+        A tuple of (new_xdrbg_state, random_output) both in bytes.
+        """
+        return super().xdrbg_generate_main(
+            self.turbo_shake_name,
+            current_xdrbg_state,
+            desired_output_length,
+            alpha_generate,
+        )
+
+    # Implementation of the abstract method for TurboShake based Xofs.
+    def generate_final_output(
+        self, encoded_bytes: bytes, length_of_output: int = 0
+    ) -> bytes:
+
+        # Feed the data into a fresh instance of the Xof with the domain separation
+        # byte of this Xdrbg and return the output of the desired length.
+
+        return self.xof(data=encoded_bytes, domain=self.domain_separation_byte).read(length_of_output)
 
 
 # Sub Class of Xdrbg for Ascon-Xof based Xdrbg
@@ -271,7 +729,9 @@ class AsconBasedXdrbg(Xdrbg):
         xof :  ascon xof function
 
         ascon_xof_name : str
-                         This must be a string "Ascon-Xof".
+                         This must be either a string "Ascon-Xof" or "Ascon-Xofa",
+                         where the latter uses 8 instead of 12 rounds of the
+                         permutation in between the blocks.
 
         Returns
         -------
@@ -279,14 +739,14 @@ class AsconBasedXdrbg(Xdrbg):
         """
         self.ascon_xof_name = ascon_xof_name
         try:
-            if ascon_xof_name != "Ascon-Xof":
+            if ascon_xof_name not in ASCON_XOF_NAMES:
                 raise NameError(
-                    "Invalid name of ASCON XOF: Choose a valid name i.e. Ascon-Xof)."
+                    "Invalid name of ASCON XOF: Choose a valid name i.e. Ascon-Xof or Ascon-Xofa."
                 )
         except NameError as e:
             print(f"NameError: {e}")
         self.XDRBG_STATE_SIZE: int = 32  # 32 bytes = 256 bits
-        super().__init__(xof, self.XDRBG_STATE_SIZE)
+        super().__init__(xof, self.XDRBG_STATE_SIZE, self.ascon_xof_name)
 
     def xdrbg_instantiate(
         self, seed_instantiate: bytes, alpha_instantiate: Union[bytes, None] = b""
@@ -390,3 +850,13 @@ class AsconBasedXdrbg(Xdrbg):
         # by the parameter length_of_output).
        
         return self.xof(encoded_bytes, self.ascon_xof_name, length_of_output)
+
+    # Implementation of the batched counterpart of the abstract method for Ascon based Xofs.
+    def generate_final_outputs_many(
+        self, list_of_encoded_bytes: list[bytes], length_of_output: int = 0
+    ) -> list[bytes]:
+
+        # The in-tree Ascon engine runs the permutation on all the
+        # encoded inputs of the same length at once.
+
+        return ascon_xof_many(list_of_encoded_bytes, self.ascon_xof_name, length_of_output)
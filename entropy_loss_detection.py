@@ -1,6 +1,6 @@
 from hashlib import sha256, sha3_256, sha512, sha3_512, shake_128, shake_256
 from typing import Union
-from ascon._ascon import ascon_hash as ascon_xof
+from cryptographicprimitives.ascon_operations import ascon_xof
 from entropylossdetection.detection_in_hkdf import HkdfDetection
 from entropylossdetection.detection_in_xdrbg import XdrbgDetection
 from entropylossdetection.detection_in_prg import PrgDetection
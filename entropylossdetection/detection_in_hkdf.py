@@ -35,10 +35,11 @@ class HkdfDetection:
 
         A list of pseudo random keys (PRKs) as output.
         """
-        list_of_pseudo_random_keys: list[bytes] = []
-        for seed in list_of_seeds:
-            pseudo_random_key: bytes = self.hkdf_obj.hkdf_extract(None, seed)
-            list_of_pseudo_random_keys.append(pseudo_random_key)
+        all_pseudo_random_keys: bytes = self.hkdf_obj.hkdf_extract_many(
+            None, list_of_seeds)
+        length_of_each_pseudo_random_key: int = self.hkdf_obj.hash_algorithm_digest_size_in_bytes
+        list_of_pseudo_random_keys: list[bytes] = [all_pseudo_random_keys[i:i+length_of_each_pseudo_random_key]
+                                                   for i in range(0, len(all_pseudo_random_keys), length_of_each_pseudo_random_key)]
         return list_of_pseudo_random_keys
 
     def generate_random_outputs_from_hkdf_expand_for_sound_idealization(self, list_of_pseudo_random_keys: list[bytes]) -> list[bytes]:
@@ -56,11 +57,10 @@ class HkdfDetection:
 
         A list of random outputs.
         """
-        list_of_random_outputs_from_hkdf: list[bytes] = []
-        for pseudo_random_key in list_of_pseudo_random_keys:
-            total_output_from_hkdf: bytes = self.hkdf_obj.hkdf_expand(
-                pseudo_random_key, None, DESIRED_OUTPUT_LENGTH)
-            list_of_random_outputs_from_hkdf.append(total_output_from_hkdf)
+        all_random_outputs_from_hkdf: bytes = self.hkdf_obj.hkdf_expand_many(
+            list_of_pseudo_random_keys, None, DESIRED_OUTPUT_LENGTH)
+        list_of_random_outputs_from_hkdf: list[bytes] = [all_random_outputs_from_hkdf[i:i+DESIRED_OUTPUT_LENGTH]
+                                                         for i in range(0, len(all_random_outputs_from_hkdf), DESIRED_OUTPUT_LENGTH)]
         return list_of_random_outputs_from_hkdf
 
     def check_for_entropy_loss(self, list_of_corresponding_inputs: list[bytes], list_of_random_outputs_from_hkdf: list[bytes]) -> None:
@@ -41,11 +41,8 @@ class PrgDetection:
 
         A list of refreshed PRG states as random outputs.       
         """
-        list_of_refreshed_prg_state: list[bytes] = []
-        for seed in list_of_seeds:
-            refreshed_prg_state: bytes = self.prg_obj.prg_refresh(
-                self.__prg_state_of_all_zeroes, seed)
-            list_of_refreshed_prg_state.append(refreshed_prg_state)
+        list_of_refreshed_prg_state: list[bytes] = self.prg_obj.prg_refresh_many(
+            self.__prg_state_of_all_zeroes, list_of_seeds)
         return list_of_refreshed_prg_state
 
     def generate_random_outputs_from_prg_refresh_for_unsound_idealization(self, list_of_seeds: list[bytes]) -> list[bytes]:
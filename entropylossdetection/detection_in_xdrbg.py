@@ -52,11 +52,8 @@ class XdrbgDetection:
 
         A list of initial XDRBG states as random outputs.
         """
-        list_of_initial_xdrbg_state: list[bytes] = []
-        for seed in list_of_seeds:
-            initial_xdrbg_state: bytes = self.xdrbg_obj.xdrbg_instantiate(seed)
-            list_of_initial_xdrbg_state.append(initial_xdrbg_state)
-        return list_of_initial_xdrbg_state
+        # The sound Xdrbg instantiates from all the seeds at once.
+        return self.xdrbg_obj.xdrbg_instantiate_many(list_of_seeds)
 
     def generate_random_outputs_from_xdrbg_reseed_for_sound_idealization(self, list_of_seeds: list[bytes]) -> list[bytes]:
         """
@@ -74,14 +71,11 @@ class XdrbgDetection:
 
         A list of reseeded XDRBG states as random outputs.
         """
-        list_of_reseeded_xdrbg_state: list[bytes] = []
         initial_xdrbg_state: bytes = self.xdrbg_obj.xdrbg_instantiate(
             generate_random_input_parameter_for_xdrbg(self.xof_name))
-        for seed in list_of_seeds:
-            reseeded_xdrbg_state = self.xdrbg_obj.xdrbg_reseed(
-                initial_xdrbg_state, seed)
-            list_of_reseeded_xdrbg_state.append(reseeded_xdrbg_state)
-        return list_of_reseeded_xdrbg_state
+
+        # The sound Xdrbg reseeds with all the seeds at once.
+        return self.xdrbg_obj.xdrbg_reseed_many(initial_xdrbg_state, list_of_seeds)
 
     def generate_random_outputs_from_xdrbg_reseed_for_unsound_idealization(self, list_of_seeds: list[bytes]) -> list[bytes]:
         """
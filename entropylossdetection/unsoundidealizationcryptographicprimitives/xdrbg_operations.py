@@ -11,28 +11,44 @@ https://tosc.iacr.org/index.php/ToSC/article/view/11399
 """
 
 from typing import Tuple, Optional
-from .utils import encode_function, check_fulfillment_criteria_of_parameters
+from .utils import encode_function, get_validation_limits_for_xdrbg, validate_seed_length_for_xdrbg, \
+    validate_desired_output_length_for_xdrbg, validate_alpha_length_for_xdrbg, MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES
 
-IS_PERFORMANCE_BENCHMARKING_DONE: bool = False
+# The names of the Ascon based Xofs with which the Xdrbg can be instantiated.
+ASCON_XOF_NAMES: tuple[str, ...] = ("Ascon-Xof", "Ascon-Xofa")
 
 # Parent Class of Xdrbg
 
 
 class Xdrbg:
     def __init__(
-        self, xof, xdrbg_state_size: int
+        self, xof, xdrbg_state_size: int, xof_name: str
     ) -> None:
         self.xof = xof
         self.xdrbg_state_size = xdrbg_state_size
 
+        # The limits for validating the parameters are resolved only once here, so that
+        # every call only needs plain integer comparisons to validate its parameters.
+        try:
+            (self.minimum_seed_length_for_xdrbg_instantiate, self.minimum_seed_length_for_xdrbg_reseed,
+             self.max_output_bytes_allowed_during_xdrbg_generate) = get_validation_limits_for_xdrbg(xof_name)
+        except NameError as e:
+            print(f"NameError: {e}")
+            raise
+
     def xdrbg_instantiate_main(
         self, xof_name: str, seed_instantiate: bytes, alpha_instantiate: Optional[bytes] = b""
     ) -> bytes:
 
-        if not IS_PERFORMANCE_BENCHMARKING_DONE:
-            check_fulfillment_criteria_of_parameters(
-                xof_name=xof_name, seed=seed_instantiate, alpha=alpha_instantiate
-            )
+        try:
+            if len(seed_instantiate) < self.minimum_seed_length_for_xdrbg_instantiate:
+                validate_seed_length_for_xdrbg(
+                    len(seed_instantiate), self.minimum_seed_length_for_xdrbg_instantiate, "instantiation", xof_name)
+            if len(alpha_instantiate) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_instantiate))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
         encoded_bytes: bytes = encode_function(
             seed_instantiate, alpha_instantiate, 0)
         return self.generate_final_output(encoded_bytes, self.xdrbg_state_size)
@@ -44,10 +60,15 @@ class Xdrbg:
         alpha_reseeding: Optional[bytes] = b"",
     ) -> bytes:
 
-        if not IS_PERFORMANCE_BENCHMARKING_DONE:
-            check_fulfillment_criteria_of_parameters(
-                xof_name=xof_name, seed=seed_reseeding, alpha=alpha_reseeding
-            )
+        try:
+            if len(seed_reseeding) < self.minimum_seed_length_for_xdrbg_reseed:
+                validate_seed_length_for_xdrbg(
+                    len(seed_reseeding), self.minimum_seed_length_for_xdrbg_reseed, "reseeding", xof_name)
+            if len(alpha_reseeding) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_reseeding))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
         encoded_bytes: bytes = encode_function(seed_reseeding, alpha_reseeding, 1)
         return self.generate_final_output(encoded_bytes, self.xdrbg_state_size)
 
@@ -59,13 +80,15 @@ class Xdrbg:
         alpha_generate: Optional[bytes] = b"",
     ) -> Tuple[bytes, bytes]:
 
-        if not IS_PERFORMANCE_BENCHMARKING_DONE:
-            check_fulfillment_criteria_of_parameters(
-                xof_name=xof_name,
-                length_of_the_random_output=desired_output_length,
-                state_size=self.xdrbg_state_size,
-                alpha=alpha_generate
-            )
+        try:
+            if desired_output_length + self.xdrbg_state_size > self.max_output_bytes_allowed_during_xdrbg_generate:
+                validate_desired_output_length_for_xdrbg(
+                    desired_output_length + self.xdrbg_state_size, self.max_output_bytes_allowed_during_xdrbg_generate, xof_name)
+            if len(alpha_generate) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                validate_alpha_length_for_xdrbg(len(alpha_generate))
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
         encoded_bytes: bytes = encode_function(
             current_xdrbg_state, alpha_generate, 2)
         generated_output = self.generate_final_output(
@@ -128,10 +151,10 @@ class ShakeBasedXdrbg(Xdrbg):
         try:
             if xof.name == "shake_128":
                 self.XDRBG_STATE_SIZE = 32  # 32 bytes = 256 bits
-                super().__init__(xof, self.XDRBG_STATE_SIZE)
+                super().__init__(xof, self.XDRBG_STATE_SIZE, xof.name)
             elif xof.name == "shake_256":
                 self.XDRBG_STATE_SIZE = 64  # 64 bytes = 512 bits
-                super().__init__(xof, self.XDRBG_STATE_SIZE)
+                super().__init__(xof, self.XDRBG_STATE_SIZE, xof.name)
             else:
                 raise NameError(
                     "Invalid XOF: Choose a valid XOF (like SHAKE_128 or SHAKE_256) from hashlib module."
@@ -267,7 +290,9 @@ class AsconBasedXdrbg(Xdrbg):
         xof :  ascon xof function
 
         ascon_xof_name : str
-                         This must be a string "Ascon-Xof".
+                         This must be either a string "Ascon-Xof" or "Ascon-Xofa",
+                         where the latter uses 8 instead of 12 rounds of the
+                         permutation in between the blocks.
 
         Returns
         -------
@@ -275,14 +300,14 @@ class AsconBasedXdrbg(Xdrbg):
         """
         self.ascon_xof_name = ascon_xof_name
         try:
-            if ascon_xof_name != "Ascon-Xof":
+            if ascon_xof_name not in ASCON_XOF_NAMES:
                 raise NameError(
-                    "Invalid name of ASCON XOF: Choose a valid name i.e. Ascon-Xof)."
+                    "Invalid name of ASCON XOF: Choose a valid name i.e. Ascon-Xof or Ascon-Xofa."
                 )
         except NameError as e:
             print(f"NameError: {e}")
         self.XDRBG_STATE_SIZE: int = 32  # 32 bytes = 256 bits
-        super().__init__(xof, self.XDRBG_STATE_SIZE)
+        super().__init__(xof, self.XDRBG_STATE_SIZE, self.ascon_xof_name)
 
     def xdrbg_instantiate(
         self, seed_instantiate: bytes, alpha_instantiate: Optional[bytes] = b""
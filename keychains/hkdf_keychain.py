@@ -1,12 +1,12 @@
-from typing import Tuple, Union
+from typing import Callable, Tuple, Union
 from cryptographicprimitives.hkdf_operations import Hkdf
-from .utils import store_persistent_derivation_parameter
+from .utils import store_persistent_derivation_parameter_for_hkdf_based_key_chain
 
 
 class HkdfKeyChain:
     __key_chain_state_state_size_using_hkdf: int
 
-    def __init__(self, hash_algorithm, store_persistently: Union[bool, None] = None) -> None:
+    def __init__(self, hash_algorithm, store_persistently: Union[bool, None] = None, hkdf_backend: Union[str, None] = None) -> None:
 
         self.__hash_algorithm = hash_algorithm
         try:
@@ -16,13 +16,25 @@ class HkdfKeyChain:
             elif self.__hash_algorithm.__name__ == "openssl_sha3_512" or self.__hash_algorithm.__name__ == "openssl_sha512":
                 self.__key_chain_state_state_size_using_hkdf = 64
                 self.__desired_length_of_only_the_random_output_key = 64
+            elif self.__hash_algorithm.__name__ == "blake2s":
+                self.__key_chain_state_state_size_using_hkdf = 32
+                self.__desired_length_of_only_the_random_output_key = 32
+            elif self.__hash_algorithm.__name__ == "blake2b":
+                self.__key_chain_state_state_size_using_hkdf = 64
+                self.__desired_length_of_only_the_random_output_key = 64
             else:
                 raise NameError(f"Incorrect choice of hash function {
                                 self.__hash_algorithm.__name__} for the key chain.")
         except NameError as e:
             print(f"NameError: {e}")
         self.__store_persistently = store_persistently
-        self.__hkdf_obj = Hkdf(self.__hash_algorithm)
+        self.__hkdf_obj = Hkdf(self.__hash_algorithm, hkdf_backend)
+        self.hkdf_backend: str = self.__hkdf_obj.hkdf_backend
+
+        # The update is built once and exposed directly on the instance, while the method
+        # key_chain_update() of the class delegates to the same closure.
+        self.__key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = self.__build_key_chain_update()
+        self.key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = self.__key_chain_update
 
     def key_chain_instantiate(self, initial_source_key_material: bytes) -> bytes:
         """ 
@@ -41,15 +53,11 @@ class HkdfKeyChain:
         The initial state S_init of the key chain.
         """
 
-        # Generate the pseudorandom key from the HKDF extract function
-        pseudo_random_key: bytes = self.__hkdf_obj.hkdf_extract(
-            None, initial_source_key_material)
-
         total_desired_output_length: int = self.__key_chain_state_state_size_using_hkdf
 
-        # Generate the initial HKDF state and the initial master key
-        total_output_from_hkdf = self.__hkdf_obj.hkdf_expand(
-            pseudo_random_key, None,
+        # Generate the initial HKDF state by running the HKDF extract and expand functions together
+        total_output_from_hkdf: bytes = self.__hkdf_obj.derive(
+            initial_source_key_material, None, None,
             total_desired_output_length
         )
 
@@ -77,28 +85,76 @@ class HkdfKeyChain:
         A tuple of (new_state_of_the_key_chain_using_hkdf, random_output) both in bytes.
         """
 
-        return self.__hkdf_generate_keys(arbitrary_input_parameter, current_state_of_key_chain_using_hkdf, self.__store_persistently)
+        return self.__key_chain_update(arbitrary_input_parameter, current_state_of_key_chain_using_hkdf)
+
+    def key_chain_derive_context_keys(self, current_state_of_key_chain_using_hkdf: bytes, list_of_info_labels: list[bytes]) -> list[memoryview]:
+        """
+        Derives one context-separated key for each of the info labels (for e.g. one for
+        each service or tenant) from the current state of the key chain in a single call.
+        The state of the key chain is not changed by this derivation.
+
+        Parameters
+        ----------
+
+        current_state_of_key_chain_using_hkdf : bytes
+
+        list_of_info_labels : list[bytes]
+                              The labels of the contexts which must be distinct from each
+                              other and must not be empty so that the derived keys are
+                              separated from the random outputs of key_chain_update().
 
-    def __hkdf_generate_keys(self, arbitrary_input_parameter: bytes, current_state_of_the_key_chain_using_hkdf: bytes,
-                             store_persistently: Union[bool, None] = None) -> Tuple[bytes, bytes]:
+        Returns
+        -------
 
-        # Generate the pseudorandom key from the HKDF extract function
+        A list of the derived keys, where the i-th key is derived for the i-th info label.
+        All the keys are memoryviews of the same contiguous buffer.
+        """
+        try:
+            if any(len(info_label) == 0 for info_label in list_of_info_labels):
+                raise ValueError("The info labels must not be empty, since the key for an empty info label "
+                                 "is the same as the output of the other operations of the key chain.")
+            if len(set(map(bytes, list_of_info_labels))) != len(list_of_info_labels):
+                raise ValueError("The info labels must be distinct from each other, since equal info labels "
+                                 "derive equal keys.")
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+
+        # Generate the pseudorandom key from the HKDF extract function with the current state
+        # as the source key material, which is then shared by all the info labels.
         pseudo_random_key: bytes = self.__hkdf_obj.hkdf_extract(
-            None, arbitrary_input_parameter + current_state_of_the_key_chain_using_hkdf)
+            None, current_state_of_key_chain_using_hkdf)
+
+        all_context_keys = memoryview(self.__hkdf_obj.hkdf_expand_for_multiple_info_parameters(
+            pseudo_random_key, list_of_info_labels, self.__desired_length_of_only_the_random_output_key))
+
+        return [all_context_keys[i:i+self.__desired_length_of_only_the_random_output_key]
+                for i in range(0, len(all_context_keys), self.__desired_length_of_only_the_random_output_key)]
+
+    def __build_key_chain_update(self) -> Callable[[bytes, bytes], Tuple[bytes, bytes]]:
+
+        # Everything which only depends on the configuration of the key chain is bound once to the locals
+        # of the closure, so that every update skips the lookups on the key chain and on the Hkdf.
+        derive_two_output_blocks = self.__hkdf_obj.derive_two_output_blocks
+        store_persistently: Union[bool, None] = self.__store_persistently
+        hash_function_name: str = self.__hash_algorithm.__name__
 
-        total_desired_output_length: int = self.__key_chain_state_state_size_using_hkdf + \
-            self.__desired_length_of_only_the_random_output_key
+        def key_chain_update(
+            arbitrary_input_parameter: bytes, current_state_of_key_chain_using_hkdf: bytes
+        ) -> Tuple[bytes, bytes]:
 
-        total_output_from_hkdf: bytes = self.__hkdf_obj.hkdf_expand(
-            pseudo_random_key, None, total_desired_output_length)
+            # The total output of the HKDF is always exactly two output blocks, since both the state
+            # of the key chain and the random output are of the length of the digest of the hash
+            # function. So, the first output block is the new state of the key chain and the second
+            # output block is the random output. This state can be persistently stored and will be
+            # used as an input to the next call to the HKDF.
+            new_state_of_the_key_chain_using_hkdf, random_output = derive_two_output_blocks(
+                arbitrary_input_parameter + current_state_of_key_chain_using_hkdf)
 
-        # Generate the random output and the new state of the key chain
-        # This state can be persistently stored and will be used as an input to the next call to the HKDF
-        new_state_of_the_key_chain_using_hkdf, random_output = total_output_from_hkdf[
-            :self.__key_chain_state_state_size_using_hkdf], total_output_from_hkdf[self.__key_chain_state_state_size_using_hkdf:]
+            if store_persistently:
+                store_persistent_derivation_parameter_for_hkdf_based_key_chain(
+                    new_state_of_the_key_chain_using_hkdf, hash_function_name)
 
-        if store_persistently:
-            store_persistent_derivation_parameter(
-                new_state_of_the_key_chain_using_hkdf, self.__hash_algorithm.__name__)
+            return (new_state_of_the_key_chain_using_hkdf, random_output)
 
-        return (new_state_of_the_key_chain_using_hkdf, random_output)
+        return key_chain_update
@@ -1,14 +1,18 @@
-from typing import Tuple, Union
-from cryptographicprimitives.prg_operations import Prg
-from .utils import store_persistent_derivation_parameter, bits_to_bytes
+from typing import Callable, Tuple, Union
+from cryptographicprimitives.prg_operations import Prg, SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20
+from .utils import store_persistent_derivation_parameter_for_prg_based_key_chain, bits_to_bytes
 
 
 class PrgKeyChain:
     def __init__(
-        self, security_parameter_lambda: int, store_persistently: Union[bool, None] = None
+        self, security_parameter_lambda: int, store_persistently: Union[bool, None] = None, prg_aes_backend: Union[str, None] = None,
+        prg_stream_cipher: str = "aes"
     ) -> None:
         try:
-            if security_parameter_lambda in [16, 24, 32]:
+            if prg_stream_cipher == "chacha20" and security_parameter_lambda != SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20:
+                raise ValueError(f"The security parameter lambda must be {SECURITY_PARAMETER_LAMBDA_FOR_CHACHA20} bytes for the stream cipher {
+                                 prg_stream_cipher}, whereas {security_parameter_lambda} bytes are provided.")
+            elif security_parameter_lambda in [16, 24, 32]:
                 self.__security_parameter_lambda = security_parameter_lambda
             else:
                 raise ValueError(f"The security parameter lambda must be either 16 or 24 or 32 bytes, whereas {
@@ -19,7 +23,21 @@ class PrgKeyChain:
             [0] * self.__security_parameter_lambda * 8)
         self.__store_persistently = store_persistently
         self.__prg_obj = Prg(self.__security_parameter_lambda,
-                             self.__prg_state_of_all_zeroes)
+                             self.__prg_state_of_all_zeroes, prg_aes_backend, prg_stream_cipher)
+        self.prg_aes_backend: Union[str, None] = self.__prg_obj.prg_aes_backend
+        self.prg_stream_cipher: str = self.__prg_obj.prg_stream_cipher
+
+        # The state of the key chain using ChaCha20 is persistently stored under its own specification
+        # "chacha20", since it must not overwrite the state of the key chain using AES with λ = 32.
+        self.__persistent_derivation_specification: Union[str, int] = (
+            self.prg_stream_cipher if self.prg_stream_cipher == "chacha20" else self.__security_parameter_lambda)
+
+        # The update for this configuration is built once and exposed directly on the instance, while the
+        # method key_chain_update() of the class delegates to the same closure.
+        self.__key_chain_update: Callable[[bytes, Union[bytes, memoryview]], Tuple[memoryview, memoryview]] = \
+            self.__build_key_chain_update()
+        self.key_chain_update: Callable[[bytes, Union[bytes, memoryview]], Tuple[memoryview, memoryview]] = \
+            self.__key_chain_update
 
     def key_chain_instantiate(self, seed_for_prg_refreshing: bytes) -> bytes:
         """ 
@@ -45,7 +63,7 @@ class PrgKeyChain:
 
         return initial_state_of_key_chain_using_prg
 
-    def key_chain_update(self, arbitrary_input_parameter: bytes, current_state_of_key_chain_using_prg: bytes) -> Tuple[bytes, bytes]:
+    def key_chain_update(self, arbitrary_input_parameter: bytes, current_state_of_key_chain_using_prg: Union[bytes, memoryview]) -> Tuple[memoryview, memoryview]:
         """
         Generates the random output and the new PRG state which serves as the state of the key chain.
 
@@ -60,32 +78,34 @@ class PrgKeyChain:
         Returns
         -------
 
-        A tuple of (new_state_of_key_chain_using_prg, random_output) both in bytes.
+        A tuple of (new_state_of_key_chain_using_prg, random_output) both as memoryviews
+        of the same buffer.
         """
 
-        return self.__prg_generate_keys(arbitrary_input_parameter, current_state_of_key_chain_using_prg, self.__store_persistently)
+        return self.__key_chain_update(arbitrary_input_parameter, current_state_of_key_chain_using_prg)
 
-    def __prg_generate_keys(
-        self,
-        seed_for_prg_refreshing: bytes,
-        current_state_of_the_key_chain_using_prg: bytes,
-        store_persistently: Union[bool, None] = None
-    ) -> Tuple[bytes, bytes]:
+    def __build_key_chain_update(self) -> Callable[[bytes, Union[bytes, memoryview]], Tuple[memoryview, memoryview]]:
 
-        # Generate a refreshed PRG state which will be used as an input to the next NEXT call
-        refreshed_state_of_key_chain_using_prg: bytes = self.__prg_obj.prg_refresh(
-            current_state_of_the_key_chain_using_prg, seed_for_prg_refreshing
-        )
+        # Everything which only depends on the configuration of the key chain is bound once to the locals
+        # of the closure, so that every update skips the lookups on the key chain and on the Prg.
+        prg_refresh_and_next = self.__prg_obj.prg_refresh_and_next
+        store_persistently: Union[bool, None] = self.__store_persistently
+        persistent_derivation_specification: Union[str, int] = self.__persistent_derivation_specification
 
-        # Generate the random output and the new PRG state
-        # This state can be persistently stored and will be used as an input to the next REFRESH call to the PRG
-        random_output, new_state_of_key_chain_using_prg = self.__prg_obj.prg_next(
-            refreshed_state_of_key_chain_using_prg
-        )
+        def key_chain_update(
+            arbitrary_input_parameter: bytes, current_state_of_key_chain_using_prg: Union[bytes, memoryview]
+        ) -> Tuple[memoryview, memoryview]:
+
+            # Generate a refreshed PRG state and use it immediately for the NEXT call to generate the random
+            # output and the new PRG state, both of which are views of the same buffer.
+            # This state can be persistently stored and will be used as an input to the next REFRESH call to the PRG
+            random_output, new_state_of_key_chain_using_prg = prg_refresh_and_next(
+                current_state_of_key_chain_using_prg, arbitrary_input_parameter)
+
+            if store_persistently:
+                store_persistent_derivation_parameter_for_prg_based_key_chain(
+                    new_state_of_key_chain_using_prg, persistent_derivation_specification)
 
-        if store_persistently:
-            store_persistent_derivation_parameter(
-                new_state_of_key_chain_using_prg, self.__security_parameter_lambda
-            )
+            return (new_state_of_key_chain_using_prg, random_output)
 
-        return (new_state_of_key_chain_using_prg, random_output)
+        return key_chain_update
@@ -64,6 +64,12 @@ def generate_random_input_parameter_for_hkdf(hash_func_name: str) -> bytes:
     elif hash_func_name == "openssl_sha3_512" or hash_func_name == "openssl_sha512":
         # Length of output parameter will 64 bytes (512 bits)
         circulant_obj = Circulant(512, 512)
+    elif hash_func_name == "blake2s":
+        # Length of output parameter will 32 bytes (256 bits)
+        circulant_obj = Circulant(256, 256)
+    elif hash_func_name == "blake2b":
+        # Length of output parameter will 64 bytes (512 bits)
+        circulant_obj = Circulant(512, 512)
 
     extractor_input_parameter_1: list[int] = [
         random.randint(0, 1) for _ in range(circulant_obj.n)
@@ -117,11 +123,11 @@ def generate_random_input_parameter_for_xdrbg(xof_name: str) -> bytes:
     # global total_time_taken_for_generating_random_input_parameter_for_xdrbg
     start_time = time.time()
 
-    if xof_name == "shake_128" or xof_name == "Ascon-Xof":
+    if xof_name == "shake_128" or xof_name == "turboshake_128" or xof_name == "Ascon-Xof" or xof_name == "Ascon-Xofa":
         # Length of output parameter will 24 bytes (192 bits)
         circulant_obj = Circulant(192, 192)
 
-    elif xof_name == "shake_256":
+    elif xof_name == "shake_256" or xof_name == "turboshake_256":
         # Length of output parameter will 48 bytes (384 bits)
         circulant_obj = Circulant(384, 384)
 
@@ -246,13 +252,25 @@ def store_persistent_derivation_parameter_for_hkdf_based_key_chain(state_of_key_
             #     {"persistent_derivation_for_hkdf_sha3_512": persistent_derivation},
             # )
             database_connection_object.commit()
+        elif extra_parameter == "blake2s":
+            query_cursor.execute(
+                "Update persistent_derivation set persistent_derivation_for_hkdf_blake2s = (:persistent_derivation_for_hkdf_blake2s)",
+                {"persistent_derivation_for_hkdf_blake2s": state_of_key_chain_to_be_persistently_stored},
+            )
+            database_connection_object.commit()
+        elif extra_parameter == "blake2b":
+            query_cursor.execute(
+                "Update persistent_derivation set persistent_derivation_for_hkdf_blake2b = (:persistent_derivation_for_hkdf_blake2b)",
+                {"persistent_derivation_for_hkdf_blake2b": state_of_key_chain_to_be_persistently_stored},
+            )
+            database_connection_object.commit()
         else:
             raise Exception(f"Invalid hash function {extra_parameter}.")
     finally:
         database_connection_object.close()
 
 
-def store_persistent_derivation_parameter_for_prg_based_key_chain(state_of_key_chain_to_be_persistently_stored: bytes, extra_parameter: int) -> None:
+def store_persistent_derivation_parameter_for_prg_based_key_chain(state_of_key_chain_to_be_persistently_stored: bytes, extra_parameter: Union[str, int]) -> None:
     try:
         database_connection_object = sqlite3.connect(
             "persistent_derivation_storage.db")
@@ -297,6 +315,13 @@ def store_persistent_derivation_parameter_for_prg_based_key_chain(state_of_key_c
             #     {"persistent_derivation_for_prg_sec_param_32": persistent_derivation},
             # )
             database_connection_object.commit()
+        elif extra_parameter == "chacha20":
+            query_cursor.execute(
+                "Update persistent_derivation set persistent_derivation_for_prg_chacha20 = (:persistent_derivation_for_prg_chacha20)",
+                {"persistent_derivation_for_prg_chacha20":
+                    state_of_key_chain_to_be_persistently_stored},
+            )
+            database_connection_object.commit()
         else:
             raise ValueError(f"Invalid security parameter lambda {
                              extra_parameter}.")
@@ -335,6 +360,18 @@ def store_persistent_derivation_parameter_for_xdrbg_based_key_chain(state_of_key
             #     {"persistent_derivation_for_shake256_xdrbg": persistent_derivation},
             # )
             database_connection_object.commit()
+        elif extra_parameter == "turboshake_128":
+            query_cursor.execute(
+                "Update persistent_derivation set persistent_derivation_for_turboshake128_xdrbg = (:persistent_derivation_for_turboshake128_xdrbg)",
+                {"persistent_derivation_for_turboshake128_xdrbg": state_of_key_chain_to_be_persistently_stored},
+            )
+            database_connection_object.commit()
+        elif extra_parameter == "turboshake_256":
+            query_cursor.execute(
+                "Update persistent_derivation set persistent_derivation_for_turboshake256_xdrbg = (:persistent_derivation_for_turboshake256_xdrbg)",
+                {"persistent_derivation_for_turboshake256_xdrbg": state_of_key_chain_to_be_persistently_stored},
+            )
+            database_connection_object.commit()
         elif extra_parameter == "Ascon-Xof":
             query_cursor.execute(
                 "Update persistent_derivation set persistent_derivation_for_ascon_xdrbg = (:persistent_derivation_for_ascon_xdrbg)",
@@ -346,6 +383,12 @@ def store_persistent_derivation_parameter_for_xdrbg_based_key_chain(state_of_key
             #     {"persistent_derivation_for_ascon_xdrbg": persistent_derivation},
             # )
             database_connection_object.commit()
+        elif extra_parameter == "Ascon-Xofa":
+            query_cursor.execute(
+                "Update persistent_derivation set persistent_derivation_for_ascon_xofa_xdrbg = (:persistent_derivation_for_ascon_xofa_xdrbg)",
+                {"persistent_derivation_for_ascon_xofa_xdrbg": state_of_key_chain_to_be_persistently_stored},
+            )
+            database_connection_object.commit()
         else:
             raise Exception(f"Invalid XOF name {extra_parameter}.")
     finally:
@@ -369,9 +412,9 @@ def fetch_persistent_derivation_parameter(fetch_state_of_the_key_chain_for_speci
                                                      This parameter denotes that for which specification of the
                                                      cryptographic primitive the state of the key chain must be
                                                      fetched for. This parameter can only accept shake_128,
-                                                     shake_256, Ascon-Xof, openssl_sha256, openssl_sha3_256, 
-                                                     openssl_sha512, and openssl_sha3_512 as string values and 
-                                                     16, 24 and 32 as integer values.
+                                                     shake_256, turboshake_128, turboshake_256, Ascon-Xof, Ascon-Xofa, openssl_sha256, openssl_sha3_256, 
+                                                     openssl_sha512, openssl_sha3_512, blake2s, blake2b, and
+                                                     chacha20 as string values and 16, 24 and 32 as integer values.
 
     Returns
     -------
@@ -397,10 +440,22 @@ def fetch_persistent_derivation_parameter(fetch_state_of_the_key_chain_for_speci
                 output = query_cursor.execute(
                     "Select persistent_derivation_for_shake256_xdrbg from persistent_derivation").fetchone()[0]
                 database_connection_object.commit()
+            case "turboshake_128":
+                output = query_cursor.execute(
+                    "Select persistent_derivation_for_turboshake128_xdrbg from persistent_derivation").fetchone()[0]
+                database_connection_object.commit()
+            case "turboshake_256":
+                output = query_cursor.execute(
+                    "Select persistent_derivation_for_turboshake256_xdrbg from persistent_derivation").fetchone()[0]
+                database_connection_object.commit()
             case "Ascon-Xof":
                 output = query_cursor.execute(
                     "Select persistent_derivation_for_ascon_xdrbg from persistent_derivation").fetchone()[0]
                 database_connection_object.commit()
+            case "Ascon-Xofa":
+                output = query_cursor.execute(
+                    "Select persistent_derivation_for_ascon_xofa_xdrbg from persistent_derivation").fetchone()[0]
+                database_connection_object.commit()
             case 16:
                 output = query_cursor.execute(
                     "Select persistent_derivation_for_prg_sec_param_16 from persistent_derivation").fetchone()[0]
@@ -413,6 +468,10 @@ def fetch_persistent_derivation_parameter(fetch_state_of_the_key_chain_for_speci
                 output = query_cursor.execute(
                     "Select persistent_derivation_for_prg_sec_param_32 from persistent_derivation").fetchone()[0]
                 database_connection_object.commit()
+            case "chacha20":
+                output = query_cursor.execute(
+                    "Select persistent_derivation_for_prg_chacha20 from persistent_derivation").fetchone()[0]
+                database_connection_object.commit()
             case "openssl_sha256":
                 output = query_cursor.execute(
                     "Select persistent_derivation_for_hkdf_sha256 from persistent_derivation").fetchone()[0]
@@ -429,6 +488,14 @@ def fetch_persistent_derivation_parameter(fetch_state_of_the_key_chain_for_speci
                 output = query_cursor.execute(
                     "Select persistent_derivation_for_hkdf_sha3_512 from persistent_derivation").fetchone()[0]
                 database_connection_object.commit()
+            case "blake2s":
+                output = query_cursor.execute(
+                    "Select persistent_derivation_for_hkdf_blake2s from persistent_derivation").fetchone()[0]
+                database_connection_object.commit()
+            case "blake2b":
+                output = query_cursor.execute(
+                    "Select persistent_derivation_for_hkdf_blake2b from persistent_derivation").fetchone()[0]
+                database_connection_object.commit()
             case _:
                 raise Exception(f"Invalid specification {
                                 fetch_state_of_the_key_chain_for_specification} provided for the cryptographic primitive.")
@@ -1,49 +1,276 @@
-from typing import Tuple, Union
+from typing import Callable, Tuple, Union
 from cryptographicprimitives.xdrbg_operations import (
     ShakeBasedXdrbg,
+    TurboShakeBasedXdrbg,
     AsconBasedXdrbg,
 )
-from .utils import store_persistent_derivation_parameter
+from cryptographicprimitives.utils import encode_function, validate_seed_length_for_xdrbg, \
+    validate_desired_output_length_for_xdrbg, validate_alpha_length_for_xdrbg, MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES
+from .utils import store_persistent_derivation_parameter_for_xdrbg_based_key_chain
 
 
 def xdrbg_generate_keys(
     seed_for_xdrbg_reseeding: bytes,
     current_state_of_the_key_chain_using_xdrbg: bytes,
-    xdrbg_obj: Union[ShakeBasedXdrbg, AsconBasedXdrbg],
+    xdrbg_obj: Union[ShakeBasedXdrbg, TurboShakeBasedXdrbg, AsconBasedXdrbg],
     xof_name: str,
     desired_length_of_only_the_random_output_key: int,
     store_persistently: Union[bool, None]
 ) -> Tuple[bytes, bytes]:
 
-    # Generate a reseeded XDRBG state which will be used as an input to the next GENERATE call
-    reseeded_state_of_key_chain_using_xdrbg: bytes = xdrbg_obj.xdrbg_reseed(
-        current_state_of_the_key_chain_using_xdrbg,
-        seed_for_xdrbg_reseeding
-    )
-
-    # Generate the random output and the new XDRBG state.
-    # This state can be persistently stored and will be used as an input to the next RESEED call to the XDRBG
-    new_state_of_key_chain_using_xdrbg, random_output = xdrbg_obj.xdrbg_generate(
-        reseeded_state_of_key_chain_using_xdrbg,
-        desired_length_of_only_the_random_output_key
-    )
-
-    if store_persistently:
-        store_persistent_derivation_parameter(
-            new_state_of_key_chain_using_xdrbg, xof_name
-        )
+    # RESEED the XDRBG with the seed and then GENERATE the random output and the new XDRBG state
+    # with the same update as the key chains.
+    return build_xdrbg_key_chain_update(
+        xdrbg_obj, xof_name, desired_length_of_only_the_random_output_key, store_persistently
+    )(seed_for_xdrbg_reseeding, current_state_of_the_key_chain_using_xdrbg)
+
+
+def xdrbg_generate_keys_with_input_as_alpha(
+    arbitrary_input_parameter: bytes,
+    current_state_of_the_key_chain_using_xdrbg: bytes,
+    xdrbg_obj: Union[ShakeBasedXdrbg, TurboShakeBasedXdrbg, AsconBasedXdrbg],
+    xof_name: str,
+    desired_length_of_only_the_random_output_key: int,
+    store_persistently: Union[bool, None]
+) -> Tuple[bytes, bytes]:
+
+    # This is a distinct construction from xdrbg_generate_keys(), i.e., there is no RESEED call and the
+    # arbitrary input parameter is absorbed as α (of at most 84 bytes [1]) by a single GENERATE call, so
+    # the output of the key chain differs from the one with RESEED and GENERATE for the same inputs.
+    return build_xdrbg_key_chain_update(
+        xdrbg_obj, xof_name, desired_length_of_only_the_random_output_key, store_persistently, absorb_input_as_alpha=True
+    )(arbitrary_input_parameter, current_state_of_the_key_chain_using_xdrbg)
+
+
+def build_xdrbg_key_chain_update(
+    xdrbg_obj: Union[ShakeBasedXdrbg, TurboShakeBasedXdrbg, AsconBasedXdrbg],
+    xof_name: str,
+    desired_length_of_only_the_random_output_key: int,
+    store_persistently: Union[bool, None],
+    absorb_input_as_alpha: bool = False
+) -> Callable[[bytes, bytes], Tuple[bytes, bytes]]:
+    """
+    Builds the update of the key chain for this exact configuration as a closure,
+    which calls encode_function() and generate_final_output() of the Xdrbg directly
+    instead of going through xdrbg_reseed() and xdrbg_generate(). The length of the
+    output of GENERATE is validated once here, and the length of the arbitrary input
+    parameter is validated on every update as in xdrbg_reseed() and xdrbg_generate().
+
+    Parameters
+    ----------
+
+    xdrbg_obj : ShakeBasedXdrbg, TurboShakeBasedXdrbg or AsconBasedXdrbg
+
+    xof_name : str
+
+    desired_length_of_only_the_random_output_key : int
+
+    store_persistently : bool or None
+
+    absorb_input_as_alpha : bool
+                            If True, then the arbitrary input parameter is absorbed
+                            as α by a single GENERATE call instead of being the seed
+                            of a RESEED call, but it must still be at least as long
+                            as a seed for the RESEED call.
+
+    Returns
+    -------
+    The closure key_chain_update(arbitrary_input_parameter, current_state_of_the_key_chain)
+    which returns a tuple of (new_state_of_key_chain_using_xdrbg, random_output) both in bytes.
+    """
+    xdrbg_state_size: int = xdrbg_obj.xdrbg_state_size
+    total_output_length: int = desired_length_of_only_the_random_output_key + xdrbg_state_size
+    minimum_seed_length_for_xdrbg_reseed: int = xdrbg_obj.minimum_seed_length_for_xdrbg_reseed
+    generate_final_output = xdrbg_obj.generate_final_output
+
+    # The length of the output of every GENERATE call is the same, so it is validated only once here.
+    try:
+        if total_output_length > xdrbg_obj.max_output_bytes_allowed_during_xdrbg_generate:
+            validate_desired_output_length_for_xdrbg(
+                total_output_length, xdrbg_obj.max_output_bytes_allowed_during_xdrbg_generate, xof_name)
+    except ValueError as e:
+        print(f"ValueError: {e}")
+        raise
+
+    if absorb_input_as_alpha:
+
+        def key_chain_update(
+            arbitrary_input_parameter: bytes, current_state_of_the_key_chain_using_xdrbg: bytes
+        ) -> Tuple[bytes, bytes]:
+            try:
+                if len(arbitrary_input_parameter) < minimum_seed_length_for_xdrbg_reseed:
+                    validate_seed_length_for_xdrbg(
+                        len(arbitrary_input_parameter), minimum_seed_length_for_xdrbg_reseed, "absorbing as alpha", xof_name)
+                if len(arbitrary_input_parameter) > MAX_ALPHA_LENGTH_ALLOWED_IN_BYTES:
+                    validate_alpha_length_for_xdrbg(len(arbitrary_input_parameter))
+            except ValueError as e:
+                print(f"ValueError: {e}")
+                raise
+
+            # GENERATE with ENCODE(V, α, 2) where α is the arbitrary input parameter.
+            # This state can be persistently stored and will be used as an input to the next GENERATE call to the XDRBG
+            generated_output: bytes = generate_final_output(encode_function(
+                current_state_of_the_key_chain_using_xdrbg, arbitrary_input_parameter, 2), total_output_length)
+            new_state_of_key_chain_using_xdrbg: bytes = generated_output[0:xdrbg_state_size]
+
+            if store_persistently:
+                store_persistent_derivation_parameter_for_xdrbg_based_key_chain(
+                    new_state_of_key_chain_using_xdrbg, xof_name)
+
+            return (new_state_of_key_chain_using_xdrbg, generated_output[xdrbg_state_size:])
+
+        return key_chain_update
+
+    def key_chain_update(
+        arbitrary_input_parameter: bytes, current_state_of_the_key_chain_using_xdrbg: bytes
+    ) -> Tuple[bytes, bytes]:
+        try:
+            if len(arbitrary_input_parameter) < minimum_seed_length_for_xdrbg_reseed:
+                validate_seed_length_for_xdrbg(
+                    len(arbitrary_input_parameter), minimum_seed_length_for_xdrbg_reseed, "reseeding", xof_name)
+        except ValueError as e:
+            print(f"ValueError: {e}")
+            raise
+
+        # RESEED with ENCODE(V ∥ seed, α, 1) and then GENERATE with ENCODE(V', α, 2), both with an empty α.
+        # This state can be persistently stored and will be used as an input to the next RESEED call to the XDRBG
+        reseeded_state_of_key_chain_using_xdrbg: bytes = generate_final_output(encode_function(
+            current_state_of_the_key_chain_using_xdrbg, b"", 1, arbitrary_input_parameter), xdrbg_state_size)
+        generated_output: bytes = generate_final_output(encode_function(
+            reseeded_state_of_key_chain_using_xdrbg, b"", 2), total_output_length)
+        new_state_of_key_chain_using_xdrbg: bytes = generated_output[0:xdrbg_state_size]
+
+        if store_persistently:
+            store_persistent_derivation_parameter_for_xdrbg_based_key_chain(
+                new_state_of_key_chain_using_xdrbg, xof_name)
+
+        return (new_state_of_key_chain_using_xdrbg, generated_output[xdrbg_state_size:])
+
+    return key_chain_update
+
+
+class XdrbgKeyBuffer:
+
+    def __init__(
+        self,
+        xdrbg_obj: Union[ShakeBasedXdrbg, TurboShakeBasedXdrbg, AsconBasedXdrbg],
+        xof_name: str,
+        desired_length_of_only_the_random_output_key: int,
+        store_persistently: Union[bool, None],
+        wipe_consumed_keys: bool = False,
+        generate_keys: Callable[..., Tuple[bytes, bytes]] = xdrbg_generate_keys
+    ) -> None:
+        """
+        Hands out the keys from the maximum output which the validation limits allow
+        for one xdrbg_generate call, i.e., 17 keys for SHAKE_128, 8 keys for SHAKE_256
+        and 14 keys for Ascon-Xof, so that the Xdrbg is only reseeded and invoked to
+        generate once all the keys in the buffer have been handed out.
+
+        The buffer belongs to the state of the key chain from which it has been
+        generated, so an object of this class supports only one key chain at a time.
+        Passing any other state (e.g. of another key chain, or an earlier state of the
+        same key chain) discards the buffer and generates a new one from that state.
+
+        Parameters
+        ----------
+
+        xdrbg_obj : ShakeBasedXdrbg, TurboShakeBasedXdrbg or AsconBasedXdrbg
+
+        xof_name : str
 
-    return (new_state_of_key_chain_using_xdrbg, random_output)
+        desired_length_of_only_the_random_output_key : int
 
-LENGTH_OF_OUTPUT_KEY: dict[str, int] = {"shake_128": 16, "shake_256" : 32}
+        store_persistently : bool or None
+
+        wipe_consumed_keys : bool
+                             If True, then every key is overwritten with zeros in
+                             the buffer as soon as it has been handed out.
+
+        generate_keys : Callable
+                        Either xdrbg_generate_keys() or
+                        xdrbg_generate_keys_with_input_as_alpha().
+
+        Returns
+        -------
+        None
+        """
+        self.__xdrbg_obj = xdrbg_obj
+        self.__xof_name = xof_name
+        self.__desired_length_of_only_the_random_output_key = desired_length_of_only_the_random_output_key
+        self.__store_persistently = store_persistently
+        self.__wipe_consumed_keys = wipe_consumed_keys
+        self.__generate_keys = generate_keys
+        self.number_of_keys_per_xdrbg_generate: int = (
+            xdrbg_obj.max_output_bytes_allowed_during_xdrbg_generate - xdrbg_obj.xdrbg_state_size
+        ) // desired_length_of_only_the_random_output_key
+        self.__buffer_of_keys = bytearray()
+        self.__position_of_the_next_key: int = 0
+        self.__state_of_the_key_chain_for_the_buffer_of_keys: Union[bytes, None] = None
+
+    def key_chain_update(self, arbitrary_input_parameter: bytes, current_state_of_the_key_chain: bytes) -> Tuple[bytes, bytes]:
+        """
+        Hands out the next key from the buffer. Only when the buffer is empty or when
+        the current state of the key chain is not the state which the buffer has been
+        generated for, the arbitrary input parameter is absorbed into the Xdrbg and a
+        new buffer of keys is generated, otherwise the arbitrary input parameter is not
+        used and the state of the key chain stays the same.
+
+        Parameters
+        ----------
+
+        arbitrary_input_parameter : bytes
+
+        current_state_of_the_key_chain : bytes
+
+        Returns
+        -------
+
+        A tuple of (new_state_of_key_chain_using_xdrbg, random_output) both in bytes.
+        """
+        if (self.__position_of_the_next_key == len(self.__buffer_of_keys)
+                or current_state_of_the_key_chain != self.__state_of_the_key_chain_for_the_buffer_of_keys):
+            if self.__wipe_consumed_keys:
+                self.__buffer_of_keys[:] = bytes(len(self.__buffer_of_keys))
+            self.__state_of_the_key_chain_for_the_buffer_of_keys, random_output = self.__generate_keys(
+                arbitrary_input_parameter, current_state_of_the_key_chain, self.__xdrbg_obj, self.__xof_name,
+                self.number_of_keys_per_xdrbg_generate * self.__desired_length_of_only_the_random_output_key,
+                self.__store_persistently)
+            self.__buffer_of_keys = bytearray(random_output)
+            self.__position_of_the_next_key = 0
+
+        start: int = self.__position_of_the_next_key
+        self.__position_of_the_next_key += self.__desired_length_of_only_the_random_output_key
+        random_output_key: bytes = bytes(self.__buffer_of_keys[start:self.__position_of_the_next_key])
+        if self.__wipe_consumed_keys:
+            self.__buffer_of_keys[start:self.__position_of_the_next_key] = bytes(
+                self.__desired_length_of_only_the_random_output_key)
+
+        return (self.__state_of_the_key_chain_for_the_buffer_of_keys, random_output_key)
+
+LENGTH_OF_OUTPUT_KEY: dict[str, int] = {"shake_128": 16, "shake_256" : 32, "turboshake_128": 16, "turboshake_256": 32}
 
 class ShakeXdrbgKeychain:
 
-    def __init__(self, xof, store_persistently: Union[bool, None] = None) -> None:
+    def __init__(self, xof, store_persistently: Union[bool, None] = None,
+                 buffer_keys_from_xdrbg_generate: bool = False, wipe_consumed_keys: bool = False,
+                 absorb_input_as_alpha: bool = False) -> None:
         self.__xof = xof
         self.__store_persistently = store_persistently
         self.__shake_xdrbg_obj = ShakeBasedXdrbg(self.__xof)
         self.__desired_length_of_only_the_random_output_key = LENGTH_OF_OUTPUT_KEY.get(xof.name)
+        self.__generate_keys = xdrbg_generate_keys_with_input_as_alpha if absorb_input_as_alpha else xdrbg_generate_keys
+        self.__xdrbg_key_buffer: Union[XdrbgKeyBuffer, None] = XdrbgKeyBuffer(
+            self.__shake_xdrbg_obj, self.__xof.name, self.__desired_length_of_only_the_random_output_key,
+            self.__store_persistently, wipe_consumed_keys, self.__generate_keys) if buffer_keys_from_xdrbg_generate else None
+
+        # The update is either the key buffer or the closure from build_xdrbg_key_chain_update(). It is exposed
+        # directly on the instance, while the method key_chain_update() of the class delegates to it.
+        self.__key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = (
+            self.__xdrbg_key_buffer.key_chain_update if self.__xdrbg_key_buffer is not None
+            else build_xdrbg_key_chain_update(
+                self.__shake_xdrbg_obj, self.__xof.name, self.__desired_length_of_only_the_random_output_key,
+                self.__store_persistently, absorb_input_as_alpha))
+        self.key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = self.__key_chain_update
 
     def key_chain_instantiate(self, seed_for_xdrbg_instantiate: bytes) -> bytes:
         """ 
@@ -89,18 +316,97 @@ class ShakeXdrbgKeychain:
         A tuple of (new_state_of_key_chain_using_xdrbg, random_output) both in bytes.
         """
 
-        return xdrbg_generate_keys(arbitrary_input_parameter, current_state_of_key_chain_using_shake_based_xdrbg,
-                                   self.__shake_xdrbg_obj, self.__xof.name, self.__desired_length_of_only_the_random_output_key,
-                                   self.__store_persistently)
+        return self.__key_chain_update(arbitrary_input_parameter, current_state_of_key_chain_using_shake_based_xdrbg)
+
+
+class TurboShakeXdrbgKeychain:
+
+    def __init__(self, turbo_shake_name: str, store_persistently: Union[bool, None] = None,
+                 buffer_keys_from_xdrbg_generate: bool = False, wipe_consumed_keys: bool = False,
+                 absorb_input_as_alpha: bool = False) -> None:
+        self.__turbo_shake_name = turbo_shake_name
+        self.__store_persistently = store_persistently
+        self.__turbo_shake_xdrbg_obj = TurboShakeBasedXdrbg(self.__turbo_shake_name)
+        self.__desired_length_of_only_the_random_output_key = LENGTH_OF_OUTPUT_KEY.get(turbo_shake_name)
+        self.__generate_keys = xdrbg_generate_keys_with_input_as_alpha if absorb_input_as_alpha else xdrbg_generate_keys
+        self.__xdrbg_key_buffer: Union[XdrbgKeyBuffer, None] = XdrbgKeyBuffer(
+            self.__turbo_shake_xdrbg_obj, self.__turbo_shake_name, self.__desired_length_of_only_the_random_output_key,
+            self.__store_persistently, wipe_consumed_keys, self.__generate_keys) if buffer_keys_from_xdrbg_generate else None
+
+        self.__key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = (
+            self.__xdrbg_key_buffer.key_chain_update if self.__xdrbg_key_buffer is not None
+            else build_xdrbg_key_chain_update(
+                self.__turbo_shake_xdrbg_obj, self.__turbo_shake_name, self.__desired_length_of_only_the_random_output_key,
+                self.__store_persistently, absorb_input_as_alpha))
+        self.key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = self.__key_chain_update
+
+    def key_chain_instantiate(self, seed_for_xdrbg_instantiate: bytes) -> bytes:
+        """ 
+        Generates the initial state of the key chain.
+
+        Parameters
+        ----------
+
+        seed_for_xdrbg_instantiate : bytes
+                                     This is the arbitrary input parameter from the randomness extractor Circulant
+                                     which acts as I_init.                                            
+
+        Returns
+        -------
+
+        The initial state S_init of the key chain.
+        """
+
+        # Generate an initial state of the XDRBG at first which will be the initial state of the key chain
+        initial_state_of_key_chain_using_turbo_shake_based_xdrbg: bytes = self.__turbo_shake_xdrbg_obj.xdrbg_instantiate(
+            seed_for_xdrbg_instantiate
+        )
+
+        return initial_state_of_key_chain_using_turbo_shake_based_xdrbg
+
+    def key_chain_update(
+            self, arbitrary_input_parameter: bytes, current_state_of_key_chain_using_turbo_shake_based_xdrbg: bytes) -> Tuple[bytes, bytes]:
+        """
+        Generates the random output and the new XDRBG state which serves as the state of the key chain.
+
+        Parameters
+        ----------
+
+        arbitrary_input_parameter : bytes
+                                    This is the arbitrary input parameter from the randomness
+                                    extractor Circulant.
+
+        current_state_of_key_chain_using_turbo_shake_based_xdrbg : bytes
+
+        Returns
+        -------
+
+        A tuple of (new_state_of_key_chain_using_xdrbg, random_output) both in bytes.
+        """
+
+        return self.__key_chain_update(arbitrary_input_parameter, current_state_of_key_chain_using_turbo_shake_based_xdrbg)
 
 
 class AsconXdrbgKeychain:
 
-    def __init__(self, xof, store_persistently: Union[bool, None] = None) -> None:
-        self.__ascon_xof_name = "Ascon-Xof"
+    def __init__(self, xof, store_persistently: Union[bool, None] = None, ascon_xof_name: str = "Ascon-Xof",
+                 buffer_keys_from_xdrbg_generate: bool = False, wipe_consumed_keys: bool = False,
+                 absorb_input_as_alpha: bool = False) -> None:
+        self.__ascon_xof_name = ascon_xof_name
         self.__store_persistently = store_persistently
         self.__ascon_xdrbg_obj = AsconBasedXdrbg(xof, self.__ascon_xof_name)
         self.__desired_length_of_only_the_random_output_key = 16
+        self.__generate_keys = xdrbg_generate_keys_with_input_as_alpha if absorb_input_as_alpha else xdrbg_generate_keys
+        self.__xdrbg_key_buffer: Union[XdrbgKeyBuffer, None] = XdrbgKeyBuffer(
+            self.__ascon_xdrbg_obj, self.__ascon_xof_name, self.__desired_length_of_only_the_random_output_key,
+            self.__store_persistently, wipe_consumed_keys, self.__generate_keys) if buffer_keys_from_xdrbg_generate else None
+
+        self.__key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = (
+            self.__xdrbg_key_buffer.key_chain_update if self.__xdrbg_key_buffer is not None
+            else build_xdrbg_key_chain_update(
+                self.__ascon_xdrbg_obj, self.__ascon_xof_name, self.__desired_length_of_only_the_random_output_key,
+                self.__store_persistently, absorb_input_as_alpha))
+        self.key_chain_update: Callable[[bytes, bytes], Tuple[bytes, bytes]] = self.__key_chain_update
 
     def key_chain_instantiate(self, seed_for_xdrbg_instantiate: bytes) -> bytes:
         """ 
@@ -146,6 +452,4 @@ class AsconXdrbgKeychain:
         A tuple of (new_state_of_key_chain_using_xdrbg, random_output) both in bytes.
         """
 
-        return xdrbg_generate_keys(arbitrary_input_parameter, current_state_of_key_chain_using_ascon_based_xdrbg,
-                                   self.__ascon_xdrbg_obj, self.__ascon_xof_name, self.__desired_length_of_only_the_random_output_key,
-                                   self.__store_persistently)
+        return self.__key_chain_update(arbitrary_input_parameter, current_state_of_key_chain_using_ascon_based_xdrbg)
@@ -0,0 +1,71 @@
+import unittest
+import os
+import sys
+import random
+from ascon._ascon import ascon_hash
+
+# Get the directory of the current file
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Get the parent directory of the current file's directory
+parent_dir = os.path.dirname(current_dir)
+
+# Add the parent directory to sys.path
+sys.path.append(parent_dir)
+
+from cryptographicprimitives.ascon_operations import ascon_xof, ascon_xof_many
+from cryptographicprimitives.xdrbg_operations import AsconBasedXdrbg
+
+class TestAsconXof(unittest.TestCase):
+
+    def test_for_ascon_xof_being_equal_to_the_reference_implementation(self):
+        for ascon_xof_name in ["Ascon-Xof", "Ascon-Xofa"]:
+            for length_of_message in range(0, 25):
+                message = os.urandom(length_of_message)
+                for length_of_output in [0, 1, 7, 8, 9, 32, 256]:
+                    self.assertEqual(ascon_hash(message, ascon_xof_name, length_of_output),
+                                     ascon_xof(message, ascon_xof_name, length_of_output))
+
+    def test_for_ascon_based_xdrbg_being_equal_with_both_implementations(self):
+        for ascon_xof_name in ["Ascon-Xof", "Ascon-Xofa"]:
+            self.__check_ascon_based_xdrbg_being_equal_with_both_implementations(ascon_xof_name)
+
+    def __check_ascon_based_xdrbg_being_equal_with_both_implementations(self, ascon_xof_name):
+        reference_ascon_xdrbg_obj = AsconBasedXdrbg(ascon_hash, ascon_xof_name)
+        ascon_xdrbg_obj = AsconBasedXdrbg(ascon_xof, ascon_xof_name)
+        seed_instantiate = os.urandom(24)
+        alpha_instantiate = os.urandom(random.randint(0, 84))
+        xdrbg_state = ascon_xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate)
+        self.assertEqual(reference_ascon_xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate), xdrbg_state)
+
+        seed_reseed = os.urandom(24)
+        reseeded_xdrbg_state = ascon_xdrbg_obj.xdrbg_reseed(xdrbg_state, seed_reseed)
+        self.assertEqual(reference_ascon_xdrbg_obj.xdrbg_reseed(xdrbg_state, seed_reseed), reseeded_xdrbg_state)
+        self.assertEqual(reference_ascon_xdrbg_obj.xdrbg_generate(reseeded_xdrbg_state, 16),
+                         ascon_xdrbg_obj.xdrbg_generate(reseeded_xdrbg_state, 16))
+
+    def test_for_ascon_xof_many_being_equal_to_ascon_xof(self):
+        for ascon_xof_name in ["Ascon-Xof", "Ascon-Xofa"]:
+            list_of_messages = [os.urandom(random.randint(0, 40)) for _ in range(64)]
+            for length_of_output in [0, 9, 32]:
+                self.assertEqual([ascon_xof(message, ascon_xof_name, length_of_output) for message in list_of_messages],
+                                 ascon_xof_many(list_of_messages, ascon_xof_name, length_of_output))
+
+    def test_for_xdrbg_instantiate_many_and_xdrbg_reseed_many_being_equal_to_single_calls(self):
+        for ascon_xof_name in ["Ascon-Xof", "Ascon-Xofa"]:
+            ascon_xdrbg_obj = AsconBasedXdrbg(ascon_xof, ascon_xof_name)
+            list_of_seeds = [os.urandom(24) for _ in range(16)]
+            alpha = os.urandom(random.randint(0, 84))
+            list_of_xdrbg_states = ascon_xdrbg_obj.xdrbg_instantiate_many(list_of_seeds, alpha)
+            self.assertEqual([ascon_xdrbg_obj.xdrbg_instantiate(seed, alpha) for seed in list_of_seeds], list_of_xdrbg_states)
+            self.assertEqual([ascon_xdrbg_obj.xdrbg_reseed(xdrbg_state, seed, alpha)
+                              for xdrbg_state, seed in zip(list_of_xdrbg_states, list_of_seeds)],
+                             ascon_xdrbg_obj.xdrbg_reseed_many(list_of_xdrbg_states, list_of_seeds, alpha))
+            self.assertEqual([ascon_xdrbg_obj.xdrbg_reseed(list_of_xdrbg_states[0], seed) for seed in list_of_seeds],
+                             ascon_xdrbg_obj.xdrbg_reseed_many(list_of_xdrbg_states[0], list_of_seeds))
+            with self.assertRaises(ValueError):
+                ascon_xdrbg_obj.xdrbg_instantiate_many(list_of_seeds + [os.urandom(16)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 import os
 import sys
-from hashlib import sha256, sha512, sha3_256, sha3_512
+from hashlib import sha256, sha512, sha3_256, sha3_512, blake2s, blake2b
 
 # Get the directory of the current file
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,7 +12,8 @@ parent_dir = os.path.dirname(current_dir)
 # Add the parent directory to sys.path
 sys.path.append(parent_dir)
 
-from cryptographicprimitives.hkdf_operations import Hkdf
+from cryptographicprimitives import hkdf_operations
+from cryptographicprimitives.hkdf_operations import Hkdf, HKDF_BACKENDS
 
 class TestHkdf(unittest.TestCase):
 
@@ -39,5 +40,125 @@ class TestHkdf(unittest.TestCase):
             with self.assertRaises(ValueError):
                 hkdf_obj.hkdf_expand(psuedo_random_key,None,DESIRED_OUTPUT_LENGTH)
 
+    def test_for_hkdf_with_the_default_salt_matching_the_rfc_5869_test_vector(self):
+        # Test Case 3 of RFC 5869 (SHA-256 with a zero-length salt and a zero-length info)
+        hkdf_obj = Hkdf(sha256)
+        skm = bytes.fromhex("0b" * 22)
+        psuedo_random_key = hkdf_obj.hkdf_extract(None, skm)
+        self.assertEqual(bytes.fromhex("19ef24a32c717b167f33a91d6f648bdf96596776afdb6377ac434c1c293ccb04"), psuedo_random_key)
+        total_output_from_hkdf = hkdf_obj.hkdf_expand(psuedo_random_key, None, 42)
+        self.assertEqual(bytes.fromhex("8da4e775a563c18f715f802a063c5a31b8a11f5c5ee1879ec3454e5f3c738d2d9d201395faa4b61a96c8"), total_output_from_hkdf)
+    def test_for_batched_hkdf_being_equal_to_the_individual_hkdf_calls(self):
+        for hash_func in [sha256, sha512, sha3_256, sha3_512]:
+            hkdf_obj = Hkdf(hash_func)
+            list_of_skms = [os.urandom(32) for _ in range(8)]
+            all_psuedo_random_keys = hkdf_obj.hkdf_extract_many(None, b"".join(list_of_skms), 32)
+            self.assertEqual(b"".join(hkdf_obj.hkdf_extract(None, skm) for skm in list_of_skms), all_psuedo_random_keys)
+            all_outputs_from_hkdf = hkdf_obj.hkdf_expand_many(all_psuedo_random_keys, b"info", 100)
+            digest_size = hkdf_obj.hash_algorithm_digest_size_in_bytes
+            self.assertEqual(b"".join(hkdf_obj.hkdf_expand(all_psuedo_random_keys[i:i+digest_size], b"info", 100)
+                                      for i in range(0, len(all_psuedo_random_keys), digest_size)), all_outputs_from_hkdf)
+    def test_for_hkdf_expand_into_writing_the_same_output_as_hkdf_expand(self):
+        for hash_func in [sha256, sha512, sha3_256, sha3_512]:
+            hkdf_obj = Hkdf(hash_func)
+            psuedo_random_key = hkdf_obj.hkdf_extract(None, os.urandom(32))
+            output_buffer = bytearray(150)
+            hkdf_obj.hkdf_expand_into(psuedo_random_key, b"info", memoryview(output_buffer)[10:110])
+            self.assertEqual(hkdf_obj.hkdf_expand(psuedo_random_key, b"info", 100), output_buffer[10:110])
+            self.assertEqual(bytes(10), output_buffer[0:10])
+            self.assertEqual(bytes(40), output_buffer[110:])
+    def test_for_hkdf_derive_being_equal_to_hkdf_extract_then_expand(self):
+        for hash_func in [sha256, sha512, sha3_256, sha3_512]:
+            for hkdf_backend in HKDF_BACKENDS:
+                hkdf_obj = Hkdf(hash_func, hkdf_backend)
+                skm = os.urandom(64)
+                digest_size = hkdf_obj.hash_algorithm_digest_size_in_bytes
+                for salt, info in [(None, b"info"), (os.urandom(16), None)]:
+                    psuedo_random_key = hkdf_obj.hkdf_extract(salt, skm)
+                    for DESIRED_OUTPUT_LENGTH in [1, 16, digest_size - 1, digest_size, digest_size + 1, 2 * digest_size, 200]:
+                        self.assertEqual(hkdf_obj.hkdf_expand(psuedo_random_key, info, DESIRED_OUTPUT_LENGTH),
+                                         hkdf_obj.derive(skm, salt, info, DESIRED_OUTPUT_LENGTH))
+    def test_for_lazily_expanded_outputs_being_the_prefix_of_the_hkdf_expand_output(self):
+        for hash_func in [sha256, sha512, sha3_256, sha3_512]:
+            hkdf_obj = Hkdf(hash_func)
+            psuedo_random_key = hkdf_obj.hkdf_extract(None, os.urandom(32))
+            maximum_output_length = 255 * hkdf_obj.hash_algorithm_digest_size_in_bytes
+            total_output_from_hkdf = hkdf_obj.hkdf_expand(psuedo_random_key, b"info", maximum_output_length)
+            self.assertEqual(total_output_from_hkdf, b"".join(hkdf_obj.iter_expand(psuedo_random_key, b"info")))
+            list_of_keys = list(hkdf_obj.iter_expand(psuedo_random_key, b"info", 24))
+            self.assertEqual(maximum_output_length // 24, len(list_of_keys))
+            self.assertEqual(total_output_from_hkdf[0:len(list_of_keys) * 24], b"".join(list_of_keys))
+    def test_to_raise_error_at_the_call_of_iter_expand_with_an_invalid_length(self):
+        hkdf_obj = Hkdf(sha256)
+        psuedo_random_key = hkdf_obj.hkdf_extract(None, os.urandom(32))
+        for length_of_each_output in [0, -16]:
+            with self.assertRaises(ValueError):
+                hkdf_obj.iter_expand(psuedo_random_key, b"info", length_of_each_output)
+    def test_for_hkdf_expand_for_multiple_info_parameters_being_equal_to_the_individual_hkdf_expand_calls(self):
+        for hash_func in [sha256, sha512, sha3_256, sha3_512]:
+            hkdf_obj = Hkdf(hash_func)
+            psuedo_random_key = hkdf_obj.hkdf_extract(None, os.urandom(32))
+            list_of_info_parameters = [b"service-%d" % i for i in range(12)]
+            all_outputs_from_hkdf = hkdf_obj.hkdf_expand_for_multiple_info_parameters(psuedo_random_key, list_of_info_parameters, 40)
+            self.assertEqual(b"".join(hkdf_obj.hkdf_expand(psuedo_random_key, info_parameter, 40)
+                                      for info_parameter in list_of_info_parameters), all_outputs_from_hkdf)
+    def test_for_all_hkdf_backends_generating_the_same_output(self):
+        for hash_func in [sha256, sha512, sha3_256, sha3_512, blake2s, blake2b]:
+            skm = os.urandom(64)
+            salt = os.urandom(16)
+            outputs_from_each_hkdf_backend = []
+            for hkdf_backend in HKDF_BACKENDS:
+                hkdf_obj = Hkdf(hash_func, hkdf_backend)
+                psuedo_random_key = hkdf_obj.hkdf_extract(salt, skm)
+                output_buffer = bytearray(100)
+                hkdf_obj.hkdf_expand_into(psuedo_random_key, b"info", memoryview(output_buffer))
+                pseudo_random_keys = hkdf_obj.hkdf_extract_many(salt, [skm, skm[::-1]])
+                outputs_from_each_hkdf_backend.append((psuedo_random_key, hkdf_obj.hkdf_extract(None, skm),
+                                                       hkdf_obj.hkdf_expand(psuedo_random_key, b"info", 100),
+                                                       hkdf_obj.derive_two_output_blocks(skm, salt, b"info"),
+                                                       bytes(output_buffer), pseudo_random_keys,
+                                                       hkdf_obj.hkdf_extract_many(None, [skm]),
+                                                       hkdf_obj.hkdf_expand_many(pseudo_random_keys, b"info", 100),
+                                                       hkdf_obj.hkdf_expand_for_multiple_info_parameters(
+                                                           psuedo_random_key, [b"a", b"b"], 40)))
+            self.assertEqual(1, len(set(outputs_from_each_hkdf_backend)))
+
+    def test_to_raise_error_with_an_output_above_the_limit_for_all_hkdf_backends(self):
+        for hkdf_backend in HKDF_BACKENDS:
+            hkdf_obj = Hkdf(sha256, hkdf_backend)
+            psuedo_random_key = hkdf_obj.hkdf_extract(None, os.urandom(32))
+            length_above_the_limit = 255 * hkdf_obj.hash_algorithm_digest_size_in_bytes + 1
+            self.assertEqual(length_above_the_limit - 1, len(hkdf_obj.hkdf_expand(psuedo_random_key, None, length_above_the_limit - 1)))
+            with self.assertRaises(ValueError):
+                hkdf_obj.hkdf_expand(psuedo_random_key, None, length_above_the_limit)
+            with self.assertRaises(ValueError):
+                hkdf_obj.hkdf_expand_into(psuedo_random_key, None, memoryview(bytearray(length_above_the_limit)))
+            with self.assertRaises(ValueError):
+                hkdf_obj.hkdf_expand_for_multiple_info_parameters(psuedo_random_key, [b"a"], length_above_the_limit)
+            with self.assertRaises(ValueError):
+                hkdf_obj.hkdf_expand_many([psuedo_random_key], None, length_above_the_limit)
+            with self.assertRaises(ValueError):
+                hkdf_obj.derive(os.urandom(32), None, None, length_above_the_limit)
+
+    def test_to_raise_error_with_a_long_salt_for_all_extract_steps(self):
+        hkdf_operations.IS_PERFORMANCE_BENCHMARKING_DONE = False
+        try:
+            for hkdf_backend in HKDF_BACKENDS:
+                hkdf_obj = Hkdf(sha256, hkdf_backend)
+                long_salt = os.urandom(33)
+                skm = os.urandom(32)
+                with self.assertRaises(ValueError):
+                    hkdf_obj.hkdf_extract(long_salt, skm)
+                with self.assertRaises(ValueError):
+                    hkdf_obj.hkdf_extract_many(long_salt, [skm])
+                with self.assertRaises(ValueError):
+                    hkdf_obj.derive_two_output_blocks(skm, long_salt)
+                for DESIRED_OUTPUT_LENGTH in [16, 64, 100]:
+                    with self.assertRaises(ValueError):
+                        hkdf_obj.derive(skm, long_salt, None, DESIRED_OUTPUT_LENGTH)
+                self.assertEqual(hkdf_obj.hkdf_extract(None, skm), hkdf_obj.hkdf_extract(bytes(32), skm))
+        finally:
+            hkdf_operations.IS_PERFORMANCE_BENCHMARKING_DONE = True
+
 if __name__ == "__main__":
     unittest.main()             
\ No newline at end of file
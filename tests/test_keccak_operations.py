@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+import random
+from hashlib import shake_128, shake_256
+
+# Get the directory of the current file
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Get the parent directory of the current file's directory
+parent_dir = os.path.dirname(current_dir)
+
+# Add the parent directory to sys.path
+sys.path.append(parent_dir)
+
+from cryptographicprimitives.keccak_operations import shake_many
+from cryptographicprimitives.xdrbg_operations import ShakeBasedXdrbg
+
+class TestKeccak(unittest.TestCase):
+
+    def test_for_shake_many_being_equal_to_hashlib(self):
+        for xof in [shake_128, shake_256]:
+            # The lengths of the messages cover the boundaries of the rates of 168 and 136 bytes.
+            list_of_messages = [os.urandom(length_of_message) for length_of_message in
+                                list(range(0, 40)) + [135, 136, 137, 167, 168, 169, 300]]
+            for length_of_output in [0, 1, 32, 136, 168, 400]:
+                self.assertEqual([xof(message).digest(length_of_output) for message in list_of_messages],
+                                 shake_many(list_of_messages, xof().name, length_of_output))
+
+    def test_for_xdrbg_instantiate_many_and_xdrbg_reseed_many_being_equal_to_single_calls(self):
+        for xof in [shake_128(), shake_256()]:
+            for shake_batch_engine in ["hashlib", "numpy"]:
+                shake_xdrbg_obj = ShakeBasedXdrbg(xof, shake_batch_engine)
+                list_of_seeds = [os.urandom(48) for _ in range(16)]
+                alpha = os.urandom(random.randint(0, 84))
+                list_of_xdrbg_states = shake_xdrbg_obj.xdrbg_instantiate_many(list_of_seeds, alpha)
+                self.assertEqual([shake_xdrbg_obj.xdrbg_instantiate(seed, alpha) for seed in list_of_seeds],
+                                 list_of_xdrbg_states)
+                self.assertEqual([shake_xdrbg_obj.xdrbg_reseed(list_of_xdrbg_states[0], seed) for seed in list_of_seeds],
+                                 shake_xdrbg_obj.xdrbg_reseed_many(list_of_xdrbg_states[0], list_of_seeds))
+                self.assertEqual([shake_xdrbg_obj.xdrbg_reseed(xdrbg_state, seed, alpha)
+                                  for xdrbg_state, seed in zip(list_of_xdrbg_states, list_of_seeds)],
+                                 shake_xdrbg_obj.xdrbg_reseed_many(list_of_xdrbg_states, list_of_seeds, alpha))
+
+    def test_for_invalid_shake_batch_engine(self):
+        with self.assertRaises(ValueError):
+            ShakeBasedXdrbg(shake_128(), "invalid_engine")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import os
+import sys
+from hashlib import sha256, sha512, sha3_256, sha3_512, blake2s, blake2b, shake_128, shake_256
+from ascon._ascon import ascon_hash
+
+# Get the directory of the current file
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Get the parent directory of the current file's directory
+parent_dir = os.path.dirname(current_dir)
+
+# Add the parent directory to sys.path
+sys.path.append(parent_dir)
+
+from cryptographicprimitives.hkdf_operations import Hkdf, HKDF_BACKENDS
+from cryptographicprimitives.prg_operations import Prg, PRG_AES_BACKENDS
+from cryptographicprimitives.xdrbg_operations import ShakeBasedXdrbg, TurboShakeBasedXdrbg, AsconBasedXdrbg
+from keychains.hkdf_keychain import HkdfKeyChain
+from keychains.prg_keychain import PrgKeyChain
+from keychains.xdrbg_keychain import ShakeXdrbgKeychain, TurboShakeXdrbgKeychain, AsconXdrbgKeychain
+
+class TestKeyChainUpdate(unittest.TestCase):
+
+    def assert_key_chain_update_is_equal_to_the_primitives(self, key_chain, key_chain_class, update_with_the_primitives,
+                                                            initial_state, length_of_arbitrary_input_parameter):
+        current_state_of_key_chain = initial_state
+        for _ in range(5):
+            arbitrary_input_parameter = os.urandom(length_of_arbitrary_input_parameter)
+            new_state_of_key_chain, random_output = key_chain.key_chain_update(
+                arbitrary_input_parameter, current_state_of_key_chain)
+            self.assertEqual(update_with_the_primitives(arbitrary_input_parameter, current_state_of_key_chain),
+                             (bytes(new_state_of_key_chain), bytes(random_output)))
+            self.assertEqual((bytes(new_state_of_key_chain), bytes(random_output)),
+                             tuple(map(bytes, key_chain_class.key_chain_update(
+                                 key_chain, arbitrary_input_parameter, current_state_of_key_chain))))
+            current_state_of_key_chain = new_state_of_key_chain
+
+    def test_for_prg_key_chain_update_being_equal_to_prg_refresh_then_prg_next(self):
+        configurations = [(security_parameter_lambda, prg_aes_backend, "aes")
+                          for prg_aes_backend in PRG_AES_BACKENDS for security_parameter_lambda in [16, 24, 32]]
+        for security_parameter_lambda, prg_aes_backend, prg_stream_cipher in configurations + [(32, None, "chacha20")]:
+            prg_key_chain = PrgKeyChain(security_parameter_lambda, prg_aes_backend=prg_aes_backend,
+                                        prg_stream_cipher=prg_stream_cipher)
+            prg_obj = Prg(security_parameter_lambda, bytes(security_parameter_lambda), prg_aes_backend, prg_stream_cipher)
+
+            def update_with_the_primitives(arbitrary_input_parameter, current_state_of_key_chain):
+                random_output, new_state_of_key_chain = prg_obj.prg_next(
+                    prg_obj.prg_refresh(current_state_of_key_chain, arbitrary_input_parameter))
+                return (bytes(new_state_of_key_chain), bytes(random_output))
+
+            initial_state = prg_key_chain.key_chain_instantiate(os.urandom(security_parameter_lambda))
+            self.assert_key_chain_update_is_equal_to_the_primitives(
+                prg_key_chain, PrgKeyChain, update_with_the_primitives, initial_state, security_parameter_lambda)
+
+    def test_for_hkdf_key_chain_update_being_equal_to_hkdf_extract_then_expand(self):
+        for hkdf_backend in HKDF_BACKENDS:
+            for hash_func in [sha256, sha512, sha3_256, sha3_512, blake2s, blake2b]:
+                hkdf_key_chain = HkdfKeyChain(hash_func, hkdf_backend=hkdf_backend)
+                hkdf_obj = Hkdf(hash_func, hkdf_backend)
+                digest_size = hkdf_obj.hash_algorithm_digest_size_in_bytes
+
+                def update_with_the_primitives(arbitrary_input_parameter, current_state_of_key_chain):
+                    total_output_from_hkdf = hkdf_obj.hkdf_expand(
+                        hkdf_obj.hkdf_extract(None, arbitrary_input_parameter + current_state_of_key_chain), None, 2 * digest_size)
+                    return (total_output_from_hkdf[0:digest_size], total_output_from_hkdf[digest_size:])
+
+                initial_state = hkdf_key_chain.key_chain_instantiate(os.urandom(64))
+                self.assert_key_chain_update_is_equal_to_the_primitives(
+                    hkdf_key_chain, HkdfKeyChain, update_with_the_primitives, initial_state, 64)
+
+    def test_for_xdrbg_key_chain_update_being_equal_to_xdrbg_reseed_then_generate(self):
+        for absorb_input_as_alpha in [False, True]:
+            xdrbg_key_chains = [
+                (ShakeXdrbgKeychain(shake_128(), absorb_input_as_alpha=absorb_input_as_alpha), ShakeXdrbgKeychain,
+                 ShakeBasedXdrbg(shake_128()), 16),
+                (ShakeXdrbgKeychain(shake_256(), absorb_input_as_alpha=absorb_input_as_alpha), ShakeXdrbgKeychain,
+                 ShakeBasedXdrbg(shake_256()), 32),
+                (TurboShakeXdrbgKeychain("turboshake_128", absorb_input_as_alpha=absorb_input_as_alpha),
+                 TurboShakeXdrbgKeychain, TurboShakeBasedXdrbg("turboshake_128"), 16),
+                (TurboShakeXdrbgKeychain("turboshake_256", absorb_input_as_alpha=absorb_input_as_alpha),
+                 TurboShakeXdrbgKeychain, TurboShakeBasedXdrbg("turboshake_256"), 32),
+                (AsconXdrbgKeychain(ascon_hash, ascon_xof_name="Ascon-Xof", absorb_input_as_alpha=absorb_input_as_alpha),
+                 AsconXdrbgKeychain, AsconBasedXdrbg(ascon_hash, "Ascon-Xof"), 16),
+                (AsconXdrbgKeychain(ascon_hash, ascon_xof_name="Ascon-Xofa", absorb_input_as_alpha=absorb_input_as_alpha),
+                 AsconXdrbgKeychain, AsconBasedXdrbg(ascon_hash, "Ascon-Xofa"), 16),
+            ]
+            for xdrbg_key_chain, xdrbg_key_chain_class, xdrbg_obj, length_of_output_key in xdrbg_key_chains:
+
+                def update_with_the_primitives(arbitrary_input_parameter, current_state_of_key_chain):
+                    if absorb_input_as_alpha:
+                        return xdrbg_obj.xdrbg_generate(current_state_of_key_chain, length_of_output_key, arbitrary_input_parameter)
+                    return xdrbg_obj.xdrbg_generate(
+                        xdrbg_obj.xdrbg_reseed(current_state_of_key_chain, arbitrary_input_parameter), length_of_output_key)
+
+                initial_state = xdrbg_key_chain.key_chain_instantiate(os.urandom(64))
+                self.assert_key_chain_update_is_equal_to_the_primitives(
+                    xdrbg_key_chain, xdrbg_key_chain_class, update_with_the_primitives, initial_state, 64)
+
+    def test_for_context_keys_being_equal_to_hkdf_expand_for_each_info_label(self):
+        for hkdf_backend in HKDF_BACKENDS:
+            for hash_func in [sha256, sha512]:
+                hkdf_key_chain = HkdfKeyChain(hash_func, hkdf_backend=hkdf_backend)
+                current_state_of_key_chain = hkdf_key_chain.key_chain_instantiate(os.urandom(64))
+                list_of_info_labels = [b"service-%d" % i for i in range(5)]
+                context_keys = hkdf_key_chain.key_chain_derive_context_keys(current_state_of_key_chain, list_of_info_labels)
+                self.assertEqual(len(list_of_info_labels), len(set(map(bytes, context_keys))))
+                self.assertNotIn(current_state_of_key_chain, map(bytes, context_keys))
+
+    def test_to_raise_error_with_empty_or_duplicate_info_labels_for_context_keys(self):
+        hkdf_key_chain = HkdfKeyChain(sha256)
+        current_state_of_key_chain = hkdf_key_chain.key_chain_instantiate(os.urandom(64))
+        with self.assertRaises(ValueError):
+            hkdf_key_chain.key_chain_derive_context_keys(current_state_of_key_chain, [b""])
+        with self.assertRaises(ValueError):
+            hkdf_key_chain.key_chain_derive_context_keys(current_state_of_key_chain, [b"service-0", b""])
+        with self.assertRaises(ValueError):
+            hkdf_key_chain.key_chain_derive_context_keys(current_state_of_key_chain, [b"a", b"a"])
+
+if __name__ == '__main__':
+    unittest.main()
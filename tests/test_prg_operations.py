@@ -11,8 +11,13 @@ parent_dir = os.path.dirname(current_dir)
 # Add the parent directory to sys.path
 sys.path.append(parent_dir)
 
-from cryptographicprimitives.prg_operations import Prg
+from Crypto.Cipher import AES, ChaCha20
+from Crypto.Util import Counter
+from cryptographicprimitives.prg_operations import Prg, NONCE_FOR_PRG_NEXT, NONCE_FOR_PRG_REFRESH, PRG_AES_BACKENDS
+from cryptographicprimitives.utils import xor_bytes, xor_bytes_many
+from keychains.prg_keychain import PrgKeyChain
 from keychains.utils import bits_to_bytes
+import numpy
 
 class TestPrg(unittest.TestCase):
 
@@ -33,5 +38,118 @@ class TestPrg(unittest.TestCase):
             refreshed_prg_state = prg_obj.prg_refresh(prg_state_of_all_zeroes,seed_refresh)          
             self.assertEqual(security_parameter_lambda, len(refreshed_prg_state))            
 
+    def test_for_prg_being_equal_to_aes_in_counter_mode(self):
+        for security_parameter_lambda in [16,24,32]:
+            prg_state_of_all_zeroes = bits_to_bytes([0]*(security_parameter_lambda*8))
+            prg_obj = Prg(security_parameter_lambda, prg_state_of_all_zeroes)
+            current_prg_state = os.urandom(security_parameter_lambda)
+            seed_refresh = os.urandom(security_parameter_lambda)
+            input_key = bytes(a ^ b for a, b in zip(current_prg_state, seed_refresh))
+            counter_mode_output_for_prg_refresh = AES.new(input_key, AES.MODE_CTR, counter=Counter.new(
+                32, prefix=NONCE_FOR_PRG_REFRESH, initial_value=0)).encrypt(bytes(2 * security_parameter_lambda))
+            counter_mode_output_for_prg_next = AES.new(current_prg_state, AES.MODE_CTR, counter=Counter.new(
+                32, prefix=NONCE_FOR_PRG_NEXT, initial_value=0)).encrypt(bytes(2 * security_parameter_lambda))
+            self.assertEqual(counter_mode_output_for_prg_refresh[0:security_parameter_lambda],
+                             prg_obj.prg_refresh(current_prg_state, seed_refresh))
+            random_output, new_prg_state = prg_obj.prg_next(current_prg_state)
+            self.assertEqual(counter_mode_output_for_prg_next, random_output + new_prg_state)
+
+    def test_for_prg_refresh_and_next_being_equal_to_prg_refresh_followed_by_prg_next(self):
+        for security_parameter_lambda in [16,24,32]:
+            prg_state_of_all_zeroes = bits_to_bytes([0]*(security_parameter_lambda*8))
+            prg_obj = Prg(security_parameter_lambda, prg_state_of_all_zeroes)
+            current_prg_state = os.urandom(security_parameter_lambda)
+            seed_refresh = os.urandom(security_parameter_lambda)
+            random_output, new_prg_state = prg_obj.prg_refresh_and_next(current_prg_state, seed_refresh)
+            self.assertEqual(prg_obj.prg_next(prg_obj.prg_refresh(current_prg_state, seed_refresh)),
+                             (bytes(random_output), bytes(new_prg_state)))
+
+    def test_for_xor_bytes_and_xor_bytes_many_being_equal_to_bytewise_xor(self):
+        for security_parameter_lambda in [16,24,32]:
+            list_of_parameters_1 = [os.urandom(security_parameter_lambda) for _ in range(8)]
+            list_of_parameters_2 = [os.urandom(security_parameter_lambda) for _ in range(8)]
+            list_of_expected_outputs = [bytes(a ^ b for a, b in zip(parameter_1, parameter_2))
+                                        for parameter_1, parameter_2 in zip(list_of_parameters_1, list_of_parameters_2)]
+            self.assertEqual(list_of_expected_outputs,
+                             [xor_bytes(parameter_1, parameter_2)
+                              for parameter_1, parameter_2 in zip(list_of_parameters_1, list_of_parameters_2)])
+            xored_parameters = xor_bytes_many(
+                numpy.frombuffer(b"".join(list_of_parameters_1), dtype=numpy.uint8).reshape(8, security_parameter_lambda),
+                numpy.frombuffer(b"".join(list_of_parameters_2), dtype=numpy.uint8).reshape(8, security_parameter_lambda))
+            self.assertEqual(b"".join(list_of_expected_outputs), xored_parameters.tobytes())
+
+    def test_to_raise_error_with_parameters_of_unequal_length_for_xor_bytes(self):
+        for security_parameter_lambda in [16,24,32]:
+            with self.assertRaises(ValueError):
+                xor_bytes(os.urandom(security_parameter_lambda), os.urandom(security_parameter_lambda - 1))
+            with self.assertRaises(ValueError):
+                xor_bytes(os.urandom(security_parameter_lambda), os.urandom(security_parameter_lambda + 1))
+            prg_key_chain = PrgKeyChain(security_parameter_lambda)
+            current_state_of_key_chain = prg_key_chain.key_chain_instantiate(os.urandom(security_parameter_lambda))
+            with self.assertRaises(ValueError):
+                prg_key_chain.key_chain_update(os.urandom(security_parameter_lambda - 1), current_state_of_key_chain)
+
+    def test_to_raise_error_with_records_of_wrong_length_for_prg_refresh_many(self):
+        for security_parameter_lambda in [16,24,32]:
+            prg_obj = Prg(security_parameter_lambda, bits_to_bytes([0]*(security_parameter_lambda*8)))
+            list_of_prg_states = [os.urandom(security_parameter_lambda) for _ in range(2)]
+            with self.assertRaises(ValueError):
+                prg_obj.prg_refresh_many(list_of_prg_states, [os.urandom(security_parameter_lambda + 8),
+                                                              os.urandom(security_parameter_lambda - 8)])
+            with self.assertRaises(ValueError):
+                prg_obj.prg_refresh_many(os.urandom(security_parameter_lambda + 1), [os.urandom(security_parameter_lambda)])
+            with self.assertRaises(ValueError):
+                prg_obj.prg_refresh_many(list_of_prg_states, numpy.zeros((2, security_parameter_lambda + 1), dtype=numpy.uint8))
+            with self.assertRaises(ValueError):
+                prg_obj.prg_refresh_many(list_of_prg_states, [os.urandom(security_parameter_lambda)] * 3)
+            with self.assertRaises(ValueError):
+                xor_bytes_many(numpy.zeros((2, security_parameter_lambda), dtype=numpy.uint8),
+                               numpy.zeros((3, security_parameter_lambda), dtype=numpy.uint8))
+
+    def test_for_prg_refresh_many_being_equal_to_prg_refresh(self):
+        for security_parameter_lambda in [16,24,32]:
+            prg_state_of_all_zeroes = bits_to_bytes([0]*(security_parameter_lambda*8))
+            prg_obj = Prg(security_parameter_lambda, prg_state_of_all_zeroes)
+            current_prg_state = os.urandom(security_parameter_lambda)
+            list_of_seeds = [os.urandom(security_parameter_lambda) for _ in range(8)]
+            self.assertEqual([prg_obj.prg_refresh(current_prg_state, seed) for seed in list_of_seeds],
+                             prg_obj.prg_refresh_many(current_prg_state, list_of_seeds))
+
+    def test_for_all_prg_aes_backends_being_equal(self):
+        for security_parameter_lambda in [16,24,32]:
+            prg_state_of_all_zeroes = bits_to_bytes([0]*(security_parameter_lambda*8))
+            current_prg_state = os.urandom(security_parameter_lambda)
+            seed_refresh = os.urandom(security_parameter_lambda)
+            list_of_outputs_for_each_prg_aes_backend = []
+            for prg_aes_backend in PRG_AES_BACKENDS:
+                prg_obj = Prg(security_parameter_lambda, prg_state_of_all_zeroes, prg_aes_backend)
+                random_output, new_prg_state = prg_obj.prg_refresh_and_next(current_prg_state, seed_refresh)
+                list_of_outputs_for_each_prg_aes_backend.append(
+                    (prg_obj.prg_refresh(current_prg_state, seed_refresh), prg_obj.prg_next(current_prg_state),
+                     bytes(random_output), bytes(new_prg_state)))
+            self.assertEqual(len(set(list_of_outputs_for_each_prg_aes_backend)), 1)
+
+    def test_to_raise_error_with_an_invalid_prg_aes_backend(self):
+        with self.assertRaises(ValueError):
+            Prg(16, bits_to_bytes([0]*128), "invalid_backend")
+
+    def test_for_prg_using_chacha20_being_equal_to_chacha20_keystream(self):
+        prg_state_of_all_zeroes = bits_to_bytes([0]*(32*8))
+        prg_obj = Prg(32, prg_state_of_all_zeroes, prg_stream_cipher="chacha20")
+        current_prg_state = os.urandom(32)
+        seed_refresh = os.urandom(32)
+        input_key = bytes(a ^ b for a, b in zip(current_prg_state, seed_refresh))
+        keystream_for_prg_refresh = ChaCha20.new(key=input_key, nonce=NONCE_FOR_PRG_REFRESH).encrypt(bytes(32))
+        keystream_for_prg_next = ChaCha20.new(key=keystream_for_prg_refresh, nonce=NONCE_FOR_PRG_NEXT).encrypt(bytes(64))
+        self.assertEqual(keystream_for_prg_refresh, prg_obj.prg_refresh(current_prg_state, seed_refresh))
+        random_output, new_prg_state = prg_obj.prg_refresh_and_next(current_prg_state, seed_refresh)
+        self.assertEqual(keystream_for_prg_next, bytes(random_output) + bytes(new_prg_state))
+        self.assertEqual(prg_obj.prg_next(keystream_for_prg_refresh), (bytes(random_output), bytes(new_prg_state)))
+
+    def test_to_raise_error_with_the_security_parameter_lambda_for_chacha20(self):
+        for security_parameter_lambda in [16,24]:
+            with self.assertRaises(ValueError):
+                Prg(security_parameter_lambda, bits_to_bytes([0]*(security_parameter_lambda*8)), prg_stream_cipher="chacha20")
+
 if __name__ == "__main__":
     unittest.main()            
\ No newline at end of file
@@ -2,6 +2,7 @@ import unittest
 import os
 import sys
 import random
+import numpy
 from hashlib import shake_128, shake_256
 from ascon._ascon import ascon_hash
 
@@ -14,16 +15,23 @@ parent_dir = os.path.dirname(current_dir)
 # Add the parent directory to sys.path
 sys.path.append(parent_dir)
 
-from cryptographicprimitives.xdrbg_operations import ShakeBasedXdrbg, AsconBasedXdrbg
+from cryptographicprimitives.xdrbg_operations import ShakeBasedXdrbg, TurboShakeBasedXdrbg, AsconBasedXdrbg
+from cryptographicprimitives.utils import encode_function
+from Crypto.Hash import TurboSHAKE128
+from keychains.xdrbg_keychain import XdrbgKeyBuffer, xdrbg_generate_keys, xdrbg_generate_keys_with_input_as_alpha, \
+    ShakeXdrbgKeychain, AsconXdrbgKeychain
 
 shake_128_xdrbg_obj = ShakeBasedXdrbg(shake_128())
 shake_256_xdrbg_obj = ShakeBasedXdrbg(shake_256())
+turbo_shake_128_xdrbg_obj = TurboShakeBasedXdrbg("turboshake_128")
+turbo_shake_256_xdrbg_obj = TurboShakeBasedXdrbg("turboshake_256")
 ascon_xdrbg_obj = AsconBasedXdrbg(ascon_hash, "Ascon-Xof")
+ascon_xofa_xdrbg_obj = AsconBasedXdrbg(ascon_hash, "Ascon-Xofa")
 
 class TestXdrbg(unittest.TestCase):
 
     def test_for_reseeded_xdrbg_state_being_equal_to_the_desired_length(self):
-        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
             seed_instantiate = os.urandom(48)
             alpha_instantiate = os.urandom(random.randint(0, 84))
             xdrbg_state = xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate)
@@ -35,13 +43,13 @@ class TestXdrbg(unittest.TestCase):
             self.assertEqual(xdrbg_obj.XDRBG_STATE_SIZE, len(reseeded_xdrbg_state))
 
     def test_for_random_output_and_new_xdrbg_state_being_equal_to_their_desired_lengths(self):
-        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
             seed_instantiate = os.urandom(48)
             alpha_instantiate = os.urandom(random.randint(0, 84))
             xdrbg_state = xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate)
 
             alpha_generate = os.urandom(random.randint(0, 84))
-            if xdrbg_obj in [shake_128_xdrbg_obj, ascon_xdrbg_obj]:
+            if xdrbg_obj in [shake_128_xdrbg_obj, turbo_shake_128_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
                 DESIRED_OUTPUT_LENGTH = 16
             else:
                 DESIRED_OUTPUT_LENGTH = 32
@@ -50,21 +58,21 @@ class TestXdrbg(unittest.TestCase):
             self.assertEqual(xdrbg_obj.XDRBG_STATE_SIZE, len(new_xdrbg_state))
 
     def test_for_initial_xdrbg_state_being_equal_to_the_desired_length(self):
-        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
             seed_instantiate = os.urandom(48)
             alpha_instantiate = os.urandom(random.randint(0, 84))
             initial_state_of_xdrbg = xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate)
             self.assertEqual(xdrbg_obj.XDRBG_STATE_SIZE, len(initial_state_of_xdrbg))
 
     def test_to_raise_error_with_the_seed_length_for_xdrbg_instantiate(self):
-        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
             seed_instantiate = os.urandom(16)  # Intentionally incorrect length
             alpha_instantiate = os.urandom(random.randint(0, 84))
             with self.assertRaises(ValueError):
                 xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate)
 
     def test_to_raise_error_with_the_seed_length_for_xdrbg_reseed(self):
-        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
             seed_instantiate = os.urandom(48)
             alpha_instantiate = os.urandom(random.randint(0, 84))
             xdrbg_state = xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate)
@@ -76,7 +84,7 @@ class TestXdrbg(unittest.TestCase):
                 xdrbg_obj.xdrbg_reseed(xdrbg_state, seed_reseed, alpha_reseed)
 
     def test_to_raise_error_with_total_output_length_for_xdrbg_generate(self):
-        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
             seed_instantiate = os.urandom(48)
             alpha_instantiate = os.urandom(random.randint(0, 84))
             xdrbg_state = xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate)
@@ -85,6 +93,186 @@ class TestXdrbg(unittest.TestCase):
             with self.assertRaises(ValueError):
                 xdrbg_obj.xdrbg_generate(xdrbg_state, 345, alpha_generate)  # Intentionally incorrect length
 
+    def test_to_raise_error_with_the_alpha_length_for_xdrbg(self):
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
+            alpha = os.urandom(85)  # Intentionally incorrect length
+            with self.assertRaises(ValueError):
+                xdrbg_obj.xdrbg_instantiate(os.urandom(48), alpha)
+            xdrbg_state = xdrbg_obj.xdrbg_instantiate(os.urandom(48))
+            with self.assertRaises(ValueError):
+                xdrbg_obj.xdrbg_reseed(xdrbg_state, os.urandom(32), alpha)
+            with self.assertRaises(ValueError):
+                xdrbg_obj.xdrbg_generate(xdrbg_state, 16, alpha)
+
+    def test_for_shake_based_xdrbg_being_independent_of_the_previous_calls(self):
+        for xof in [shake_128, shake_256]:
+            seed_instantiate = os.urandom(48)
+            alpha_instantiate = os.urandom(random.randint(0, 84))
+            initial_state_of_xdrbg = ShakeBasedXdrbg(xof()).xdrbg_instantiate(seed_instantiate, alpha_instantiate)
+
+            xdrbg_obj = ShakeBasedXdrbg(xof())
+            xdrbg_obj.xdrbg_instantiate(os.urandom(48))
+            self.assertEqual(initial_state_of_xdrbg, xdrbg_obj.xdrbg_instantiate(seed_instantiate, alpha_instantiate))
+            self.assertEqual(xof(encode_function(seed_instantiate, alpha_instantiate, 0)).digest(xdrbg_obj.XDRBG_STATE_SIZE),
+                             initial_state_of_xdrbg)
+
+    def test_for_batch_calls_being_equal_to_single_calls(self):
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
+            list_of_seeds = [os.urandom(48) for _ in range(8)]
+            alpha = os.urandom(random.randint(0, 84))
+            list_of_xdrbg_states = xdrbg_obj.xdrbg_instantiate_many(list_of_seeds, alpha)
+            self.assertEqual([xdrbg_obj.xdrbg_instantiate(seed, alpha) for seed in list_of_seeds], list_of_xdrbg_states)
+            self.assertEqual([xdrbg_obj.xdrbg_reseed(xdrbg_state, seed, alpha)
+                              for xdrbg_state, seed in zip(list_of_xdrbg_states, list_of_seeds)],
+                             xdrbg_obj.xdrbg_reseed_many(list_of_xdrbg_states, list_of_seeds, alpha))
+            new_xdrbg_states, random_outputs = xdrbg_obj.xdrbg_generate_many(list_of_xdrbg_states, 16, alpha)
+            self.assertEqual([xdrbg_obj.xdrbg_generate(xdrbg_state, 16, alpha) for xdrbg_state in list_of_xdrbg_states],
+                             list(zip(new_xdrbg_states, random_outputs)))
+
+    def test_for_batch_calls_with_fixed_width_records(self):
+        for xdrbg_obj in [shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+            list_of_seeds = [os.urandom(48) for _ in range(8)]
+            seeds = numpy.frombuffer(b"".join(list_of_seeds), dtype=numpy.uint8).reshape(8, 48)
+            xdrbg_states = xdrbg_obj.xdrbg_instantiate_many(seeds)
+            self.assertEqual((8, xdrbg_obj.XDRBG_STATE_SIZE), xdrbg_states.shape)
+            self.assertEqual(xdrbg_obj.xdrbg_instantiate_many(list_of_seeds), [record.tobytes() for record in xdrbg_states])
+            reseeded_xdrbg_states = xdrbg_obj.xdrbg_reseed_many(xdrbg_states, seeds)
+            self.assertEqual(xdrbg_obj.xdrbg_reseed_many([record.tobytes() for record in xdrbg_states], list_of_seeds),
+                             [record.tobytes() for record in reseeded_xdrbg_states])
+            new_xdrbg_states, random_outputs = xdrbg_obj.xdrbg_generate_many(reseeded_xdrbg_states, 16)
+            self.assertEqual((8, 16), random_outputs.shape)
+            self.assertEqual(xdrbg_obj.xdrbg_generate(reseeded_xdrbg_states[3].tobytes(), 16),
+                             (new_xdrbg_states[3].tobytes(), random_outputs[3].tobytes()))
+            with self.assertRaises(ValueError):
+                xdrbg_obj.xdrbg_generate_many(reseeded_xdrbg_states, 345)  # Intentionally incorrect length
+
+    def test_for_batch_reseeding_of_a_single_state_or_of_mismatched_states(self):
+        for xdrbg_obj in [shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+            list_of_seeds = [os.urandom(48) for _ in range(4)]
+            xdrbg_state = xdrbg_obj.xdrbg_instantiate(os.urandom(48))
+            expected_xdrbg_states = [xdrbg_obj.xdrbg_reseed(xdrbg_state, seed) for seed in list_of_seeds]
+            for single_xdrbg_state in [xdrbg_state, bytearray(xdrbg_state), memoryview(xdrbg_state)]:
+                self.assertEqual(expected_xdrbg_states, xdrbg_obj.xdrbg_reseed_many(single_xdrbg_state, list_of_seeds))
+            with self.assertRaises(ValueError):
+                xdrbg_obj.xdrbg_reseed_many([xdrbg_state] * 3, list_of_seeds)  # Intentionally one state too few
+            with self.assertRaises(ValueError):
+                xdrbg_obj.xdrbg_reseed_many([xdrbg_state], [])  # Intentionally one state too many
+
+    def test_for_encode_function_being_equal_to_the_concatenation(self):
+        seed = os.urandom(32)
+        second_part_of_seed = os.urandom(24)
+        for value_N in [0, 1, 2, 3]:
+            for length_of_alpha in [0, 1, 84, 85]:
+                alpha = os.urandom(length_of_alpha)
+                computed_param = value_N * 85 + length_of_alpha
+                self.assertEqual(seed + second_part_of_seed + alpha
+                                 + computed_param.to_bytes((computed_param.bit_length() + 7) // 8, "big"),
+                                 encode_function(seed, alpha, value_N, second_part_of_seed))
+
+    def test_for_domain_separation_byte_of_turbo_shake_based_xdrbg(self):
+        seed_instantiate = os.urandom(48)
+        initial_state_of_xdrbg = turbo_shake_128_xdrbg_obj.xdrbg_instantiate(seed_instantiate)
+        self.assertEqual(TurboSHAKE128.new(data=encode_function(seed_instantiate, b"", 0), domain=0x1F).read(32),
+                         initial_state_of_xdrbg)
+        self.assertNotEqual(TurboShakeBasedXdrbg("turboshake_128", 0x0B).xdrbg_instantiate(seed_instantiate),
+                            initial_state_of_xdrbg)
+        for domain_separation_byte in [0x00, 0x80]:  # Intentionally incorrect domain separation bytes
+            with self.assertRaises(ValueError):
+                TurboShakeBasedXdrbg("turboshake_128", domain_separation_byte)
+
+    def test_for_number_of_keys_per_xdrbg_generate_in_the_key_buffer(self):
+        for xdrbg_obj, xof_name, length_of_key, number_of_keys in [
+                (shake_128_xdrbg_obj, "shake_128", 16, 17), (shake_256_xdrbg_obj, "shake_256", 32, 8),
+                (ascon_xdrbg_obj, "Ascon-Xof", 16, 14)]:
+            self.assertEqual(number_of_keys, XdrbgKeyBuffer(
+                xdrbg_obj, xof_name, length_of_key, None).number_of_keys_per_xdrbg_generate)
+
+    def test_for_keys_from_the_key_buffer_being_slices_of_one_xdrbg_generate_output(self):
+        number_of_generate_calls = []
+
+        def counting_xdrbg_generate_keys(*args):
+            number_of_generate_calls.append(1)
+            return xdrbg_generate_keys(*args)
+
+        xdrbg_key_buffer = XdrbgKeyBuffer(shake_128_xdrbg_obj, "shake_128", 16, None,
+                                          generate_keys=counting_xdrbg_generate_keys)
+        xdrbg_state = shake_128_xdrbg_obj.xdrbg_instantiate(os.urandom(24))
+        seed_reseed = os.urandom(24)
+        expected_xdrbg_state, expected_output = shake_128_xdrbg_obj.xdrbg_generate(
+            shake_128_xdrbg_obj.xdrbg_reseed(xdrbg_state, seed_reseed), 17 * 16)
+
+        current_xdrbg_state = xdrbg_state
+        for i in range(17):
+            current_xdrbg_state, key = xdrbg_key_buffer.key_chain_update(
+                seed_reseed if i == 0 else os.urandom(24), current_xdrbg_state)
+            self.assertEqual(expected_output[16 * i: 16 * (i + 1)], key)
+            self.assertEqual(expected_xdrbg_state, current_xdrbg_state)
+        self.assertEqual(1, len(number_of_generate_calls))
+
+        # The buffer is empty now, so the next key requires a new reseed and generate
+        next_xdrbg_state, _ = xdrbg_key_buffer.key_chain_update(os.urandom(24), current_xdrbg_state)
+        self.assertEqual(2, len(number_of_generate_calls))
+        self.assertNotEqual(expected_xdrbg_state, next_xdrbg_state)
+
+    def test_for_wiping_the_consumed_keys_in_the_key_buffer(self):
+        xdrbg_key_buffer = XdrbgKeyBuffer(ascon_xdrbg_obj, "Ascon-Xof", 16, None, wipe_consumed_keys=True)
+        xdrbg_state = ascon_xdrbg_obj.xdrbg_instantiate(os.urandom(24))
+        for i in range(3):
+            xdrbg_state, key = xdrbg_key_buffer.key_chain_update(os.urandom(24), xdrbg_state)
+            buffer_of_keys = xdrbg_key_buffer._XdrbgKeyBuffer__buffer_of_keys
+            self.assertEqual(bytes(16 * (i + 1)), bytes(buffer_of_keys[:16 * (i + 1)]))
+            self.assertNotEqual(bytes(16), key)
+            self.assertNotEqual(bytes(16), bytes(buffer_of_keys[16 * (i + 1): 16 * (i + 2)]))
+
+    def test_for_key_buffer_being_tied_to_the_state_of_the_key_chain(self):
+        for key_chain in [ShakeXdrbgKeychain(shake_128(), buffer_keys_from_xdrbg_generate=True),
+                          AsconXdrbgKeychain(ascon_hash, buffer_keys_from_xdrbg_generate=True)]:
+            input_parameter = os.urandom(24)
+            state_of_key_chain_a = key_chain.key_chain_instantiate(os.urandom(24))
+            state_of_key_chain_b = key_chain.key_chain_instantiate(os.urandom(24))
+            new_state_of_key_chain_a, key_of_key_chain_a = key_chain.key_chain_update(input_parameter, state_of_key_chain_a)
+            new_state_of_key_chain_b, key_of_key_chain_b = key_chain.key_chain_update(input_parameter, state_of_key_chain_b)
+            self.assertNotEqual(state_of_key_chain_b, new_state_of_key_chain_b)
+            self.assertNotEqual(new_state_of_key_chain_a, new_state_of_key_chain_b)
+            self.assertNotEqual(key_of_key_chain_a, key_of_key_chain_b)
+
+            # Restarting from an earlier state derives the same key again instead of the next buffered key
+            self.assertEqual((new_state_of_key_chain_a, key_of_key_chain_a),
+                             key_chain.key_chain_update(input_parameter, state_of_key_chain_a))
+            self.assertEqual((new_state_of_key_chain_b, key_of_key_chain_b),
+                             key_chain.key_chain_update(input_parameter, state_of_key_chain_b))
+
+
+    def test_for_absorbing_the_input_as_alpha_being_equal_to_xdrbg_generate(self):
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, turbo_shake_128_xdrbg_obj, turbo_shake_256_xdrbg_obj, ascon_xdrbg_obj, ascon_xofa_xdrbg_obj]:
+            xdrbg_state = xdrbg_obj.xdrbg_instantiate(os.urandom(64))
+            for length_of_input_parameter in [xdrbg_obj.minimum_seed_length_for_xdrbg_reseed, 48, 84]:
+                input_parameter = os.urandom(length_of_input_parameter)
+                expected_output = xdrbg_obj.xdrbg_generate(xdrbg_state, 16, input_parameter)
+                self.assertEqual(expected_output, xdrbg_generate_keys_with_input_as_alpha(
+                    input_parameter, xdrbg_state, xdrbg_obj, xdrbg_obj.xof_name, 16, None))
+
+                # The input absorbed as alpha does not give the key of RESEED and GENERATE
+                self.assertNotEqual(expected_output, xdrbg_generate_keys(
+                    input_parameter, xdrbg_state, xdrbg_obj, xdrbg_obj.xof_name, 16, None))
+
+    def test_for_absorbing_the_input_as_alpha_raising_on_invalid_lengths(self):
+        for key_chain in [ShakeXdrbgKeychain(shake_128(), absorb_input_as_alpha=True),
+                          ShakeXdrbgKeychain(shake_256(), absorb_input_as_alpha=True),
+                          AsconXdrbgKeychain(ascon_hash, absorb_input_as_alpha=True)]:
+            xdrbg_state = key_chain.key_chain_instantiate(os.urandom(64))
+            key_chain.key_chain_update(os.urandom(84), xdrbg_state)
+            with self.assertRaises(ValueError):
+                key_chain.key_chain_update(os.urandom(85), xdrbg_state)
+            with self.assertRaises(ValueError):
+                key_chain.key_chain_update(os.urandom(15), xdrbg_state)
+
+        for xdrbg_obj in [shake_128_xdrbg_obj, shake_256_xdrbg_obj, ascon_xdrbg_obj]:
+            xdrbg_state = xdrbg_obj.xdrbg_instantiate(os.urandom(64))
+            for length_of_input_parameter in [xdrbg_obj.minimum_seed_length_for_xdrbg_reseed - 1, 85]:
+                with self.assertRaises(ValueError):
+                    xdrbg_generate_keys_with_input_as_alpha(
+                        os.urandom(length_of_input_parameter), xdrbg_state, xdrbg_obj, xdrbg_obj.xof_name, 16, None)
 
 if __name__ == "__main__":
     unittest.main()
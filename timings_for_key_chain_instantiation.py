@@ -1,16 +1,16 @@
-from hashlib import sha256, sha512, sha3_256, sha3_512, shake_128, shake_256
+from hashlib import sha256, sha512, sha3_256, sha3_512, shake_128, shake_256, blake2s, blake2b
 from typing import Union
 from timeit import timeit
-from ascon._ascon import ascon_hash as ascon_xof
+from cryptographicprimitives.ascon_operations import ascon_xof
 from keychains.prg_keychain import PrgKeyChain
-from keychains.xdrbg_keychain import ShakeXdrbgKeychain, AsconXdrbgKeychain
+from keychains.xdrbg_keychain import ShakeXdrbgKeychain, TurboShakeXdrbgKeychain, AsconXdrbgKeychain
 from keychains.hkdf_keychain import HkdfKeyChain
 from keychains.utils import generate_random_input_parameter_for_prg, generate_random_input_parameter_for_hkdf, generate_random_input_parameter_for_xdrbg
 
 NUMBER_OF_ITERATIONS: int = 100
 
 
-def calculate_average_execution_times_for_key_chain_instantiation(key_chain_obj: Union[PrgKeyChain, ShakeXdrbgKeychain, AsconXdrbgKeychain, HkdfKeyChain],
+def calculate_average_execution_times_for_key_chain_instantiation(key_chain_obj: Union[PrgKeyChain, ShakeXdrbgKeychain, TurboShakeXdrbgKeychain, AsconXdrbgKeychain, HkdfKeyChain],
                                                                   initial_input_parameter: bytes) -> float:
 
     def wrapped_instantiate_call():
@@ -22,20 +22,21 @@ def calculate_average_execution_times_for_key_chain_instantiation(key_chain_obj:
     return average_execution_time_for_instantiation
 
 
-def get_average_execution_time_for_prg_key_chain(security_parameter_lambda: int):
-    prg_key_chain = PrgKeyChain(security_parameter_lambda)
+def get_average_execution_time_for_prg_key_chain(security_parameter_lambda: int, prg_stream_cipher: str = "aes"):
+    prg_key_chain = PrgKeyChain(
+        security_parameter_lambda, prg_stream_cipher=prg_stream_cipher)
     seed_for_prg_refreshing: bytes = generate_random_input_parameter_for_prg(
         security_parameter_lambda)
     average_execution_time: float = calculate_average_execution_times_for_key_chain_instantiation(
         prg_key_chain, seed_for_prg_refreshing)
     print(f"\t \033[1;32m Average time for key chain instantiation for security parameter λ = {
-          security_parameter_lambda}: {average_execution_time:.6f} seconds\033[0m")
+          security_parameter_lambda} using {prg_stream_cipher}: {average_execution_time:.6f} seconds\033[0m")
 
 
 def get_average_execution_time_for_xdrbg_key_chain(xof, xof_name: Union[str, None] = None):
     xdrbg_key_chain: Union[AsconXdrbgKeychain, ShakeXdrbgKeychain]
     if xof_name is not None:
-        xdrbg_key_chain = AsconXdrbgKeychain(xof)
+        xdrbg_key_chain = AsconXdrbgKeychain(xof, ascon_xof_name=xof_name)
     else:
         xdrbg_key_chain = ShakeXdrbgKeychain(xof)
         xof_name = xof.name
@@ -47,6 +48,16 @@ def get_average_execution_time_for_xdrbg_key_chain(xof, xof_name: Union[str, Non
           xof_name}: {average_execution_time:.6f} seconds\033[0m")
 
 
+def get_average_execution_time_for_turbo_shake_xdrbg_key_chain(turbo_shake_name: str):
+    turbo_shake_xdrbg_key_chain = TurboShakeXdrbgKeychain(turbo_shake_name)
+    seed_for_xdrbg_instantiate: bytes = generate_random_input_parameter_for_xdrbg(
+        turbo_shake_name)
+    average_execution_time: float = calculate_average_execution_times_for_key_chain_instantiation(
+        turbo_shake_xdrbg_key_chain, seed_for_xdrbg_instantiate)
+    print(f"\t \033[1;32m Average time for key chain instantiation using {
+          turbo_shake_name}: {average_execution_time:.6f} seconds\033[0m")
+
+
 def get_average_execution_time_for_hkdf_key_chain(hash_func):
     hkdf_key_chain = HkdfKeyChain(hash_func)
     initial_source_key_material: bytes = generate_random_input_parameter_for_hkdf(
@@ -65,18 +76,24 @@ def main() -> None:
     get_average_execution_time_for_hkdf_key_chain(sha3_256)
     get_average_execution_time_for_hkdf_key_chain(sha512)
     get_average_execution_time_for_hkdf_key_chain(sha3_512)
+    get_average_execution_time_for_hkdf_key_chain(blake2s)
+    get_average_execution_time_for_hkdf_key_chain(blake2b)
 
     # Benchmark for XDRBG Key Chain Instantiation
     print("\033[1;33m For XDRBG KeyChain:\033[0m")
     get_average_execution_time_for_xdrbg_key_chain(shake_128())
     get_average_execution_time_for_xdrbg_key_chain(shake_256())
+    get_average_execution_time_for_turbo_shake_xdrbg_key_chain("turboshake_128")
+    get_average_execution_time_for_turbo_shake_xdrbg_key_chain("turboshake_256")
     get_average_execution_time_for_xdrbg_key_chain(ascon_xof, "Ascon-Xof")
+    get_average_execution_time_for_xdrbg_key_chain(ascon_xof, "Ascon-Xofa")
 
     # Benchmark for PRG Key Chain Instantiation
     print("\033[1;33m For PRG KeyChain:\033[0m")
     get_average_execution_time_for_prg_key_chain(16)
     get_average_execution_time_for_prg_key_chain(24)
     get_average_execution_time_for_prg_key_chain(32)
+    get_average_execution_time_for_prg_key_chain(32, "chacha20")
 
 
 if __name__ == "__main__":